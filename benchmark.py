@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark against the local mock OpenAI server.
+
+Starts resume_gen.mock_openai in-process, points the generator at it and
+measures, in a throwaway working folder:
+
+    generator  ResumeAndCoverLetterGenerator.process_job_application, called directly
+    upload     POST /upload_resume with a freshly generated resume PDF (needs PyMuPDF)
+    web        POST /generate_documents, polling /jobs/<id> until the job finishes
+
+Each scenario reports p50/p95/p99 latency, requests per second, and LLM calls
+and prompt tokens (total and served from the mock's prompt cache) per
+generation. --combined generates each resume and cover letter in one call
+(COMBINED_GENERATION). Results are saved to benchmarks/ and compared with the previous run
+there; the script exits with 1 when a scenario regressed by more than --threshold.
+
+Usage:
+    python benchmark.py [--iterations 20] [--concurrency 4] [--latency 0.05] [--scenarios generator,web]
+"""
+
+import os
+import sys
+import json
+import glob
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+RESULTS_FOLDER = os.path.join(PROJECT_ROOT, "benchmarks")
+SCENARIOS = ["generator", "upload", "web"]
+
+BENCH_PROFILE = ("Bench", "User")
+BENCH_RESUME = """Bench User
+bench.user@example.com
+
+Experience
+Senior Software Engineer, Example Systems (2018 - present)
+- Built and operated Python web services handling 5,000 requests per second
+- Led the move from cron scripts to a queue-based pipeline
+- Mentored four engineers
+
+Skills
+Python, Flask, SQL, Docker, AWS, REST APIs
+"""
+
+JOB_TEMPLATE = """Company: Benchmark Industries {n}
+
+We are hiring a Senior Python Engineer (posting {n}) to build internal web services.
+You will design APIs, own data pipelines and mentor other engineers.
+
+Requirements:
+- 5+ years of Python
+- Experience with Flask or Django, SQL and Docker
+- Clear written communication
+"""
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of a list of numbers"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(latencies, wall_seconds, mock_stats, failures):
+    """Latency percentiles (ms), throughput, and LLM calls and prompt tokens per generation for one scenario"""
+    count = len(latencies)
+
+    def per_generation(value):
+        return round(value / count, 2) if count else None
+
+    return {
+        "iterations": count,
+        "failures": failures,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1) if count else None,
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1) if count else None,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1) if count else None,
+        "requests_per_second": round(count / wall_seconds, 2) if wall_seconds > 0 else None,
+        "llm_calls_per_generation": per_generation(mock_stats["requests"]),
+        "prompt_tokens_per_generation": per_generation(mock_stats["prompt_tokens"]),
+        "cached_prompt_tokens_per_generation": per_generation(mock_stats["cached_prompt_tokens"])
+    }
+
+
+def run_concurrently(func, iterations, concurrency):
+    """Call func(i) for every iteration on a thread pool, returning (latencies, failures, wall seconds)"""
+    latencies = []
+    failures = 0
+
+    def timed(i):
+        start = time.perf_counter()
+        ok = func(i)
+        return time.perf_counter() - start, ok
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for seconds, ok in executor.map(timed, range(iterations)):
+            if ok:
+                latencies.append(seconds)
+            else:
+                failures += 1
+    return latencies, failures, time.perf_counter() - start
+
+
+def bench_generator(args, mock):
+    from resume_gen.generator import ResumeAndCoverLetterGenerator
+    from resume_gen.profiles import UserProfile
+
+    profile = UserProfile.load("_".join(BENCH_PROFILE))
+
+    def generate(i):
+        generator = ResumeAndCoverLetterGenerator()
+        generator.set_user_profile(profile)
+        generator.job_description = JOB_TEMPLATE.format(n=i)
+        result = generator.process_job_application()
+        return "error" not in result and not any(item.get("errors") for item in result["results"])
+
+    mock.reset_stats()
+    latencies, failures, wall = run_concurrently(generate, args.iterations, args.concurrency)
+    return summarize(latencies, wall, mock.stats(), failures)
+
+
+def make_resume_pdf(n):
+    """Return the bytes of a one-page resume PDF, unique per n so the text cache misses"""
+    import fitz
+
+    document = fitz.open()
+    page = document.new_page()
+    page.insert_text((72, 72), BENCH_RESUME + f"\nReference {n}", fontsize=11)
+    data = document.tobytes()
+    document.close()
+    return data
+
+
+def bench_upload(args, mock):
+    import io
+    from resume_gen.web import app
+
+    try:
+        pdfs = [make_resume_pdf(i) for i in range(args.iterations)]
+    except ImportError:
+        print("⚠️  upload: skipped (PyMuPDF is not installed)")
+        return None
+
+    def upload(i):
+        client = app.test_client()
+        response = client.post(
+            "/upload_resume",
+            data={"resume_files": (io.BytesIO(pdfs[i]), f"resume_{i}.pdf"), "clear_existing": "yes"},
+            headers={"Accept": "application/json"},
+            content_type="multipart/form-data"
+        )
+        return response.status_code == 200 and bool(response.get_json().get("uploaded"))
+
+    mock.reset_stats()
+    latencies, failures, wall = run_concurrently(upload, args.iterations, args.concurrency)
+    return summarize(latencies, wall, mock.stats(), failures)
+
+
+def bench_web(args, mock):
+    from resume_gen.web import app, job_queue
+
+    def generate(i):
+        client = app.test_client()
+        client.get(f"/select_profile/{'_'.join(BENCH_PROFILE)}")
+        response = client.post(
+            "/generate_documents",
+            data={"job_description": JOB_TEMPLATE.format(n=f"web-{i}")},
+            headers={"Accept": "application/json"}
+        )
+        if response.status_code != 202:
+            return False
+        job_id = response.get_json()["job_id"]
+        deadline = time.monotonic() + args.timeout
+        while time.monotonic() < deadline:
+            job = job_queue.get(job_id)
+            if job["status"] in ("done", "failed"):
+                return job["status"] == "done"
+            time.sleep(0.01)
+        return False
+
+    mock.reset_stats()
+    latencies, failures, wall = run_concurrently(generate, args.iterations, args.concurrency)
+    return summarize(latencies, wall, mock.stats(), failures)
+
+
+def git_revision():
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True, timeout=10)
+        return result.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def previous_result(settings):
+    """Return the most recent saved run with the same settings, or None"""
+    for path in sorted(glob.glob(os.path.join(RESULTS_FOLDER, "bench_*.json")), reverse=True):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if data.get("settings") == settings:
+            data["path"] = path
+            return data
+    return None
+
+
+def compare(current, baseline, threshold):
+    """Print the change against baseline per scenario; return True if nothing regressed"""
+    ok = True
+    for name, result in current["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if not result or not before:
+            continue
+        for metric in ("p95_ms", "requests_per_second", "llm_calls_per_generation", "prompt_tokens_per_generation"):
+            old, new = before.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if metric in ("p95_ms", "prompt_tokens_per_generation"):
+                regressed = change > threshold
+            elif metric == "requests_per_second":
+                regressed = change < -threshold
+            else:
+                regressed = new > old  # every extra call costs tokens
+            marker = "❌" if regressed else "✅"
+            print(f"{marker} {name} {metric}: {old} -> {new} ({change:+.0%})")
+            ok = ok and not regressed
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark generation against a local mock OpenAI server")
+    parser.add_argument("--iterations", type=int, default=20, help="generations (or uploads) per scenario")
+    parser.add_argument("--concurrency", type=int, default=4, help="scenario iterations run in parallel")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"comma-separated subset of {', '.join(SCENARIOS)}")
+    parser.add_argument("--latency", type=float, default=0.05, help="mock API seconds per response")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0, help="mock API token rate (0 = instant)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of mock API requests that fail")
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds to wait for one queued web job")
+    parser.add_argument("--combined", action="store_true", help="generate each resume and cover letter in one call")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown before a run counts as a regression")
+    parser.add_argument("--no-save", action="store_true", help="don't store the results in benchmarks/")
+    args = parser.parse_args(argv)
+
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    print("=" * 60)
+    print("Resume and Cover Letter Generator - Benchmark")
+    print("=" * 60)
+
+    # Run in a scratch folder with the response cache off, so every run does the same work
+    work_dir = tempfile.mkdtemp(prefix="resume_gen_bench_")
+    os.chdir(work_dir)
+    sys.path.insert(0, PROJECT_ROOT)
+
+    from resume_gen.mock_openai import MockOpenAIServer
+
+    mock = MockOpenAIServer(latency=args.latency, tokens_per_second=args.tokens_per_second,
+                            error_rate=args.error_rate, seed=1).start()
+    os.environ.update({
+        "OPENAI_BASE_URL": mock.base_url,
+        "OPENAI_API_KEY": "mock-key",
+        "OPENAI_MODEL": "mock-model",
+        "OPENAI_BACKOFF_BASE": "0.05",
+        "LLM_CACHE_ENABLED": "false",
+        "COMBINED_GENERATION": "true" if args.combined else "false",
+        "LOG_LEVEL": "WARNING",
+        "AI_LOG_LEVEL": "WARNING"
+    })
+
+    try:
+        from resume_gen.profiles import UserProfile
+
+        profile = UserProfile(*BENCH_PROFILE)
+        profile.resume_text = BENCH_RESUME
+        profile.save()
+
+        runners = {"generator": bench_generator, "upload": bench_upload, "web": bench_web}
+        results = {}
+        for name in scenarios:
+            print(f"\nRunning {name} ({args.iterations} iterations, concurrency {args.concurrency})...")
+            result = runners[name](args, mock)
+            results[name] = result
+            if result:
+                print(f"  p50 {result['p50_ms']} ms | p95 {result['p95_ms']} ms | p99 {result['p99_ms']} ms | "
+                      f"{result['requests_per_second']} req/s | {result['llm_calls_per_generation']} LLM calls/generation | "
+                      f"{result['prompt_tokens_per_generation']} prompt tokens/generation "
+                      f"({result['cached_prompt_tokens_per_generation']} cached)"
+                      f"{' | ' + str(result['failures']) + ' failed' if result['failures'] else ''}")
+    finally:
+        mock.stop()
+        os.chdir(PROJECT_ROOT)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    settings = {key: getattr(args, key) for key in ("iterations", "concurrency", "latency", "tokens_per_second", "error_rate")}
+    if args.combined:
+        # Only compared with other combined runs (older results have no such setting)
+        settings["combined"] = True
+    run = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": sys.version.split()[0],
+        "settings": settings,
+        "scenarios": results
+    }
+
+    ok = all(result is None or result["failures"] == 0 or args.error_rate > 0 for result in results.values())
+    baseline = previous_result(settings)
+    if baseline:
+        print(f"\nCompared with {os.path.basename(baseline['path'])} ({baseline.get('revision') or 'unknown revision'}):")
+        ok = compare(run, baseline, args.threshold) and ok
+
+    if not args.no_save:
+        os.makedirs(RESULTS_FOLDER, exist_ok=True)
+        path = os.path.join(RESULTS_FOLDER, f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(run, f, indent=2)
+        print(f"\nResults saved to {os.path.relpath(path, PROJECT_ROOT)}")
+
+    print("\nSummary:")
+    print("✅ No regressions." if ok else "❌ Failures or regressions found.")
+    print("=" * 60)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Import-time budget check for the generation core.
+
+Imports each core module in a fresh interpreter and checks that it loads within
+the time budget and without pulling in heavy optional dependencies (PyMuPDF,
+OpenAI, Flask), which should only be imported on first use.
+
+Usage:
+    python check_import_time.py [--budget-ms 200] [--runs 3]
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+# Modules the CLI and batch workers load at startup
+CORE_MODULES = [
+    "resume_gen.config",
+    "resume_gen.profiles",
+    "resume_gen.ingestion",
+    "resume_gen.generator",
+    "resume_gen.batch",
+    "resume_gen.cli",
+]
+
+# Dependencies that must not be imported just by importing the core
+HEAVY_MODULES = ["fitz", "openai", "flask", "numpy", "tiktoken"]
+
+MEASURE_SNIPPET = """
+import sys, json, time, importlib
+start = time.perf_counter()
+importlib.import_module({module!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+def measure_import(module):
+    """Import a module in a fresh interpreter, returning (milliseconds, heavy modules loaded)"""
+    project_root = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_SNIPPET.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=project_root, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed")
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    return data["ms"], data["heavy"]
+
+def check_module(module, budget_ms, runs):
+    """Check one module against the budget, using the fastest of several runs"""
+    try:
+        timings = []
+        heavy = []
+        for _ in range(runs):
+            ms, heavy = measure_import(module)
+            timings.append(ms)
+    except Exception as e:
+        print(f"❌ {module}: could not be imported ({e})")
+        return False
+
+    best = min(timings)
+    ok = True
+    if heavy:
+        print(f"❌ {module} imports heavy dependencies at import time: {', '.join(heavy)}")
+        ok = False
+    if best > budget_ms:
+        print(f"❌ {module} took {best:.1f} ms to import (budget {budget_ms:.0f} ms)")
+        ok = False
+    if ok:
+        print(f"✅ {module}: {best:.1f} ms")
+    return ok
+
+def main(argv=None):
+    """Run the import-time checks"""
+    parser = argparse.ArgumentParser(description="Check the import time of the generation core")
+    parser.add_argument("--budget-ms", type=float, default=float(os.environ.get("IMPORT_BUDGET_MS", "200")),
+                        help="maximum import time per module in milliseconds")
+    parser.add_argument("--runs", type=int, default=3, help="imports per module (the fastest counts)")
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print("Resume and Cover Letter Generator - Import Time Check")
+    print("=" * 60)
+
+    results = [check_module(module, args.budget_ms, max(1, args.runs)) for module in CORE_MODULES]
+
+    print("\nSummary:")
+    if all(results):
+        print("✅ All core modules import within budget.")
+    else:
+        print("❌ Some core modules are over budget or import heavy dependencies eagerly.")
+    print("=" * 60)
+    return 0 if all(results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
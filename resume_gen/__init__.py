@@ -0,0 +1,5 @@
+"""
+Resume and cover letter generation core, usable without the web app.
+
+See resume_gen.cli for the command line interface (python -m resume_gen).
+"""
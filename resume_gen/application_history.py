@@ -0,0 +1,213 @@
+"""
+SQLite record of every generated application, with full-text search.
+
+Each run of the generation pipeline is stored with its company, job description
+hash, profile, model, token usage, latency and output files. An FTS5 index over
+the job description and generated text makes past applications searchable
+without grepping the generated/ folders.
+"""
+
+import os
+import re
+import html
+import json
+import time
+import logging
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+_TAG_RE = re.compile(r"<(script|style)\b.*?</\1>|<[^>]+>", re.IGNORECASE | re.DOTALL)
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def html_to_text(markup):
+    """Strip tags from generated HTML so only the document text is indexed"""
+    return re.sub(r"\s+", " ", _TAG_RE.sub(" ", markup or "")).strip()
+
+
+def _fts_query(query):
+    """Turn free text into an FTS5 query of quoted terms (all must match)"""
+    return " ".join(f'"{word}"' for word in _WORD_RE.findall(query or ""))
+
+
+def _highlight(snippet):
+    """HTML-escape an FTS snippet and turn its match markers into <mark> tags"""
+    if not snippet:
+        return ""
+    return html.escape(snippet).replace("\x02", "<mark>").replace("\x03", "</mark>")
+
+
+class ApplicationHistory:
+    """Application records in SQLite with an FTS5 index over their text"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.fts_enabled = True
+        self._ready = False
+        self._init_lock = threading.Lock()
+
+    def _open(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _connect(self):
+        """Open a connection, creating the database on first use"""
+        if not self._ready:
+            with self._init_lock:
+                if not self._ready:
+                    self._init_db()
+                    self._ready = True
+        return self._open()
+
+    def _init_db(self):
+        db_folder = os.path.dirname(self.db_path)
+        if db_folder:
+            os.makedirs(db_folder, exist_ok=True)
+        with self._open() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS applications (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    created_at REAL NOT NULL,
+                    status TEXT NOT NULL,
+                    company TEXT,
+                    job_description_hash TEXT,
+                    profile_folder TEXT,
+                    model TEXT,
+                    prompt_tokens INTEGER DEFAULT 0,
+                    completion_tokens INTEGER DEFAULT 0,
+                    llm_calls INTEGER DEFAULT 0,
+                    cache_hits INTEGER DEFAULT 0,
+                    latency_seconds REAL,
+                    folder TEXT,
+                    output_paths TEXT,
+                    error TEXT,
+                    job_description TEXT,
+                    content TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_created ON applications (created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_jd ON applications (job_description_hash)")
+
+            # External-content FTS table: the text lives once, in applications
+            try:
+                conn.execute("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS applications_fts USING fts5(
+                        company, job_description, content,
+                        content='applications', content_rowid='id'
+                    )
+                """)
+            except sqlite3.OperationalError as e:
+                self.fts_enabled = False
+                logger.warning(f"SQLite FTS5 unavailable, history search will use LIKE: {e}")
+
+    def record(self, company=None, job_description="", job_description_hash=None, profile_folder=None,
+               model=None, usage=None, latency_seconds=None, folder=None, output_paths=None,
+               content="", status="done", error=None):
+        """Store one application run and return its ID"""
+        usage = usage or {}
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO applications (
+                    created_at, status, company, job_description_hash, profile_folder, model,
+                    prompt_tokens, completion_tokens, llm_calls, cache_hits, latency_seconds,
+                    folder, output_paths, error, job_description, content
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (time.time(), status, company, job_description_hash, profile_folder, model,
+                 usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0),
+                 usage.get("llm_calls", 0), usage.get("cache_hits", 0), latency_seconds,
+                 folder, json.dumps(output_paths or []), error, job_description, content)
+            )
+            application_id = cursor.lastrowid
+            if self.fts_enabled:
+                conn.execute(
+                    "INSERT INTO applications_fts (rowid, company, job_description, content) VALUES (?, ?, ?, ?)",
+                    (application_id, company or "", job_description or "", content or "")
+                )
+        logger.info(f"Recorded application {application_id} for {company}")
+        return application_id
+
+    def get(self, application_id):
+        """Return one application (including its text) as a dict, or None"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM applications WHERE id = ?", (application_id,)).fetchone()
+        return self._row_to_dict(row, include_text=True) if row else None
+
+    def recent(self, limit=20, offset=0):
+        """Return the most recent applications, newest first"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM applications ORDER BY created_at DESC LIMIT ? OFFSET ?", (limit, offset)
+            ).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def count(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM applications").fetchone()[0]
+
+    def search(self, query, limit=20):
+        """Return applications whose company, job description or documents match every query term
+
+        Results are ranked by BM25 and include an HTML snippet with the matches highlighted.
+        """
+        match = _fts_query(query)
+        if not match:
+            return []
+
+        with self._connect() as conn:
+            if self.fts_enabled:
+                rows = conn.execute(
+                    """
+                    SELECT a.*, snippet(applications_fts, -1, char(2), char(3), '...', 16) AS snippet
+                    FROM applications_fts JOIN applications a ON a.id = applications_fts.rowid
+                    WHERE applications_fts MATCH ?
+                    ORDER BY bm25(applications_fts)
+                    LIMIT ?
+                    """,
+                    (match, limit)
+                ).fetchall()
+            else:
+                words = _WORD_RE.findall(query)
+                where = " AND ".join(
+                    "(company LIKE ? OR job_description LIKE ? OR content LIKE ?)" for _ in words
+                )
+                params = [f"%{word}%" for word in words for _ in range(3)]
+                rows = conn.execute(
+                    f"SELECT *, NULL AS snippet FROM applications WHERE {where} ORDER BY created_at DESC LIMIT ?",
+                    params + [limit]
+                ).fetchall()
+
+        results = []
+        for row in rows:
+            application = self._row_to_dict(row)
+            application["snippet"] = _highlight(row["snippet"])
+            results.append(application)
+        return results
+
+    def _row_to_dict(self, row, include_text=False):
+        application = {
+            "id": row["id"],
+            "created_at": row["created_at"],
+            "status": row["status"],
+            "company": row["company"],
+            "job_description_hash": row["job_description_hash"],
+            "profile_folder": row["profile_folder"],
+            "model": row["model"],
+            "prompt_tokens": row["prompt_tokens"],
+            "completion_tokens": row["completion_tokens"],
+            "llm_calls": row["llm_calls"],
+            "cache_hits": row["cache_hits"],
+            "latency_seconds": row["latency_seconds"],
+            "folder": row["folder"],
+            "output_paths": json.loads(row["output_paths"]) if row["output_paths"] else [],
+            "error": row["error"]
+        }
+        if include_text:
+            application["job_description"] = row["job_description"]
+            application["content"] = row["content"]
+        return application
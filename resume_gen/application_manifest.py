@@ -0,0 +1,111 @@
+"""
+Append-only manifest of generated application folders.
+
+Each generation appends a JSON line for its folder (a later line for the same
+folder replaces the earlier one). The index page reads the manifest
+incrementally instead of listing and stat-ing every folder under generated/.
+"""
+
+import os
+import json
+import logging
+import threading
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "manifest.jsonl"
+
+
+class ApplicationManifest:
+    """JSON Lines record of generated applications, newest last"""
+
+    def __init__(self, output_folder):
+        self.output_folder = output_folder
+        self.path = os.path.join(output_folder, MANIFEST_FILENAME)
+        self._lock = threading.Lock()
+        self._entries = {}  # folder name -> entry, in insertion order
+        self._offset = 0
+
+    def _append(self, entry):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def record(self, folder_path, company=None, files=None):
+        """Append (or update) the entry for an application folder"""
+        folder = os.path.basename(os.path.normpath(folder_path))
+        with self._lock:
+            self._refresh()
+            entry = dict(self._entries.get(folder) or {
+                "folder": folder,
+                "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "files": []
+            })
+            if company is not None:
+                entry["company"] = company
+            if files is not None:
+                entry["files"] = sorted(files)
+            self._append(entry)
+
+    def _refresh(self):
+        """Read manifest lines appended since the last refresh"""
+        if not os.path.exists(self.path):
+            self._rebuild()
+            return
+
+        size = os.path.getsize(self.path)
+        if size < self._offset:
+            # The manifest was replaced; read it again from the start
+            self._entries = {}
+            self._offset = 0
+        if size == self._offset:
+            return
+
+        with open(self.path, 'rb') as f:
+            f.seek(self._offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # partially written line
+                self._offset += len(line)
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                # Move updated folders to the end so order follows the latest write
+                self._entries.pop(entry["folder"], None)
+                self._entries[entry["folder"]] = entry
+
+    def _rebuild(self):
+        """One-time scan of the output folder when the manifest is missing"""
+        self._entries = {}
+        self._offset = 0
+        os.makedirs(self.output_folder, exist_ok=True)
+        folders = [f for f in os.listdir(self.output_folder)
+                   if os.path.isdir(os.path.join(self.output_folder, f))]
+        folders.sort(key=lambda f: os.path.getmtime(os.path.join(self.output_folder, f)))
+
+        lines = []
+        for folder in folders:
+            folder_path = os.path.join(self.output_folder, folder)
+            lines.append(json.dumps({
+                "folder": folder,
+                "time": datetime.fromtimestamp(os.path.getmtime(folder_path)).strftime('%Y-%m-%d %H:%M:%S'),
+                "files": sorted(f for f in os.listdir(folder_path) if os.path.isfile(os.path.join(folder_path, f)))
+            }) + "\n")
+
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+        os.replace(tmp_path, self.path)
+        logger.info(f"Rebuilt application manifest with {len(lines)} folder(s)")
+        self._refresh()
+
+    def page(self, page=1, per_page=10):
+        """Return (entries, total) for one page of applications, newest first"""
+        with self._lock:
+            self._refresh()
+            entries = list(self._entries.values())
+        total = len(entries)
+        end = max(total - (page - 1) * per_page, 0)
+        start = max(end - per_page, 0)
+        return list(reversed(entries[start:end])), total
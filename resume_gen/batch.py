@@ -0,0 +1,194 @@
+"""
+Batch mode: generate applications for many job descriptions against one profile.
+
+Job descriptions come from a directory of text files or a JSON Lines file. The
+profile's skills and style reference are resolved once for the whole batch, the
+postings run with bounded concurrency (sharing the process-wide LLM and
+extraction caches) and one results manifest is written for the batch.
+
+Usage:
+    python -m resume_gen batch --profile Jane_Doe --jobs postings/ [--workers 2] [--out results.json]
+"""
+
+import os
+import json
+import time
+import uuid
+import logging
+import argparse
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from .job_description import safe_company_name
+
+logger = logging.getLogger(__name__)
+
+JOB_FILE_EXTENSIONS = ('.txt', '.md', '.pdf')
+
+
+def parse_job_lines(lines, source="jobs.jsonl"):
+    """Parse JSON Lines job descriptions
+
+    Each line is an object with "job_description" (or "text") and optionally
+    "id" and "company". Blank lines are skipped; invalid lines are logged and skipped.
+    """
+    jobs = []
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            logger.warning(f"Skipping invalid JSON on line {line_number} of {source}: {e}")
+            continue
+        if not isinstance(data, dict):
+            logger.warning(f"Skipping line {line_number} of {source}: expected a JSON object")
+            continue
+        text = (data.get("job_description") or data.get("text") or "").strip()
+        if not text:
+            logger.warning(f"Skipping line {line_number} of {source}: no job description")
+            continue
+        jobs.append({
+            "id": str(data.get("id") or f"{os.path.basename(source)}:{line_number}"),
+            "text": text,
+            "company": data.get("company")
+        })
+    return jobs
+
+
+def load_job_descriptions(source):
+    """Load job descriptions from a directory of .txt/.md/.pdf files, a .jsonl file or one text file"""
+    if os.path.isdir(source):
+        jobs = []
+        for filename in sorted(os.listdir(source)):
+            file_path = os.path.join(source, filename)
+            if os.path.isfile(file_path) and filename.lower().endswith(JOB_FILE_EXTENSIONS + ('.jsonl',)):
+                jobs.extend(load_job_descriptions(file_path))
+        return jobs
+
+    if source.lower().endswith('.jsonl'):
+        with open(source, 'r', encoding='utf-8') as f:
+            return parse_job_lines(f, source)
+
+    if source.lower().endswith('.pdf'):
+        from .ingestion import parse_pdf_text
+        text = parse_pdf_text(source)
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            text = f.read()
+    text = text.strip()
+    if not text:
+        logger.warning(f"Skipping empty job description: {source}")
+        return []
+    return [{"id": os.path.splitext(os.path.basename(source))[0], "text": text, "company": None}]
+
+
+def run_batch(jobs, profile, make_generator, manifest_folder, max_workers=2, resume_texts=None):
+    """Generate documents for every job description and write one results manifest
+
+    make_generator is called with no arguments to create a generator per posting.
+    Returns the manifest dict, which includes the path it was written to.
+    """
+    if not jobs:
+        raise ValueError("No job descriptions to process.")
+
+    start_time = time.perf_counter()
+    batch_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+    # Profile-level work happens once for the whole batch
+    base_generator = make_generator()
+    base_generator.set_user_profile(profile)
+    base_generator.get_profile_skills(profile)
+    style_attributes = base_generator.extract_style_attributes()
+    resume_texts = list(resume_texts or base_generator.resume_texts)
+    if not resume_texts:
+        raise ValueError(f"Profile {profile.full_name} has no resume text.")
+
+    def run_one(job):
+        job_start = time.perf_counter()
+        generator = make_generator()
+        generator.current_user_profile = profile
+        generator.resume_texts = list(resume_texts)
+        generator.style_attributes = style_attributes
+        generator.job_description = job["text"]
+        if job.get("company"):
+            generator.job.company_name = safe_company_name(job["company"])
+
+        entry = {"id": job["id"]}
+        try:
+            result = generator.process_job_application()
+        except Exception as e:
+            result = {"error": str(e)}
+        if "error" in result:
+            entry.update({"success": False, "error": result["error"]})
+        else:
+            entry.update({
+                "success": True,
+                "company": result["company"],
+                "folder": result["folder"],
+                "results": result["results"]
+            })
+        entry["usage"] = dict(generator.usage)
+        entry["stages"] = generator.trace.stages()
+        entry["seconds"] = round(time.perf_counter() - job_start, 3)
+        logger.info(f"Batch {batch_id}: finished {job['id']} ({'ok' if entry['success'] else 'failed'})")
+        return entry
+
+    logger.info(f"Batch {batch_id}: {len(jobs)} job description(s) for {profile.full_name} with up to {max_workers} in parallel")
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="batch") as executor:
+        results = list(executor.map(run_one, jobs))
+
+    manifest = {
+        "batch_id": batch_id,
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "profile": profile.folder_name,
+        "total": len(results),
+        "succeeded": sum(1 for entry in results if entry["success"]),
+        "failed": sum(1 for entry in results if not entry["success"]),
+        "seconds": round(time.perf_counter() - start_time, 3),
+        "results": results
+    }
+
+    os.makedirs(manifest_folder, exist_ok=True)
+    manifest_path = os.path.join(manifest_folder, f"batch_{batch_id}.json")
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    manifest["manifest_path"] = manifest_path
+    logger.info(f"Batch {batch_id}: {manifest['succeeded']}/{manifest['total']} succeeded, manifest written to {manifest_path}")
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate resumes and cover letters for many job descriptions")
+    parser.add_argument("--profile", required=True, help="profile folder name in user_profiles/")
+    parser.add_argument("--jobs", required=True, help="directory of .txt/.md/.pdf job descriptions or a .jsonl file")
+    parser.add_argument("--workers", type=int, default=None, help="job descriptions processed in parallel")
+    parser.add_argument("--out", default=None, help="also copy the results manifest to this path")
+    args = parser.parse_args(argv)
+
+    from .config import configure_logging, BATCH_MANIFEST_FOLDER, BATCH_MAX_WORKERS
+    from .profiles import UserProfile
+    from .generator import ResumeAndCoverLetterGenerator
+
+    configure_logging(log_file=None)
+
+    profile = UserProfile.load(args.profile)
+    if not profile:
+        parser.error(f"Profile not found: {args.profile}")
+    jobs = load_job_descriptions(args.jobs)
+    if not jobs:
+        parser.error(f"No job descriptions found in {args.jobs}")
+
+    manifest = run_batch(jobs, profile, ResumeAndCoverLetterGenerator, BATCH_MANIFEST_FOLDER,
+                         max_workers=args.workers or BATCH_MAX_WORKERS)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+    print(f"{manifest['succeeded']}/{manifest['total']} succeeded - manifest: {args.out or manifest['manifest_path']}")
+    return 0 if manifest["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,128 @@
+"""
+Command line interface for scripted generation, without the web app.
+
+    python -m resume_gen generate --profile Jane_Doe --job job.txt --out applications/
+    python -m resume_gen batch --profile Jane_Doe --jobs postings/
+"""
+
+import os
+import sys
+import json
+import logging
+import argparse
+
+from .config import configure_logging, OUTPUT_FOLDER
+from .job_description import safe_company_name
+
+logger = logging.getLogger(__name__)
+
+
+def read_job_description(path):
+    """Read a job description from a text or PDF file, or from stdin when path is '-'"""
+    if path == "-":
+        return sys.stdin.read().strip()
+    if path.lower().endswith(".pdf"):
+        from .ingestion import parse_pdf_text
+        return parse_pdf_text(path).strip()
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read().strip()
+
+
+def generate(args):
+    """Generate a resume and cover letter for one job description"""
+    from .profiles import UserProfile
+    from .generator import ResumeAndCoverLetterGenerator, pdf_text_cache
+
+    if not os.environ.get("OPENAI_API_KEY"):
+        logger.warning("OPENAI_API_KEY is not set; only cached responses can be used.")
+
+    profile = UserProfile.load(args.profile)
+    if not profile:
+        print(f"Profile not found: {args.profile}", file=sys.stderr)
+        return 2
+
+    job_description = read_job_description(args.job)
+    if not job_description:
+        print(f"Job description is empty: {args.job}", file=sys.stderr)
+        return 2
+
+    generator = ResumeAndCoverLetterGenerator()
+    generator.set_user_profile(profile)
+    if args.resume:
+        from .ingestion import extract_texts
+        extracted = extract_texts(args.resume, cache=pdf_text_cache)
+        failed = [item for item in extracted if item["error"] or not item["text"].strip()]
+        if failed:
+            for item in failed:
+                print(f"Could not read resume {item['filename']}: {item['error'] or 'no text'}", file=sys.stderr)
+            return 2
+        generator.resume_texts = [item["text"].strip() for item in extracted]
+
+    generator.job_description = job_description
+    if args.company:
+        generator.job.company_name = safe_company_name(args.company)
+    generator.output_folder = args.out
+    generator.style_attributes = generator.extract_style_attributes()
+
+    result = generator.process_job_application(max_workers=args.workers)
+
+    if args.json:
+        result["usage"] = generator.usage
+        print(json.dumps(result, indent=2))
+    elif "error" in result:
+        print(result["error"], file=sys.stderr)
+    else:
+        print(f"{result['company']}: {result['folder']}")
+        for item in result["results"]:
+            for key in ("resume_html", "cover_letter_html"):
+                if item.get(key):
+                    print(f"  {os.path.join(result['folder'], item[key])}")
+            for error in item.get("errors", []):
+                print(f"  error: {error}", file=sys.stderr)
+
+    if "error" in result or any(item.get("errors") for item in result["results"]):
+        return 1
+    return 0
+
+
+def batch(args):
+    """Generate documents for a directory or JSON Lines file of job descriptions"""
+    from .batch import main as batch_main
+
+    argv = ["--profile", args.profile, "--jobs", args.jobs]
+    if args.workers:
+        argv += ["--workers", str(args.workers)]
+    if args.out:
+        argv += ["--out", args.out]
+    return batch_main(argv)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m resume_gen", description="Resume and cover letter generator")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log progress to stderr")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = subparsers.add_parser("generate", help="generate documents for one job description")
+    generate_parser.add_argument("--profile", required=True, help="profile folder name in user_profiles/")
+    generate_parser.add_argument("--job", required=True, help="job description file (.txt, .md or .pdf), or - for stdin")
+    generate_parser.add_argument("--out", default=OUTPUT_FOLDER, help=f"folder for the application folder (default: {OUTPUT_FOLDER})")
+    generate_parser.add_argument("--resume", nargs="+", help="resume files to tailor instead of the profile's resume")
+    generate_parser.add_argument("--company", help="company name, skipping extraction from the job description")
+    generate_parser.add_argument("--workers", type=int, default=None, help="documents generated in parallel")
+    generate_parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    generate_parser.set_defaults(func=generate)
+
+    batch_parser = subparsers.add_parser("batch", help="generate documents for many job descriptions")
+    batch_parser.add_argument("--profile", required=True, help="profile folder name in user_profiles/")
+    batch_parser.add_argument("--jobs", required=True, help="directory of job descriptions or a .jsonl file")
+    batch_parser.add_argument("--workers", type=int, default=None, help="job descriptions processed in parallel")
+    batch_parser.add_argument("--out", default=None, help="also copy the results manifest to this path")
+    batch_parser.set_defaults(func=batch)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    # Log to the console only (plus the AI interactions log); keep stdout for results
+    configure_logging(log_file=None, level=logging.INFO if args.verbose else logging.WARNING)
+    return args.func(args)
@@ -0,0 +1,127 @@
+"""
+Settings shared by the web app, the CLI and batch runs, read from the environment.
+
+Values can be set in a .env file; see .env.example for descriptions.
+"""
+
+import os
+import logging
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Get logging configuration from environment variables
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+AI_LOG_LEVEL = os.environ.get("AI_LOG_LEVEL", "INFO").upper()
+AI_LOG_FULL_TEXT = os.environ.get("AI_LOG_FULL_TEXT", "true").lower() == "true"
+AI_LOG_FILE = "ai_interactions.log"
+
+# Convert string log levels to logging constants
+LOG_LEVEL_MAP = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL
+}
+
+APP_LOG_LEVEL = LOG_LEVEL_MAP.get(LOG_LEVEL, logging.INFO)
+AI_LOG_LEVEL_INT = LOG_LEVEL_MAP.get(AI_LOG_LEVEL, logging.INFO)
+
+# Folders, relative to the working directory
+UPLOAD_FOLDER = 'uploads'
+OUTPUT_FOLDER = 'generated'
+TEMP_FOLDER = 'temp'
+USER_PROFILES_FOLDER = 'user_profiles'
+
+# Cache for LLM responses, keyed by a hash of the full request
+LLM_CACHE_ENABLED = os.environ.get("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_FOLDER = os.environ.get("LLM_CACHE_FOLDER", os.path.join('cache', 'llm'))
+LLM_CACHE_MAX_MB = float(os.environ.get("LLM_CACHE_MAX_MB", "50"))
+LLM_CACHE_MAX_AGE_HOURS = float(os.environ.get("LLM_CACHE_MAX_AGE_HOURS", "168"))
+
+# Cache of text extracted from uploaded PDFs, keyed by the file's SHA-256
+TEXT_CACHE_FOLDER = os.environ.get("TEXT_CACHE_FOLDER", os.path.join(UPLOAD_FOLDER, '.text_cache'))
+TEXT_CACHE_MAX_MB = float(os.environ.get("TEXT_CACHE_MAX_MB", "100"))
+
+# Style attributes of reference PDFs, keyed by content hash and sampled page count
+STYLE_SAMPLE_PAGES = int(os.environ.get("STYLE_SAMPLE_PAGES", "1"))  # 0 = all pages
+
+# Worker processes for parsing batches of uploaded PDFs
+INGEST_MAX_WORKERS = int(os.environ.get("INGEST_MAX_WORKERS", str(min(4, os.cpu_count() or 1))))
+INGEST_TIMEOUT = float(os.environ.get("INGEST_TIMEOUT", "120"))  # seconds per file
+
+# Concurrency for resume / cover letter generation
+GENERATION_MAX_WORKERS = int(os.environ.get("GENERATION_MAX_WORKERS", "4"))
+GENERATION_TASK_TIMEOUT = float(os.environ.get("GENERATION_TASK_TIMEOUT", "300"))  # seconds
+
+# Shared OpenAI client: per-request timeout, retries with backoff, connection pool
+# and circuit breaker (consecutive failures before failing fast, cool-down seconds)
+OPENAI_REQUEST_TIMEOUT = float(os.environ.get("OPENAI_REQUEST_TIMEOUT", "120"))
+OPENAI_MAX_RETRIES = int(os.environ.get("OPENAI_MAX_RETRIES", "3"))
+OPENAI_BACKOFF_BASE = float(os.environ.get("OPENAI_BACKOFF_BASE", "1"))
+OPENAI_BACKOFF_MAX = float(os.environ.get("OPENAI_BACKOFF_MAX", "20"))
+OPENAI_MAX_CONNECTIONS = int(os.environ.get("OPENAI_MAX_CONNECTIONS", "20"))
+OPENAI_KEEPALIVE_CONNECTIONS = int(os.environ.get("OPENAI_KEEPALIVE_CONNECTIONS", "10"))
+OPENAI_CIRCUIT_FAILURES = int(os.environ.get("OPENAI_CIRCUIT_FAILURES", "5"))
+OPENAI_CIRCUIT_RESET = float(os.environ.get("OPENAI_CIRCUIT_RESET", "30"))
+# Alternative API endpoint, e.g. the local mock server used by benchmark.py
+OPENAI_BASE_URL = os.environ.get("OPENAI_BASE_URL") or None
+
+# Client-side rate limits shared by all generation in this process (0 = unlimited)
+# and the longest a request may wait for capacity before failing
+OPENAI_RPM = int(os.environ.get("OPENAI_RPM", "0"))
+OPENAI_TPM = int(os.environ.get("OPENAI_TPM", "0"))
+OPENAI_RATE_LIMIT_WAIT = float(os.environ.get("OPENAI_RATE_LIMIT_WAIT", "60"))
+
+# Prompt token budgets: context window (0 = the model's own), cap on prompt tokens
+# (0 = whatever the context leaves), and completion tokens per document
+PROMPT_CONTEXT_TOKENS = int(os.environ.get("PROMPT_CONTEXT_TOKENS", "0"))
+PROMPT_MAX_INPUT_TOKENS = int(os.environ.get("PROMPT_MAX_INPUT_TOKENS", "4000"))
+RESUME_MAX_TOKENS = int(os.environ.get("RESUME_MAX_TOKENS", "1500"))
+COVER_LETTER_MAX_TOKENS = int(os.environ.get("COVER_LETTER_MAX_TOKENS", "1000"))
+# Most resume / portfolio and LinkedIn tokens per prompt (0 = no cap); when a text is
+# longer, the parts most relevant to the job description are kept
+PROMPT_RESUME_TOKENS = int(os.environ.get("PROMPT_RESUME_TOKENS", "2000"))
+PROMPT_PORTFOLIO_TOKENS = int(os.environ.get("PROMPT_PORTFOLIO_TOKENS", "500"))
+RELEVANCE_RANKING = os.environ.get("RELEVANCE_RANKING", "true").lower() == "true"
+# Generate each variant's resume and cover letter in one completion returning JSON,
+# instead of one call per document (falls back to separate calls if the JSON is unusable)
+COMBINED_GENERATION = os.environ.get("COMBINED_GENERATION", "false").lower() == "true"
+
+# Searchable history of every generation run (company, usage, latency, outputs)
+HISTORY_DB = os.environ.get("HISTORY_DB", os.path.join('cache', 'history.sqlite3'))
+
+# Batch mode: many job descriptions against one profile
+BATCH_MAX_WORKERS = int(os.environ.get("BATCH_MAX_WORKERS", "2"))
+BATCH_MANIFEST_FOLDER = os.environ.get("BATCH_MANIFEST_FOLDER", 'batches')
+
+
+def configure_logging(log_file="app.log", level=None):
+    """Configure application logging and the AI interactions log file
+
+    Returns the AI interactions logger. Safe to call more than once.
+    """
+    level = level or APP_LOG_LEVEL
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.insert(0, logging.FileHandler(log_file))
+    # Handler levels also filter records propagated from the AI interactions logger
+    for handler in handlers:
+        handler.setLevel(level)
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=handlers
+    )
+
+    # Create a dedicated logger for AI interactions, with its own log file
+    ai_logger = logging.getLogger("ai_interactions")
+    ai_logger.setLevel(AI_LOG_LEVEL_INT)
+    if not any(getattr(handler, "baseFilename", None) == os.path.abspath(AI_LOG_FILE) for handler in ai_logger.handlers):
+        ai_log_handler = logging.FileHandler(AI_LOG_FILE)
+        ai_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        ai_logger.addHandler(ai_log_handler)
+    return ai_logger
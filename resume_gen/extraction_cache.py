@@ -0,0 +1,93 @@
+"""
+On-disk cache of text extracted from uploaded files, keyed by content hash.
+
+Uploading the same file again - under any name - reuses the stored text
+instead of parsing the document a second time.
+"""
+
+import os
+import hashlib
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def file_sha256(file_path, chunk_size=1024 * 1024):
+    """Return the SHA-256 hex digest of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """Text files named by content hash, evicted least recently used first"""
+
+    def __init__(self, folder, max_bytes=100 * 1024 * 1024):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _path(self, digest):
+        return os.path.join(self.folder, f"{digest}.txt")
+
+    def get(self, digest):
+        """Return the cached text for a content hash, or None"""
+        file_path = self._path(digest)
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except OSError:
+            self.misses += 1
+            return None
+
+        # Touch the entry so eviction treats it as recently used
+        try:
+            os.utime(file_path)
+        except OSError:
+            pass
+        self.hits += 1
+        return text
+
+    def set(self, digest, text):
+        """Store extracted text and evict old entries if over budget"""
+        file_path = self._path(digest)
+        tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, file_path)
+        except OSError as e:
+            logger.warning(f"Could not cache extracted text {digest}: {e}")
+            return
+        self._evict()
+
+    def _evict(self):
+        if not self.max_bytes:
+            return
+        with self._lock:
+            entries = []
+            for filename in os.listdir(self.folder):
+                if not filename.endswith(".txt"):
+                    continue
+                file_path = os.path.join(self.folder, filename)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, file_path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, file_path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(file_path)
+                    total -= size
+                except OSError:
+                    continue
@@ -0,0 +1,1229 @@
+"""
+Resume and cover letter generation with the OpenAI API.
+
+The generator holds one application's inputs (job description, resume texts,
+user profile) and turns them into tailored HTML documents in an application
+folder. It has no web dependencies, so the web app, the CLI and batch runs all
+share it.
+"""
+
+import os
+import re
+import json
+import time
+import logging
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+
+from .llm_cache import LLMResponseCache, make_cache_key
+from .extraction_cache import ExtractionCache, file_sha256
+from .ingestion import parse_pdf_text, analyze_style
+from .job_description import JobDescription, guess_company_name, safe_company_name
+from .application_manifest import ApplicationManifest
+from .application_history import ApplicationHistory, html_to_text
+from .config import (
+    AI_LOG_FULL_TEXT, UPLOAD_FOLDER, OUTPUT_FOLDER,
+    LLM_CACHE_ENABLED, LLM_CACHE_FOLDER, LLM_CACHE_MAX_MB, LLM_CACHE_MAX_AGE_HOURS,
+    TEXT_CACHE_FOLDER, TEXT_CACHE_MAX_MB, STYLE_SAMPLE_PAGES,
+    GENERATION_MAX_WORKERS, GENERATION_TASK_TIMEOUT, HISTORY_DB,
+    OPENAI_REQUEST_TIMEOUT, OPENAI_MAX_RETRIES, OPENAI_BACKOFF_BASE, OPENAI_BACKOFF_MAX,
+    OPENAI_MAX_CONNECTIONS, OPENAI_KEEPALIVE_CONNECTIONS, OPENAI_CIRCUIT_FAILURES, OPENAI_CIRCUIT_RESET,
+    OPENAI_RPM, OPENAI_TPM, OPENAI_RATE_LIMIT_WAIT, OPENAI_BASE_URL,
+    PROMPT_CONTEXT_TOKENS, PROMPT_MAX_INPUT_TOKENS, RESUME_MAX_TOKENS, COVER_LETTER_MAX_TOKENS,
+    PROMPT_RESUME_TOKENS, PROMPT_PORTFOLIO_TOKENS, RELEVANCE_RANKING, COMBINED_GENERATION
+)
+from .llm_client import get_llm_client, usage_tokens
+from .rate_limit import RateLimiter, SingleFlight
+from .tracing import Trace
+from .prompt_budget import PromptBudget, Section, truncate_to_tokens
+from .relevance import relevance_trimmer
+from .prompts import SYSTEM_MESSAGE, render_context, task_prompt, parse_documents
+from .profiles import UserProfile
+
+logger = logging.getLogger(__name__)
+ai_logger = logging.getLogger("ai_interactions")
+
+llm_cache = LLMResponseCache(
+    LLM_CACHE_FOLDER,
+    max_bytes=int(LLM_CACHE_MAX_MB * 1024 * 1024),
+    max_age_seconds=LLM_CACHE_MAX_AGE_HOURS * 3600,
+    enabled=LLM_CACHE_ENABLED
+)
+
+pdf_text_cache = ExtractionCache(TEXT_CACHE_FOLDER, max_bytes=int(TEXT_CACHE_MAX_MB * 1024 * 1024))
+style_cache = ExtractionCache(os.path.join(TEXT_CACHE_FOLDER, 'styles'), max_bytes=5 * 1024 * 1024)
+
+application_history = ApplicationHistory(HISTORY_DB)
+
+# Shared by every generator in the process: org rate limits and identical in-flight requests
+rate_limiter = RateLimiter(OPENAI_RPM, OPENAI_TPM, max_wait=OPENAI_RATE_LIMIT_WAIT)
+in_flight_requests = SingleFlight()
+
+# Manifests of generated application folders, one per output folder
+_manifests = {}
+_manifests_lock = threading.Lock()
+
+def get_application_manifest(output_folder=OUTPUT_FOLDER):
+    """Return the shared manifest of application folders under output_folder"""
+    key = os.path.abspath(output_folder)
+    with _manifests_lock:
+        if key not in _manifests:
+            _manifests[key] = ApplicationManifest(output_folder)
+        return _manifests[key]
+
+# The company name is near the top of a posting; only this much is sent to extract it
+COMPANY_PROMPT_TOKENS = 500
+# Completion tokens for the skills JSON
+SKILLS_MAX_TOKENS = 500
+# Completion tokens per document prompt; "documents" writes the resume and cover letter in one response
+DOCUMENT_MAX_TOKENS = {
+    "resume": RESUME_MAX_TOKENS,
+    "cover_letter": COVER_LETTER_MAX_TOKENS,
+    "documents": RESUME_MAX_TOKENS + COVER_LETTER_MAX_TOKENS
+}
+
+# CSS for print buttons added to generated documents
+PRINT_BUTTON_CSS = """
+            .no-print {
+                display: block;
+            }
+            .print-button {
+                background-color: #4CAF50;
+                border: none;
+                color: white;
+                padding: 10px 20px;
+                text-align: center;
+                text-decoration: none;
+                display: inline-block;
+                font-size: 16px;
+                margin: 10px 2px;
+                cursor: pointer;
+                border-radius: 4px;
+            }
+            .print-instructions {
+                margin-bottom: 10px;
+                font-style: italic;
+                color: #555;
+            }
+            @media print {
+                .no-print {
+                    display: none;
+                }
+            }
+            """
+
+# Print button HTML
+PRINT_BUTTON_HTML = """
+            <div class="no-print" style="text-align: center; margin: 20px 0;">
+                <div class="print-instructions">Click the button below to print or save as PDF</div>
+                <button class="print-button" onclick="window.print()">Print / Save as PDF</button>
+            </div>
+            """
+
+class ResumeAndCoverLetterGenerator:
+    def __init__(self):
+        self.resume_texts = []  # List to store multiple resume texts
+        self.job_description = ""
+        self.company_name = ""
+        self.style_attributes = {}
+        self.api_key = os.environ.get("OPENAI_API_KEY")
+        self.model = os.environ.get("OPENAI_MODEL", "gpt-4")
+        self.current_user_profile = None
+        self._job = None  # JobDescription memo, see the job property
+        self.output_folder = OUTPUT_FOLDER
+        self.usage = {"prompt_tokens": 0, "completion_tokens": 0, "llm_calls": 0, "cache_hits": 0, "coalesced": 0,
+                      "cached_prompt_tokens": 0}
+        self._usage_lock = threading.Lock()
+        self.trace = Trace()  # timed stages of this generator's work
+    
+    @classmethod
+    def from_state(cls, state):
+        """Create a generator from state saved with to_state()"""
+        generator = cls()
+        generator.job_description = state.get("job_description", "")
+        generator.resume_texts = list(state.get("resume_texts", []))
+        generator.company_name = state.get("company_name", "")
+        # Reuse the company name extracted for this same job description
+        if state.get("company_name") and state.get("job_description_hash") == generator.job.hash:
+            generator.job.company_name = state["company_name"]
+        if state.get("profile_folder"):
+            generator.current_user_profile = UserProfile.load(state["profile_folder"])
+        return generator
+    
+    def to_state(self):
+        """Return the per-session state of this generator as a JSON-serializable dict"""
+        return {
+            "job_description": self.job_description,
+            "resume_texts": self.resume_texts,
+            "company_name": self.job.company_name or "",
+            "job_description_hash": self.job.hash,
+            "profile_folder": self.current_user_profile.folder_name if self.current_user_profile else None
+        }
+    
+    def set_user_profile(self, profile):
+        """Set the current user profile"""
+        self.current_user_profile = profile
+        if profile and profile.resume_text:
+            self.resume_texts = [profile.resume_text]
+            logger.info(f"Loaded resume from user profile: {profile.full_name}")
+        return self.current_user_profile
+    
+    def extract_user_info(self, resume_text, first_name="", last_name="", portfolio_text="", linkedin_text=""):
+        """Extract user information from resume, portfolio, and LinkedIn data"""
+        try:
+            logger.info("Creating user profile")
+            
+            # Create and return a new user profile
+            profile = UserProfile(
+                first_name=first_name,
+                last_name=last_name
+            )
+            profile.resume_text = resume_text
+            profile.portfolio_text = portfolio_text
+            profile.linkedin_text = linkedin_text
+            
+            # Extract skills (the caller saves the new profile)
+            self.get_profile_skills(profile, save=False)
+            
+            return profile
+            
+        except Exception as e:
+            logger.error(f"Error creating user profile: {e}")
+            # Create a profile with default values
+            profile = UserProfile(first_name=first_name, last_name=last_name)
+            profile.resume_text = resume_text
+            profile.portfolio_text = portfolio_text
+            profile.linkedin_text = linkedin_text
+            return profile
+    
+    def get_profile_skills(self, profile, save=True):
+        """Return the profile's skills, extracting them only when its source text changed
+        
+        Newly extracted skills are written back to the saved profile unless save is
+        False (for callers that save the profile themselves). An empty result is kept
+        too; extraction errors are raised, leaving the hash unset so a later call retries.
+        """
+        if not profile:
+            return []
+        
+        content_hash = profile.content_hash()
+        if profile.skills_hash == content_hash:
+            return profile.skills
+        
+        with self.trace.span("extract_skills") as span:
+            skills = self.extract_skills(profile)
+            span.set(skills=len(skills))
+        profile.skills = skills
+        profile.skills_hash = content_hash
+        if save and profile.folder_name:
+            try:
+                profile.save()
+            except Exception as e:
+                logger.error(f"Error saving extracted skills for {profile.full_name}: {e}")
+        return skills
+    
+    def extract_skills(self, profile, use_cache=True):
+        """Extract skills from user profile data"""
+        try:
+            logger.info("Extracting skills from user profile data")
+            
+            system_message = "You extract professional skills from user data. Always respond with valid JSON."
+            
+            def render_profile(texts):
+                return f"""
+            Resume:
+            {texts["resume"]}
+            
+            Portfolio:
+            {texts["portfolio"] or "Not provided"}
+            
+            LinkedIn:
+            {texts["linkedin"] or "Not provided"}
+            """
+            
+            def render(texts):
+                return f"""
+            Extract a comprehensive list of professional skills from the following user data.
+            Include technical skills, soft skills, tools, technologies, and domain knowledge.
+            Return the skills as a JSON array of strings, with each skill being specific and concise.
+            Format your response as a valid JSON object with a single key "skills" containing the array.
+            
+            {render_profile(texts)}
+            """
+            
+            plan = self.prompt_budget(SKILLS_MAX_TOKENS).fit(system_message, render, [
+                Section("resume", profile.resume_text, priority=1),
+                Section("portfolio", profile.portfolio_text, priority=2),
+                Section("linkedin", profile.linkedin_text, priority=2)
+            ])
+            combined_text = render_profile(plan.texts)
+            ai_logger.info(f"EXTRACTING SKILLS - Prompt budget: {plan.summary()}")
+            
+            # Log profile data based on settings
+            if AI_LOG_FULL_TEXT:
+                ai_logger.info(f"EXTRACTING SKILLS - Profile data: {combined_text}")
+            else:
+                combined_text_short = combined_text[:300] + "..." if len(combined_text) > 300 else combined_text
+                ai_logger.info(f"EXTRACTING SKILLS - Profile data (truncated): {combined_text_short}")
+            
+            response_text = self.chat_completion(
+                messages=[
+                    {"role": "system", "content": system_message},
+                    {"role": "user", "content": render(plan.texts)}
+                ],
+                max_tokens=plan.max_tokens,
+                temperature=0.3,
+                use_cache=use_cache
+            )
+            
+            # Parse JSON from text response
+            response_text = response_text.strip()
+            
+            # Log response based on settings
+            if AI_LOG_FULL_TEXT:
+                ai_logger.info(f"SKILLS RESPONSE - Full: {response_text}")
+            else:
+                response_text_short = response_text[:300] + "..." if len(response_text) > 300 else response_text
+                ai_logger.info(f"SKILLS RESPONSE - Truncated: {response_text_short}")
+            
+            try:
+                result = json.loads(response_text)
+                skills = result.get("skills", [])
+                logger.info(f"Extracted {len(skills)} skills from user profile")
+                # Skills list is typically small, so we always log the full list
+                ai_logger.info(f"SKILLS EXTRACTED - Count: {len(skills)} - All skills: {skills}")
+                return skills
+            except json.JSONDecodeError:
+                # Fallback: try to extract skills using regex if JSON parsing fails
+                logger.warning("Failed to parse JSON response, attempting to extract skills with regex")
+                
+                if AI_LOG_FULL_TEXT:
+                    ai_logger.warning(f"SKILLS EXTRACTION FAILED - Invalid JSON response: {response_text}")
+                else:
+                    response_text_short = response_text[:300] + "..." if len(response_text) > 300 else response_text
+                    ai_logger.warning(f"SKILLS EXTRACTION FAILED - Invalid JSON response (truncated): {response_text_short}")
+                
+                import re
+                # Look for anything that might be a skill (words or phrases in quotes)
+                skills_match = re.findall(r'"([^"]+)"', response_text)
+                if skills_match:
+                    logger.info(f"Extracted {len(skills_match)} skills using regex")
+                    ai_logger.info(f"SKILLS EXTRACTED (regex) - Count: {len(skills_match)} - All skills: {skills_match}")
+                    return skills_match
+                return []
+            
+        except Exception as e:
+            logger.error(f"Error extracting skills: {e}")
+            ai_logger.error(f"SKILLS EXTRACTION ERROR: {e}")
+            raise
+    
+    def add_resume(self, resume_text):
+        """Add a resume to the list of resumes"""
+        if resume_text and resume_text.strip():
+            self.resume_texts.append(resume_text.strip())
+            logger.info(f"Added resume ({len(resume_text)} characters)")
+            return True
+        return False
+    
+    def clear_resumes(self):
+        """Clear all resumes"""
+        self.resume_texts = []
+        logger.info("Cleared all resumes")
+    
+    def extract_text_from_pdf(self, pdf_path):
+        """Extract text from a PDF file, reusing earlier extractions of identical files"""
+        try:
+            with self.trace.span("parse_pdf") as span:
+                digest = file_sha256(pdf_path)
+                text = pdf_text_cache.get(digest)
+                span.set(cached=text is not None)
+                if text is not None:
+                    logger.info(f"Using cached text for PDF: {pdf_path}")
+                    return text
+                
+                text = parse_pdf_text(pdf_path)
+                pdf_text_cache.set(digest, text)
+                logger.info(f"Extracted text from PDF: {pdf_path}")
+                return text
+        except Exception as e:
+            logger.error(f"Error extracting text from PDF: {e}")
+            return ""
+    
+    @property
+    def job(self):
+        """The current job description as a JobDescription, memoized while its text is unchanged"""
+        if self._job is None or self._job.text != self.job_description:
+            self._job = JobDescription(self.job_description)
+        return self._job
+    
+    def extract_company_name(self, job_description=None, use_cache=True):
+        """Extract company name from job description
+        
+        The result for the current job description is computed once and reused.
+        """
+        if job_description is None or job_description == self.job_description:
+            job = self.job
+            if job.company_name is None:
+                with self.trace.span("extract_company"):
+                    job.company_name = self._extract_company_name(job.text, use_cache=use_cache)
+            return job.company_name
+        with self.trace.span("extract_company"):
+            return self._extract_company_name(job_description, use_cache=use_cache)
+    
+    def _extract_company_name(self, job_description, use_cache=True):
+        """Extract a filename-safe company name, trying local heuristics before the LLM"""
+        if not job_description:
+            return "Unknown_Company"
+            
+        try:
+            # Log job description based on settings
+            if AI_LOG_FULL_TEXT:
+                ai_logger.info(f"EXTRACTING COMPANY NAME - Job description: {job_description}")
+            else:
+                job_desc_short = job_description[:300] + "..." if len(job_description) > 300 else job_description
+                ai_logger.info(f"EXTRACTING COMPANY NAME - Job description (truncated): {job_desc_short}")
+            
+            prompt = f"""
+            Extract the company name from the following job description. 
+            Return ONLY the company name, nothing else.
+            If you cannot determine the company name, return "Unknown_Company".
+            
+            Job Description:
+            {truncate_to_tokens(job_description, COMPANY_PROMPT_TOKENS, self.model)}
+            """
+            
+            system_message = "You extract company names from job descriptions. Respond with only the company name, nothing else."
+            
+            # Skip the LLM when the posting names the company in a recognizable way
+            company_name = guess_company_name(job_description)
+            if company_name:
+                ai_logger.info(f"COMPANY NAME EXTRACTED (heuristic): {company_name}")
+            else:
+                company_name = self.generate_ai_content(prompt, system_message, max_tokens=50, use_cache=use_cache).strip()
+                ai_logger.info(f"COMPANY NAME EXTRACTED: {company_name}")
+            
+            # Clean up the company name for use in filenames
+            return safe_company_name(company_name)
+            
+        except Exception as e:
+            # An unreachable or rejecting API fails the run rather than filing it under Unknown_Company
+            logger.error(f"Error extracting company name: {e}")
+            ai_logger.error(f"COMPANY NAME EXTRACTION ERROR: {e}")
+            raise
+    
+    def extract_style_attributes(self, pdf_path=None):
+        """Extract style attributes from a PDF file
+        
+        Without a path, the current profile's resume is used, falling back to the most
+        recently uploaded PDF. Results are cached by the file's content hash.
+        """
+        if pdf_path and os.path.exists(pdf_path):
+            reference_pdf = pdf_path
+        else:
+            reference_pdf = None
+            profile = self.current_user_profile
+            if profile and profile.resume_file and profile.resume_file.endswith('.pdf'):
+                profile_pdf = os.path.join(UPLOAD_FOLDER, profile.resume_file)
+                if os.path.exists(profile_pdf):
+                    reference_pdf = profile_pdf
+            
+            if reference_pdf is None and os.path.isdir(UPLOAD_FOLDER):
+                # Look for PDFs in the uploads folder, newest first
+                reference_pdfs = [os.path.join(UPLOAD_FOLDER, f) 
+                                 for f in os.listdir(UPLOAD_FOLDER) 
+                                 if f.endswith('.pdf')]
+                if reference_pdfs:
+                    reference_pdf = max(reference_pdfs, key=os.path.getmtime)
+        
+        if not reference_pdf:
+            logger.warning("No PDF files found for style reference.")
+            return {}
+        
+        try:
+            with self.trace.span("extract_style") as span:
+                digest = file_sha256(reference_pdf)
+                cache_key = f"{digest}_{STYLE_SAMPLE_PAGES}"
+                cached = style_cache.get(cache_key)
+                span.set(cached=cached is not None)
+                if cached is not None:
+                    logger.info(f"Using cached style attributes for: {reference_pdf}")
+                    return json.loads(cached)
+                
+                style = analyze_style(reference_pdf, max_pages=STYLE_SAMPLE_PAGES)
+                style_cache.set(cache_key, json.dumps(style))
+                logger.info(f"Extracted style attributes from: {reference_pdf}")
+                return style
+            
+        except Exception as e:
+            logger.error(f"Error extracting style attributes: {e}")
+            return {}
+    
+    def get_client(self):
+        """Return the process-wide OpenAI client for this generator's API key"""
+        return get_llm_client(
+            self.api_key,
+            timeout=OPENAI_REQUEST_TIMEOUT,
+            max_retries=OPENAI_MAX_RETRIES,
+            backoff_base=OPENAI_BACKOFF_BASE,
+            backoff_max=OPENAI_BACKOFF_MAX,
+            max_connections=OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=OPENAI_KEEPALIVE_CONNECTIONS,
+            circuit_failures=OPENAI_CIRCUIT_FAILURES,
+            circuit_reset=OPENAI_CIRCUIT_RESET,
+            rate_limiter=rate_limiter,
+            base_url=OPENAI_BASE_URL
+        )
+    
+    def chat_completion(self, messages, max_tokens, temperature, use_cache=True):
+        """Run a chat completion, serving identical requests from the response cache
+        
+        Identical requests already in flight (from any generator in this process)
+        are coalesced into one upstream call.
+        """
+        cache_key = make_cache_key(self.model, messages, max_tokens, temperature)
+        
+        with self.trace.span("llm_call", model=self.model, max_tokens=max_tokens, cache_hit=False) as span:
+            if use_cache:
+                cached = llm_cache.get(cache_key)
+                if cached is not None:
+                    ai_logger.info(f"CACHE HIT - Key: {cache_key[:12]}")
+                    self.add_usage(cache_hits=1)
+                    span.set(cache_hit=True)
+                    return cached
+            
+            def request():
+                response = self.get_client().create_chat_completion(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature
+                )
+                content = response.choices[0].message.content
+                self.add_usage(llm_calls=1)
+                self.record_token_usage(getattr(response, "usage", None), span)
+                
+                # Bypassed calls still refresh the cache so later runs can reuse the result
+                llm_cache.set(cache_key, content, model=self.model)
+                return content
+            
+            # Concurrent identical requests share one upstream call
+            content, shared = in_flight_requests.do(cache_key, request)
+            if shared:
+                ai_logger.info(f"COALESCED REQUEST - Key: {cache_key[:12]}")
+                self.add_usage(coalesced=1)
+                span.set(coalesced=True)
+            return content
+    
+    def add_usage(self, **counts):
+        """Add to this generator's token usage and LLM call counters (thread-safe)"""
+        with self._usage_lock:
+            for name, value in counts.items():
+                self.usage[name] = self.usage.get(name, 0) + value
+    
+    def record_token_usage(self, usage, span):
+        """Add an LLM call's reported token usage to the counters and its trace span"""
+        prompt_tokens, completion_tokens, cached_tokens = usage_tokens(usage)
+        self.add_usage(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+                       cached_prompt_tokens=cached_tokens)
+        span.set(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens, cached_tokens=cached_tokens)
+    
+    def log_prompt(self, prompt, system_message):
+        """Log an outgoing prompt with truncation based on settings"""
+        ai_logger.info(f"SENDING TO AI - System: {system_message}")
+        
+        if AI_LOG_FULL_TEXT:
+            ai_logger.info(f"SENDING TO AI - Prompt: {prompt}")
+        else:
+            prompt_for_log = prompt[:500] + "..." if len(prompt) > 500 else prompt
+            ai_logger.info(f"SENDING TO AI - Prompt (truncated): {prompt_for_log}")
+    
+    def log_response(self, content):
+        """Log an AI response with truncation based on settings"""
+        if AI_LOG_FULL_TEXT:
+            ai_logger.info(f"RECEIVED FROM AI: {content}")
+        else:
+            response_for_log = content[:500] + "..." if len(content) > 500 else content
+            ai_logger.info(f"RECEIVED FROM AI (truncated): {response_for_log}")
+    
+    def prompt_budget(self, completion_tokens):
+        """Return a token budget for a prompt to this generator's model"""
+        return PromptBudget(self.model, completion_tokens, context_tokens=PROMPT_CONTEXT_TOKENS,
+                            max_input_tokens=PROMPT_MAX_INPUT_TOKENS)
+    
+    def profile_sections(self, resume_text, profile, resume_priority, resume_min_tokens=0):
+        """Prompt sections for the resume, portfolio and LinkedIn text
+        
+        Text over its budget keeps the chunks most relevant to the job description
+        (unless RELEVANCE_RANKING is off, in which case its end is cut off).
+        """
+        def trimmer(label, keep_first=False):
+            if not RELEVANCE_RANKING:
+                return None
+            return relevance_trimmer(self.job_description, model=self.model, keep_first=keep_first, label=label)
+        
+        return [
+            Section("resume", resume_text or profile.resume_text, priority=resume_priority,
+                    min_tokens=resume_min_tokens, max_tokens=PROMPT_RESUME_TOKENS, trim=trimmer("resume", keep_first=True)),
+            Section("portfolio", profile.portfolio_text, priority=4,
+                    max_tokens=PROMPT_PORTFOLIO_TOKENS, trim=trimmer("portfolio")),
+            Section("linkedin", profile.linkedin_text, priority=4,
+                    max_tokens=PROMPT_PORTFOLIO_TOKENS, trim=trimmer("LinkedIn"))
+        ]
+    
+    def log_prompt_sections(self, label, plan):
+        """Log the fitted prompt sections and the token split they were given"""
+        ai_logger.info(f"{label} - Prompt budget: {plan.summary()}")
+        for name, text in plan.texts.items():
+            title = name.replace("_", " ").title()
+            if AI_LOG_FULL_TEXT:
+                ai_logger.info(f"{label} - {title}: {text}")
+            else:
+                ai_logger.info(f"{label} - {title} (truncated): {text[:300]}...")
+    
+    def clean_ai_content(self, content):
+        """Remove any markdown code block formatting that might be present"""
+        content = re.sub(r'```html\s*', '', content)
+        content = re.sub(r'```\s*$', '', content)
+        return content
+    
+    def chat_messages(self, prompt, system_message, context=None):
+        """Chat messages for a prompt, with the shared context (if any) as its own message before it"""
+        messages = [{"role": "system", "content": system_message}]
+        if context:
+            messages.append({"role": "user", "content": context})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+    
+    def generate_ai_content(self, prompt, system_message="You are a helpful assistant.", max_tokens=4000, use_cache=True,
+                            context=None):
+        """Generate content using OpenAI API
+        
+        context is sent as a separate message before the prompt, so prompts sharing it
+        start with the same bytes (see resume_gen/prompts.py).
+        """
+        try:
+            self.log_prompt(prompt, system_message)
+            
+            content = self.chat_completion(
+                messages=self.chat_messages(prompt, system_message, context),
+                max_tokens=max_tokens,
+                temperature=0.7,
+                use_cache=use_cache
+            )
+            
+            self.log_response(content)
+            return self.clean_ai_content(content)
+        except Exception as e:
+            # Let callers fail the task instead of saving an error message as content
+            ai_logger.error(f"Error generating content: {e}")
+            raise
+    
+    def stream_ai_content(self, prompt, system_message="You are a helpful assistant.", max_tokens=4000, use_cache=True,
+                          context=None):
+        """Generate content using OpenAI API, yielding text chunks as they arrive
+        
+        The assembled response is cached under the same key as generate_ai_content,
+        so a cached result is yielded as a single chunk. Token usage is requested with
+        stream_options and read from the stream's final chunk.
+        """
+        self.log_prompt(prompt, system_message)
+        
+        messages = self.chat_messages(prompt, system_message, context)
+        cache_key = make_cache_key(self.model, messages, max_tokens, 0.7)
+        
+        # The span covers the whole stream, including time spent by the reader between chunks
+        with self.trace.span("llm_call", model=self.model, max_tokens=max_tokens, cache_hit=False, stream=True) as span:
+            if use_cache:
+                cached = llm_cache.get(cache_key)
+                if cached is not None:
+                    ai_logger.info(f"CACHE HIT - Key: {cache_key[:12]}")
+                    self.add_usage(cache_hits=1)
+                    span.set(cache_hit=True)
+                    yield cached
+                    return
+            
+            stream = self.get_client().create_chat_completion(
+                model=self.model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=0.7,
+                stream=True,
+                # Passed as extra_body: the pinned SDK predates the stream_options argument
+                extra_body={"stream_options": {"include_usage": True}}
+            )
+            self.add_usage(llm_calls=1)
+            
+            chunks = []
+            for chunk in stream:
+                usage = getattr(chunk, "usage", None)
+                if usage:
+                    self.record_token_usage(usage, span)
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    chunks.append(delta)
+                    yield delta
+        
+        content = "".join(chunks)
+        self.log_response(content)
+        llm_cache.set(cache_key, content, model=self.model)
+    
+    def build_shared_prompt(self, resume_text=None):
+        """Build the job and profile context shared by every document prompt of a resume variant
+        
+        Returns (context, plan). The sections are fitted once for the largest task, so the
+        resume and cover letter prompts start with the same bytes and provider prompt
+        caching can reuse them.
+        """
+        profile = self.current_user_profile or UserProfile()
+        
+        # Use extracted skills if available
+        skills = self.get_profile_skills(self.current_user_profile)
+        
+        longest_task = max((task_prompt(document) for document in DOCUMENT_MAX_TOKENS), key=len)
+        
+        def render(texts):
+            return render_context(texts, profile) + longest_task
+        
+        if COMBINED_GENERATION:
+            completion_tokens = DOCUMENT_MAX_TOKENS["documents"]
+        else:
+            completion_tokens = max(DOCUMENT_MAX_TOKENS["resume"], DOCUMENT_MAX_TOKENS["cover_letter"])
+        
+        # Fit the profile and job description into the model's context, trimming the least important first
+        plan = self.prompt_budget(completion_tokens).fit(SYSTEM_MESSAGE, render, [
+            Section("job_description", self.job_description, priority=2, min_tokens=400),
+            Section("skills", ", ".join(skills), priority=3, min_tokens=100)
+        ] + self.profile_sections(resume_text, profile, resume_priority=1, resume_min_tokens=600))
+        return render_context(plan.texts, profile), plan
+    
+    def build_prompt(self, document, resume_text=None):
+        """Build the system message, shared context, task prompt and token plan for a document
+        
+        document is "resume", "cover_letter" or "documents" (both in one JSON response).
+        """
+        context, plan = self.build_shared_prompt(resume_text)
+        plan.max_tokens = min(plan.max_tokens, DOCUMENT_MAX_TOKENS[document])
+        self.log_prompt_sections(f"{document.replace('_', ' ').upper()} GENERATION", plan)
+        return SYSTEM_MESSAGE, context, task_prompt(document), plan
+    
+    def wrap_resume_html(self, resume_content):
+        """Wrap generated resume content in a full HTML document if needed"""
+        # If the response doesn't include HTML, wrap it in basic HTML
+        if "<html" not in resume_content.lower() and "<body" not in resume_content.lower():
+            resume_content = f"""
+            <!DOCTYPE html>
+            <html>
+            <head>
+                <title>Tailored Resume</title>
+                <style>
+                    body {{ 
+                        font-family: Arial, Helvetica, sans-serif; 
+                        line-height: 1.6; 
+                        margin: 1em auto; 
+                        max-width: 800px;
+                        padding: 20px;
+                    }}
+                    h1, h2, h3 {{ 
+                        color: #2c3e50; 
+                        margin-top: 20px;
+                    }}
+                    h1 {{ 
+                        text-align: center; 
+                        font-size: 24px; 
+                        margin-bottom: 10px; 
+                    }}
+                    h2 {{ 
+                        font-size: 18px;
+                        border-bottom: 1px solid #eee; 
+                        padding-bottom: 5px; 
+                        margin-top: 20px;
+                    }}
+                    h3 {{ font-size: 16px; }}
+                    p {{ margin: 8px 0; }}
+                    ul {{ margin: 8px 0; padding-left: 25px; }}
+                    .section {{ margin-bottom: 20px; }}
+                    .job-title {{ 
+                        font-weight: bold; 
+                        margin-bottom: 5px; 
+                    }}
+                    .job-company {{ 
+                        font-weight: bold; 
+                        margin-bottom: 5px; 
+                    }}
+                    .job-dates {{ 
+                        font-style: italic; 
+                        color: #666; 
+                        margin-bottom: 5px; 
+                    }}
+                    @media print {{
+                        body {{ 
+                            margin: 0; 
+                            padding: 0.5in; 
+                            font-size: 12pt; 
+                        }}
+                        a {{ text-decoration: none; color: #000; }}
+                    }}
+                </style>
+            </head>
+            <body>
+            {resume_content}
+            </body>
+            </html>
+            """
+        return resume_content
+    
+    def generate_resume_content(self, resume_text=None):
+        """Generate a tailored resume based on user profile and job description
+        
+        resume_text selects a resume variant; it defaults to the profile's resume.
+        """
+        logger.info("Generating tailored resume content")
+        
+        with self.trace.span("build_prompt", document="resume") as span:
+            system_message, context, prompt, plan = self.build_prompt("resume", resume_text)
+            span.set(**plan.report())
+        
+        try:
+            resume_content = self.generate_ai_content(prompt, system_message, max_tokens=plan.max_tokens, context=context)
+            with self.trace.span("postprocess_html", document="resume"):
+                resume_content = self.wrap_resume_html(resume_content)
+            logger.info("Resume content generated successfully")
+            return resume_content
+        except Exception as e:
+            logger.error(f"Error generating resume content: {e}")
+            ai_logger.error(f"RESUME GENERATION ERROR: {e}")
+            raise
+    
+    def wrap_cover_letter_html(self, cover_letter):
+        """Wrap generated cover letter content in a full HTML document if needed"""
+        # If the response doesn't include HTML, wrap it in basic HTML
+        if "<html" not in cover_letter.lower() and "<body" not in cover_letter.lower():
+            cover_letter = f"""
+            <!DOCTYPE html>
+            <html>
+            <head>
+                <title>Cover Letter</title>
+                <style>
+                    body {{ 
+                        font-family: Arial, Helvetica, sans-serif; 
+                        line-height: 1.6; 
+                        margin: 1em auto; 
+                        max-width: 800px;
+                        padding: 20px;
+                    }}
+                    .header {{
+                        margin-bottom: 30px;
+                    }}
+                    .contact-info {{
+                        margin-bottom: 20px;
+                    }}
+                    .date {{ 
+                        margin-bottom: 20px; 
+                    }}
+                    .recipient {{
+                        margin-bottom: 20px;
+                    }}
+                    .greeting {{ 
+                        margin-bottom: 20px; 
+                    }}
+                    .body {{ 
+                        margin-bottom: 20px; 
+                    }}
+                    .body p {{ 
+                        margin-bottom: 15px; 
+                    }}
+                    .closing {{ 
+                        margin-bottom: 10px; 
+                    }}
+                    .signature {{ 
+                        margin-top: 30px; 
+                        font-weight: bold; 
+                    }}
+                    @media print {{
+                        body {{ 
+                            margin: 0; 
+                            padding: 0.5in; 
+                            font-size: 12pt; 
+                        }}
+                    }}
+                </style>
+            </head>
+            <body>
+            <div class="header">
+                <div class="contact-info">
+                    {self.current_user_profile.full_name}<br>
+                    {self.current_user_profile.address if hasattr(self.current_user_profile, 'address') else '123 Main St'}<br>
+                    {self.current_user_profile.email if hasattr(self.current_user_profile, 'email') else 'example@email.com'}<br>
+                    {self.current_user_profile.phone if hasattr(self.current_user_profile, 'phone') else '(123) 456-7890'}
+                </div>
+                <div class="date">{datetime.now().strftime("%B %d, %Y")}</div>
+                <div class="recipient">
+                    {self.company_name}<br>
+                    Hiring Manager
+                </div>
+            </div>
+            <div class="greeting">Dear Hiring Manager,</div>
+            <div class="body">
+            {cover_letter}
+            </div>
+            <div class="closing">Sincerely,</div>
+            <div class="signature">{self.current_user_profile.full_name}</div>
+            </body>
+            </html>
+            """
+        return cover_letter
+    
+    def generate_cover_letter(self, resume_text=None):
+        """Generate a cover letter based on user profile and job description
+        
+        resume_text selects a resume variant; it defaults to the profile's resume.
+        """
+        logger.info("Generating cover letter")
+        
+        with self.trace.span("build_prompt", document="cover_letter") as span:
+            system_message, context, prompt, plan = self.build_prompt("cover_letter", resume_text)
+            span.set(**plan.report())
+        
+        try:
+            cover_letter = self.generate_ai_content(prompt, system_message, max_tokens=plan.max_tokens, context=context)
+            with self.trace.span("postprocess_html", document="cover_letter"):
+                cover_letter = self.wrap_cover_letter_html(cover_letter)
+            logger.info("Cover letter generated successfully")
+            return cover_letter
+        except Exception as e:
+            logger.error(f"Error generating cover letter: {e}")
+            ai_logger.error(f"COVER LETTER GENERATION ERROR: {e}")
+            raise
+    
+    def generate_documents(self, resume_text=None):
+        """Generate the resume and cover letter in one completion returning both as JSON
+        
+        Returns (resume_html, cover_letter_html), or None if the response isn't usable,
+        in which case the caller generates the documents separately.
+        """
+        logger.info("Generating resume and cover letter in one request")
+        
+        with self.trace.span("build_prompt", document="documents") as span:
+            system_message, context, prompt, plan = self.build_prompt("documents", resume_text)
+            span.set(**plan.report())
+        
+        content = self.generate_ai_content(prompt, system_message, max_tokens=plan.max_tokens, context=context)
+        documents = parse_documents(content)
+        if documents is None:
+            logger.warning("Combined response didn't contain both documents as JSON; generating them separately")
+            ai_logger.warning("DOCUMENTS GENERATION - Response wasn't a JSON object with both documents")
+            return None
+        
+        resume_html, cover_letter_html = documents
+        with self.trace.span("postprocess_html", document="documents"):
+            resume_html = self.wrap_resume_html(resume_html)
+            cover_letter_html = self.wrap_cover_letter_html(cover_letter_html)
+        logger.info("Resume and cover letter generated successfully")
+        return resume_html, cover_letter_html
+    
+    def create_application_folder(self):
+        """Create a folder for the job application"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # The name may come from user input (CLI, batch files, web forms); it is also used in file names
+        self.company_name = safe_company_name(self.company_name)
+        base_folder_name = self.company_name
+        folder_name = os.path.join(self.output_folder, f"{base_folder_name}_{timestamp}")
+        
+        # Ensure the folder name is unique
+        os.makedirs(folder_name, exist_ok=True)
+        get_application_manifest(self.output_folder).record(folder_name, company=self.company_name)
+        logger.info(f"Created application folder: {folder_name}")
+        return folder_name
+    
+    def record_application_files(self, folder_path):
+        """Update the application manifest with the files now in an application folder"""
+        try:
+            files = [f for f in os.listdir(folder_path) if os.path.isfile(os.path.join(folder_path, f))]
+            get_application_manifest(self.output_folder).record(folder_path, files=files)
+        except Exception as e:
+            logger.error(f"Error updating application manifest for {folder_path}: {e}")
+    
+    def convert_html_to_pdf(self, html_path, pdf_path):
+        """Convert HTML file to PDF using browser printing
+        
+        This is a placeholder method - the actual PDF conversion happens in the browser
+        with the print button. This method simply logs the action and returns the paths.
+        """
+        logger.info(f"HTML file ready for printing: {html_path}")
+        logger.info(f"Recommended PDF path: {pdf_path}")
+        return html_path, pdf_path
+    
+    def add_print_button(self, html):
+        """Inject the print / save-as-PDF button and its CSS into a generated document"""
+        # Add print button HTML
+        if "<body>" in html:
+            html = html.replace("<body>", f"<body>\n{PRINT_BUTTON_HTML}")
+        elif "<style>" in html:
+            html = html.replace("</style>", f"</style>\n{PRINT_BUTTON_HTML}")
+        else:
+            html = f"{PRINT_BUTTON_HTML}\n{html}"
+        
+        # Add print button CSS
+        if "<style>" in html:
+            html = html.replace("</style>", f"{PRINT_BUTTON_CSS}\n</style>")
+        else:
+            html = f"<style>{PRINT_BUTTON_CSS}</style>\n{html}"
+        return html
+    
+    def save_document(self, document, index, html, folder_path):
+        """Add the print button to a generated document and save it; returns its HTML and PDF filenames"""
+        with self.trace.span("postprocess_html", document=document):
+            html = self.add_print_button(html)
+        
+        base_filename = f"{document.title()}_{index+1}_{self.company_name}"
+        html_path = os.path.join(folder_path, f"{base_filename}.html")
+        with open(html_path, "w", encoding="utf-8") as f:
+            f.write(html)
+        
+        self.convert_html_to_pdf(html_path, os.path.join(folder_path, f"{base_filename}.pdf"))
+        return f"{base_filename}.html", f"{base_filename}.pdf"
+    
+    def write_resume(self, index, resume_text, folder_path):
+        """Generate and save the tailored resume for one resume variant"""
+        with self.trace.span("generate_resume", variant=index + 1):
+            return self.save_document("resume", index, self.generate_resume_content(resume_text), folder_path)
+    
+    def write_cover_letter(self, index, resume_text, folder_path):
+        """Generate and save the cover letter for one resume variant"""
+        with self.trace.span("generate_cover_letter", variant=index + 1):
+            return self.save_document("cover_letter", index, self.generate_cover_letter(resume_text), folder_path)
+    
+    def write_documents(self, index, resume_text, folder_path):
+        """Generate both documents of one resume variant in a single call and save them
+        
+        Returns {"resume": filenames, "cover_letter": filenames}. Falls back to one call
+        per document when the combined response can't be used.
+        """
+        with self.trace.span("generate_documents", variant=index + 1):
+            documents = self.generate_documents(resume_text)
+            if documents is None:
+                return {
+                    "resume": self.write_resume(index, resume_text, folder_path),
+                    "cover_letter": self.write_cover_letter(index, resume_text, folder_path)
+                }
+            resume_html, cover_letter_html = documents
+            return {
+                "resume": self.save_document("resume", index, resume_html, folder_path),
+                "cover_letter": self.save_document("cover_letter", index, cover_letter_html, folder_path)
+            }
+    
+    def process_job_application(self, max_workers=None, task_timeout=None):
+        """Process job application by generating tailored resumes and cover letters
+        
+        The resume and cover letter of every resume variant are generated concurrently
+        on a bounded thread pool. Set max_workers to 1 to run them one after another.
+        With COMBINED_GENERATION, each variant's documents come from a single call.
+        
+        Each task's task_timeout counts from its submission, extended by one timeout per
+        round of tasks queued ahead of it when there are more tasks than workers. Timed-out
+        tasks are reported as errors but not cancelled: a running thread can't be stopped,
+        so it may still finish and write its file after the run has been recorded.
+        The result is an error when no document could be generated.
+        The result includes the run's trace: the duration of every stage and LLM call.
+        """
+        with self.trace.span("process_job_application") as span:
+            result = self._process_job_application(max_workers, task_timeout)
+            span.set(status="failed" if "error" in result else "done")
+        logger.info(f"Stage timings: {self.trace.summary()}")
+        result["trace"] = self.trace.to_dict()
+        return result
+    
+    def _process_job_application(self, max_workers, task_timeout):
+        if not self.job_description or not self.resume_texts:
+            return {"error": "Job description and at least one resume are required."}
+        
+        max_workers = max(1, max_workers or GENERATION_MAX_WORKERS)
+        task_timeout = task_timeout or GENERATION_TASK_TIMEOUT
+        start_time = time.perf_counter()
+        folder_path = None
+        
+        try:
+            # Extract company name from job description
+            logger.info("Extracting company name from job description")
+            company_name = self.extract_company_name()
+            self.company_name = company_name
+            
+            # Create application folder
+            folder_path = self.create_application_folder()
+            logger.info(f"Created application folder: {folder_path}")
+            
+            # Analyze job requirements
+            logger.info("Analyzing job requirements")
+            
+            # Resolve skills once up front so parallel tasks don't race to extract them
+            logger.info("Extracting skills from user profile data")
+            self.get_profile_skills(self.current_user_profile)
+            
+            logger.info(f"Generating documents for {len(self.resume_texts)} resume(s) with up to {max_workers} parallel task(s)")
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="generate")
+            futures = []
+            try:
+                if COMBINED_GENERATION:
+                    tasks = [("documents", self.write_documents)]
+                else:
+                    tasks = [("resume", self.write_resume), ("cover_letter", self.write_cover_letter)]
+                submitted_at = time.monotonic()
+                for i, resume_text in enumerate(self.resume_texts):
+                    variant_futures = []
+                    for kind, write in tasks:
+                        # Tasks queued behind a full pool get one more timeout per round they wait
+                        rounds = 1 + (i * len(tasks) + len(variant_futures)) // max_workers
+                        deadline = submitted_at + rounds * task_timeout
+                        future = executor.submit(self.trace.wrap(write), i, resume_text, folder_path)
+                        variant_futures.append((kind, future, deadline))
+                    futures.append(variant_futures)
+                
+                results = []
+                for i, variant_futures in enumerate(futures):
+                    result = {}
+                    for kind, future, deadline in variant_futures:
+                        try:
+                            filenames = future.result(timeout=max(0, deadline - time.monotonic()))
+                            if kind != "documents":
+                                filenames = {kind: filenames}
+                            for document, (html_filename, pdf_filename) in filenames.items():
+                                result[f"{document}_html"] = html_filename
+                                result[f"{document}_pdf"] = pdf_filename
+                        except FuturesTimeoutError:
+                            # Only a task that hasn't started can be cancelled; a running one carries on
+                            future.cancel()
+                            logger.error(f"Timed out generating {kind} {i+1} after {task_timeout} seconds")
+                            result.setdefault("errors", []).append(f"{kind} timed out")
+                        except Exception as e:
+                            logger.error(f"Error generating {kind} {i+1}: {e}")
+                            result.setdefault("errors", []).append(f"{kind} failed: {e}")
+                    results.append(result)
+            finally:
+                # Don't block the request on tasks that already timed out
+                for variant_futures in futures:
+                    for kind, future, deadline in variant_futures:
+                        future.cancel()
+                executor.shutdown(wait=False)
+            
+            self.record_application_files(folder_path)
+            if not any(key.endswith("_html") for result in results for key in result):
+                errors = "; ".join(error for result in results for error in result.get("errors", []))
+                error = f"No documents were generated: {errors or 'unknown error'}"
+                logger.error(error)
+                self.record_history(folder_path, results, time.perf_counter() - start_time, error=error)
+                return {"error": error, "folder": folder_path, "company": self.company_name, "results": results}
+            
+            self.record_history(folder_path, results, time.perf_counter() - start_time)
+            logger.info("Document generation complete!")
+            return {
+                "success": True,
+                "folder": folder_path,
+                "company": self.company_name,
+                "results": results
+            }
+            
+        except Exception as e:
+            logger.error(f"Error processing job application: {e}")
+            self.record_history(folder_path, [], time.perf_counter() - start_time, error=str(e))
+            return {"error": f"Error processing job application: {str(e)}"}
+    
+    def record_history(self, folder_path, results, latency_seconds, error=None):
+        """Store a run of process_job_application in the application history"""
+        try:
+            output_paths = []
+            contents = []
+            for result in results:
+                for key in ("resume_html", "cover_letter_html"):
+                    if not result.get(key):
+                        continue
+                    file_path = os.path.join(folder_path, result[key])
+                    output_paths.append(file_path)
+                    with open(file_path, "r", encoding="utf-8") as f:
+                        contents.append(html_to_text(f.read()))
+            
+            application_history.record(
+                company=self.company_name or None,
+                job_description=self.job_description,
+                job_description_hash=self.job.hash,
+                profile_folder=self.current_user_profile.folder_name if self.current_user_profile else None,
+                model=self.model,
+                usage=self.usage,
+                latency_seconds=round(latency_seconds, 3),
+                folder=folder_path,
+                output_paths=output_paths,
+                content="\n\n".join(contents),
+                status="failed" if error else "done",
+                error=error
+            )
+        except Exception as e:
+            logger.error(f"Error recording application history: {e}")
+    
+    def stream_application(self, resume_index=0):
+        """Generate the resume and cover letter for one resume variant, yielding progress events
+        
+        Yields (event, data) tuples: "started" straight away, before the company name and
+        skills are extracted, "document" when a document starts, "token" for each chunk of
+        generated text, "saved" once its HTML file is written and finally "complete".
+        Documents are always streamed one call each (COMBINED_GENERATION doesn't apply), but
+        share their prompt prefix. The run is recorded in the application history like
+        process_job_application's, as failed if it raises or the stream is closed early.
+        """
+        if not self.job_description or not self.resume_texts:
+            raise ValueError("Job description and at least one resume are required.")
+        if not 0 <= resume_index < len(self.resume_texts):
+            raise ValueError(f"Resume {resume_index + 1} is not loaded.")
+        resume_text = self.resume_texts[resume_index]
+        start_time = time.perf_counter()
+        folder_path = None
+        result = {}
+        
+        # Give the client its first byte before the slower extraction calls
+        yield "started", {"variant": resume_index + 1}
+        
+        try:
+            logger.info("Extracting company name from job description")
+            self.company_name = self.extract_company_name()
+            folder_path = self.create_application_folder()
+            
+            documents = [
+                ("resume", f"Resume_{resume_index+1}_{self.company_name}.html", self.wrap_resume_html),
+                ("cover_letter", f"Cover_Letter_{resume_index+1}_{self.company_name}.html", self.wrap_cover_letter_html)
+            ]
+            
+            for kind, filename, wrap_html in documents:
+                yield "document", {"document": kind}
+                
+                with self.trace.span("build_prompt", document=kind) as span:
+                    system_message, context, prompt, plan = self.build_prompt(kind, resume_text)
+                    span.set(**plan.report())
+                chunks = []
+                for chunk in self.stream_ai_content(prompt, system_message, max_tokens=plan.max_tokens, context=context):
+                    chunks.append(chunk)
+                    yield "token", {"document": kind, "text": chunk}
+                
+                # Assemble and save the document once the stream has finished
+                with self.trace.span("postprocess_html", document=kind):
+                    html = self.add_print_button(wrap_html(self.clean_ai_content("".join(chunks))))
+                with open(os.path.join(folder_path, filename), "w", encoding="utf-8") as f:
+                    f.write(html)
+                self.record_application_files(folder_path)
+                result[f"{kind}_html"] = filename
+                logger.info(f"Saved streamed {kind.replace('_', ' ')}: {filename}")
+                
+                yield "saved", {"document": kind, "folder": os.path.basename(folder_path), "filename": filename}
+        except GeneratorExit:
+            # The client went away mid-stream
+            self.record_history(folder_path, [result], time.perf_counter() - start_time,
+                                error="Stream closed before the documents were finished")
+            raise
+        except Exception as e:
+            self.record_history(folder_path, [result], time.perf_counter() - start_time, error=str(e))
+            raise
+        
+        self.record_history(folder_path, [result], time.perf_counter() - start_time)
+        
+        logger.info("Document generation complete!")
+        yield "complete", {"folder": folder_path, "company": self.company_name, "stages": self.trace.stages()}
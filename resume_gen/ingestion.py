@@ -0,0 +1,140 @@
+"""
+Text extraction for uploaded documents, with optional process-pool parallelism.
+
+PyMuPDF parsing is CPU-bound, so batches of PDFs are parsed in worker processes.
+Results always come back in the order the files were given.
+"""
+
+import os
+import time
+import logging
+
+from .extraction_cache import file_sha256
+
+logger = logging.getLogger(__name__)
+
+
+def parse_pdf_text(pdf_path):
+    """Extract the text of every page of a PDF"""
+    import fitz  # PyMuPDF
+
+    with fitz.open(pdf_path) as doc:
+        return "".join(page.get_text() for page in doc)
+
+
+def _timed_parse_pdf(pdf_path):
+    """Parse a PDF in a worker process, returning (text, seconds)"""
+    start = time.perf_counter()
+    text = parse_pdf_text(pdf_path)
+    return text, time.perf_counter() - start
+
+
+def extract_texts(file_paths, cache=None, executor=None, timeout=None):
+    """Extract text from a batch of uploaded files
+
+    PDFs not found in the cache are parsed on the executor when more than one
+    needs parsing; everything else is read in the calling process. Returns one
+    dict per file, in input order, with the text, seconds spent, whether the
+    cache was used and an error message if extraction failed.
+    """
+    results = []
+    pending = []  # PDFs that still need parsing: (result, digest, file_path)
+
+    for file_path in file_paths:
+        result = {
+            "filename": os.path.basename(file_path),
+            "text": "",
+            "seconds": 0.0,
+            "cached": False,
+            "error": None
+        }
+        results.append(result)
+        start = time.perf_counter()
+
+        try:
+            if not file_path.lower().endswith('.pdf'):
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    result["text"] = f.read()
+                result["seconds"] = time.perf_counter() - start
+                continue
+
+            digest = file_sha256(file_path)
+            cached = cache.get(digest) if cache else None
+            if cached is not None:
+                result["text"] = cached
+                result["cached"] = True
+                result["seconds"] = time.perf_counter() - start
+                continue
+
+            pending.append((result, digest, file_path))
+        except Exception as e:
+            result["error"] = str(e)
+            result["seconds"] = time.perf_counter() - start
+
+    if not pending:
+        return results
+
+    use_pool = executor is not None and len(pending) > 1
+    futures = [executor.submit(_timed_parse_pdf, file_path) if use_pool else None
+               for _, _, file_path in pending]
+
+    for (result, digest, file_path), future in zip(pending, futures):
+        try:
+            if future is None:
+                text, seconds = _timed_parse_pdf(file_path)
+            else:
+                text, seconds = future.result(timeout=timeout)
+            result["text"] = text
+            result["seconds"] = seconds
+            if cache:
+                cache.set(digest, text)
+        except Exception as e:
+            logger.error(f"Error extracting text from {result['filename']}: {e}")
+            result["error"] = str(e) or e.__class__.__name__
+
+    return results
+
+
+def analyze_style(pdf_path, max_pages=1):
+    """Collect fonts, font sizes, page dimensions and margins from a PDF in one pass
+
+    Only the first max_pages pages are read (all pages if max_pages is None or 0).
+    Margins and dimensions come from the first page.
+    """
+    import fitz  # PyMuPDF
+
+    style = {}
+    fonts = set()
+    sizes = set()
+
+    with fitz.open(pdf_path) as doc:
+        if doc.page_count == 0:
+            return style
+        page_count = min(doc.page_count, max_pages) if max_pages else doc.page_count
+
+        for page_number in range(page_count):
+            page = doc[page_number]
+            blocks = page.get_text("dict")["blocks"]
+            for b in blocks:
+                for l in b.get("lines", []):
+                    for s in l["spans"]:
+                        fonts.add(s["font"])
+                        sizes.add(round(s["size"], 1))
+
+            if page_number == 0:
+                # Extract page dimensions
+                style["width"] = page.rect.width
+                style["height"] = page.rect.height
+
+                # Extract margins (approximate)
+                if blocks:
+                    style["margins"] = {
+                        "left": min(b["bbox"][0] for b in blocks),
+                        "right": min(page.rect.width - b["bbox"][2] for b in blocks),
+                        "top": min(b["bbox"][1] for b in blocks),
+                        "bottom": min(page.rect.height - b["bbox"][3] for b in blocks)
+                    }
+
+    style["fonts"] = sorted(fonts)
+    style["font_sizes"] = sorted(sizes)
+    return style
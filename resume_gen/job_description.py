@@ -0,0 +1,118 @@
+"""
+Job description value object and a local company-name heuristic.
+
+A JobDescription carries the text, its content hash and anything derived from
+it (such as the company name) so each derivation runs once per description.
+"""
+
+import re
+import hashlib
+from collections import defaultdict
+
+# Words that commonly follow "About"/"at"/"join" but aren't company names
+_STOPWORDS = {
+    "a", "an", "the", "our", "us", "you", "your", "we", "this", "that", "role", "job",
+    "position", "company", "team", "opportunity", "opportunities", "work", "home",
+    "least", "all", "times", "scale", "the role", "the job", "the team", "the company",
+    "the position", "what", "who", "how", "why", "when", "where", "remote", "hybrid"
+}
+
+# Job posting section titles that show up as "About <Section>" headings
+_SECTION_HEADINGS = {
+    "benefits", "compensation", "perks", "salary", "pay", "requirements", "responsibilities",
+    "qualifications", "skills", "experience", "education", "location", "culture", "values",
+    "mission", "overview", "summary", "description", "details", "role", "position", "the",
+    "our", "&", "and", "of"
+}
+
+_NAME = r"([A-Z][\w&.'\-]*(?:[ \t]+(?:[A-Z][\w&.'\-]*|&|of|and)){0,4})"
+
+# (pattern, weight) - labelled fields and headings are stronger evidence than prose
+_STRONG_WEIGHT = 2
+_ABOUT_HEADING = re.compile(r"^[ \t]*About[ \t]+" + _NAME + r"[ \t]*:?[ \t]*$", re.MULTILINE)
+_PATTERNS = [
+    (re.compile(r"^[ \t]*(?:Company|Company Name|Employer|Organi[sz]ation|Hiring Company)[ \t]*[:\-][ \t]*(.+?)[ \t]*$",
+                re.MULTILINE | re.IGNORECASE), 3),
+    (_ABOUT_HEADING, 2),
+    (re.compile(r"\b(?:[Aa]t|[Jj]oin|[Jj]oining)[ \t]+" + _NAME + r"(?=[,.!;:\s])"), 1),
+    (re.compile(_NAME + r"[ \t]+(?:is|are)[ \t]+(?:hiring|looking for|seeking)\b"), 1),
+]
+
+
+def _clean_candidate(candidate):
+    candidate = candidate.strip().strip(".,;:!-").strip()
+    if not candidate or len(candidate) > 60 or len(candidate.split()) > 5:
+        return None
+    if candidate.lower() in _STOPWORDS or candidate.split()[0].lower() in _STOPWORDS:
+        return None
+    return candidate
+
+
+def _is_section_heading(candidate):
+    """True for "About Benefits", "About Benefits & Perks" and similar posting sections"""
+    return all(word.lower() in _SECTION_HEADINGS for word in candidate.split())
+
+
+def guess_company_name(text, min_score=2):
+    """Guess the company name from common job posting phrasing
+
+    Returns the name only when it comes from a labelled "Company:" field or an
+    "About <Company>" heading; weaker patterns ("at <Company>", "<Company> is
+    hiring") only add to its score, since prose such as "experience at Amazon"
+    often names other companies. Otherwise returns None so the caller can fall
+    back to the LLM.
+    """
+    if not text:
+        return None
+
+    scores = defaultdict(int)
+    strong = set()
+    for pattern, weight in _PATTERNS:
+        for match in pattern.finditer(text[:5000]):
+            candidate = _clean_candidate(match.group(1))
+            if not candidate or (pattern is _ABOUT_HEADING and _is_section_heading(candidate)):
+                continue
+            scores[candidate] += weight
+            if weight >= _STRONG_WEIGHT:
+                strong.add(candidate)
+
+    if not scores:
+        return None
+
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    best, best_score = ranked[0]
+    if best_score < min_score or best not in strong:
+        return None
+    if len(ranked) > 1 and ranked[1][1] == best_score:
+        return None  # ambiguous
+    return best
+
+
+def safe_company_name(name):
+    """Return a company name safe to use in folder and file names ("Unknown_Company" if empty)
+
+    Keeps word characters, spaces and hyphens, with spaces turned into
+    underscores, so names from postings, the LLM or user input can't contain
+    path separators or "..".
+    """
+    name = re.sub(r'[^\w\s-]', '', name or "")  # Remove special chars
+    name = re.sub(r'\s+', '_', name.strip())    # Replace spaces with underscores
+    name = re.sub(r'_+', '_', name)             # Replace multiple underscores with single
+    if not name or name.lower() in ("unknown", "unknown_company"):
+        return "Unknown_Company"
+    return name
+
+
+class JobDescription:
+    """A job description with its content hash and memoized derived fields"""
+
+    def __init__(self, text=""):
+        self.text = text or ""
+        self.hash = hashlib.sha256(self.text.encode("utf-8")).hexdigest()
+        self.company_name = None
+
+    def __eq__(self, other):
+        return isinstance(other, JobDescription) and self.hash == other.hash
+
+    def __hash__(self):
+        return hash(self.hash)
@@ -0,0 +1,233 @@
+"""
+Persistent background job queue backed by SQLite.
+
+Jobs are stored in a local SQLite database and executed by worker threads, so
+long-running document generation doesn't hold a web request open. Finished and
+failed jobs stay in the database and remain visible after a restart.
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+import logging
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+class JobQueue:
+    """SQLite-backed job queue with a pool of worker threads"""
+
+    def __init__(self, db_path, num_workers=2, poll_interval=1.0, stale_after=60):
+        self.db_path = db_path
+        self.num_workers = max(1, num_workers)
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._handlers = {}
+        self._threads = []
+        self._started = False
+        self._start_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+
+        db_folder = os.path.dirname(self.db_path)
+        if db_folder:
+            os.makedirs(db_folder, exist_ok=True)
+        self._init_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    payload TEXT,
+                    result TEXT,
+                    error TEXT,
+                    owner TEXT,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL,
+                    heartbeat_at REAL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at)")
+
+    def register(self, kind, handler):
+        """Register the function that runs jobs of a given kind
+
+        The handler receives the job payload and returns a JSON-serializable result.
+        Raising an exception marks the job as failed.
+        """
+        self._handlers[kind] = handler
+
+    def submit(self, kind, payload):
+        """Add a job to the queue and return its ID"""
+        job_id = uuid.uuid4().hex
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, status, payload, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, kind, STATUS_QUEUED, json.dumps(payload), time.time())
+            )
+        logger.info(f"Queued {kind} job {job_id}")
+        self.start()
+        self._wakeup.set()
+        return job_id
+
+    def get(self, job_id):
+        """Return a job as a dict, or None if it doesn't exist"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_dict(row) if row else None
+
+    def list_jobs(self, limit=50):
+        """Return the most recent jobs, newest first"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [self._row_to_dict(row, include_payload=False) for row in rows]
+
+    def counts(self):
+        """Return the number of jobs in each status"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def _row_to_dict(self, row, include_payload=True):
+        job = {
+            "id": row["id"],
+            "kind": row["kind"],
+            "status": row["status"],
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error"],
+            "created_at": row["created_at"],
+            "started_at": row["started_at"],
+            "finished_at": row["finished_at"]
+        }
+        if include_payload:
+            job["payload"] = json.loads(row["payload"]) if row["payload"] else None
+        return job
+
+    def start(self):
+        """Start the worker threads (idempotent)"""
+        with self._start_lock:
+            if self._started:
+                return
+            self._started = True
+
+        self._fail_stale_jobs()
+        for i in range(self.num_workers):
+            thread = threading.Thread(target=self._worker_loop, name=f"job-worker-{i+1}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        heartbeat = threading.Thread(target=self._heartbeat_loop, name="job-heartbeat", daemon=True)
+        heartbeat.start()
+        self._threads.append(heartbeat)
+        logger.info(f"Started {self.num_workers} job worker(s)")
+
+    def stop(self):
+        """Signal the worker threads to exit after their current job"""
+        self._stop.set()
+        self._wakeup.set()
+
+    def _fail_stale_jobs(self):
+        """Mark running jobs whose worker stopped heartbeating as failed"""
+        cutoff = time.time() - self.stale_after
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? "
+                "WHERE status = ? AND COALESCE(heartbeat_at, started_at, created_at) < ?",
+                (STATUS_FAILED, "Job was interrupted before it finished", time.time(), STATUS_RUNNING, cutoff)
+            )
+        if cursor.rowcount:
+            logger.warning(f"Marked {cursor.rowcount} interrupted job(s) as failed")
+
+    def _claim_next(self):
+        """Atomically move the oldest queued job to running and return it"""
+        conn = self._connect()
+        conn.isolation_level = None  # manage the transaction explicitly
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1", (STATUS_QUEUED,)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            now = time.time()
+            conn.execute(
+                "UPDATE jobs SET status = ?, owner = ?, started_at = ?, heartbeat_at = ? WHERE id = ?",
+                (STATUS_RUNNING, self.owner, now, now, row["id"])
+            )
+            conn.execute("COMMIT")
+            return self._row_to_dict(row)
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _complete(self, job_id, status, result=None, error=None):
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?",
+                (status, json.dumps(result) if result is not None else None, error, time.time(), job_id)
+            )
+
+    def _worker_loop(self):
+        while not self._stop.is_set():
+            try:
+                job = self._claim_next()
+            except sqlite3.Error as e:
+                logger.error(f"Error claiming job: {e}")
+                job = None
+
+            if job is None:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+
+            handler = self._handlers.get(job["kind"])
+            if handler is None:
+                self._complete(job["id"], STATUS_FAILED, error=f"No handler registered for job kind: {job['kind']}")
+                continue
+
+            logger.info(f"Running {job['kind']} job {job['id']}")
+            try:
+                result = handler(job["payload"])
+                self._complete(job["id"], STATUS_DONE, result=result)
+                logger.info(f"Job {job['id']} finished")
+            except Exception as e:
+                logger.error(f"Job {job['id']} failed: {e}")
+                self._complete(job["id"], STATUS_FAILED, error=str(e))
+
+    def _heartbeat_loop(self):
+        interval = max(1.0, self.stale_after / 4)
+        while not self._stop.wait(interval):
+            try:
+                with self._connect() as conn:
+                    conn.execute(
+                        "UPDATE jobs SET heartbeat_at = ? WHERE status = ? AND owner = ?",
+                        (time.time(), STATUS_RUNNING, self.owner)
+                    )
+                self._fail_stale_jobs()
+            except sqlite3.Error as e:
+                logger.error(f"Error updating job heartbeat: {e}")
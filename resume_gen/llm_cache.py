@@ -0,0 +1,183 @@
+"""
+Content-addressed, on-disk cache for chat completion responses.
+
+Entries are keyed by a SHA-256 hash of the request (model, messages, max_tokens,
+temperature) so an identical request made later - or by another process - is
+answered from disk instead of the OpenAI API.
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(model, messages, max_tokens, temperature):
+    """Build a stable hash for a chat completion request"""
+    payload = json.dumps(
+        {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        },
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Persistent response cache with size- and age-based eviction"""
+
+    def __init__(self, folder, max_bytes=50 * 1024 * 1024, max_age_seconds=7 * 24 * 3600, enabled=True):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._index = None  # key -> (size, created_at), loaded lazily
+
+    def _path(self, key):
+        return os.path.join(self.folder, f"{key}.json")
+
+    def _load_index(self):
+        """Build the in-memory index from the cache folder (once per process)"""
+        if self._index is not None:
+            return
+        self._index = {}
+        if not os.path.exists(self.folder):
+            return
+        for filename in os.listdir(self.folder):
+            if not filename.endswith(".json"):
+                continue
+            file_path = os.path.join(self.folder, filename)
+            try:
+                stat = os.stat(file_path)
+                self._index[filename[:-5]] = (stat.st_size, stat.st_mtime)
+            except OSError:
+                continue
+
+    def _remove(self, key):
+        self._index.pop(key, None)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _is_expired(self, created_at, now=None):
+        if not self.max_age_seconds:
+            return False
+        return (now or time.time()) - created_at > self.max_age_seconds
+
+    def get(self, key):
+        """Return the cached content for a key, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            self._load_index()
+            entry = self._index.get(key)
+            if entry is None:
+                # Another process may have written it since the index was loaded
+                try:
+                    stat = os.stat(self._path(key))
+                except OSError:
+                    self.misses += 1
+                    return None
+                entry = self._index[key] = (stat.st_size, stat.st_mtime)
+
+            if self._is_expired(entry[1]):
+                self._remove(key)
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            try:
+                with open(self._path(key), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Discarding unreadable LLM cache entry {key}: {e}")
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return data.get("content")
+
+    def set(self, key, content, model=None):
+        """Store content for a key and evict old entries if over budget"""
+        if not self.enabled or content is None:
+            return
+
+        now = time.time()
+        data = {
+            "created_at": now,
+            "model": model,
+            "content": content
+        }
+        serialized = json.dumps(data, ensure_ascii=False)
+
+        with self._lock:
+            self._load_index()
+            file_path = self._path(key)
+            tmp_path = f"{file_path}.tmp"
+            try:
+                os.makedirs(self.folder, exist_ok=True)
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(serialized)
+                os.replace(tmp_path, file_path)
+            except OSError as e:
+                logger.warning(f"Could not write LLM cache entry {key}: {e}")
+                return
+
+            self._index[key] = (len(serialized.encode("utf-8")), now)
+            self._evict(now)
+
+    def _evict(self, now):
+        """Drop expired entries, then the oldest ones until under max_bytes"""
+        for key, (_, created_at) in list(self._index.items()):
+            if self._is_expired(created_at, now):
+                self._remove(key)
+                self.evictions += 1
+
+        if not self.max_bytes:
+            return
+
+        total = sum(size for size, _ in self._index.values())
+        if total <= self.max_bytes:
+            return
+
+        for key, (size, _) in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            self._remove(key)
+            self.evictions += 1
+            total -= size
+
+    def clear(self):
+        """Remove every cached entry"""
+        with self._lock:
+            self._load_index()
+            for key in list(self._index):
+                self._remove(key)
+
+    def stats(self):
+        """Return hit/miss counters and current cache size"""
+        with self._lock:
+            self._load_index()
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._index),
+                "bytes": sum(size for size, _ in self._index.values())
+            }
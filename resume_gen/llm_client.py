@@ -0,0 +1,253 @@
+"""
+Shared OpenAI client with connection pooling, retries and a circuit breaker.
+
+One client per process (and API key) keeps HTTP connections alive between
+calls instead of opening a new connection and TLS session for every request.
+Rate-limit and server errors are retried with exponential backoff and full
+jitter. After repeated failures the circuit breaker fails calls immediately for
+a cool-down period instead of letting every request wait for a full timeout.
+"""
+
+import os
+import time
+import random
+import logging
+import threading
+
+from .rate_limit import estimate_tokens, RateLimitTimeout
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+# openai exception types raised without an HTTP status (network errors, timeouts)
+RETRYABLE_ERROR_NAMES = {"APIConnectionError", "APITimeoutError"}
+
+
+class LLMUnavailableError(Exception):
+    """The API could not be reached: retries were exhausted or the circuit is open"""
+
+
+def is_retryable(error):
+    """Return True for rate limits, server errors, timeouts and connection failures"""
+    status_code = getattr(error, "status_code", None)
+    if status_code is not None:
+        return status_code in RETRYABLE_STATUS_CODES or status_code >= 500
+    return type(error).__name__ in RETRYABLE_ERROR_NAMES
+
+
+def retry_after_seconds(error):
+    """Return the server's Retry-After delay in seconds, if it sent one"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _usage_field(usage, name):
+    if isinstance(usage, dict):
+        # Older SDK versions keep fields they don't know as plain dicts
+        return usage.get(name)
+    return getattr(usage, name, None)
+
+
+def cached_prompt_tokens(usage):
+    """Return the prompt tokens the provider served from its prompt cache (0 if not reported)"""
+    return _usage_field(_usage_field(usage, "prompt_tokens_details"), "cached_tokens") or 0
+
+
+def usage_tokens(usage):
+    """Return (prompt_tokens, completion_tokens, cached_prompt_tokens) from a usage report (0 if not reported)"""
+    return (_usage_field(usage, "prompt_tokens") or 0, _usage_field(usage, "completion_tokens") or 0,
+            cached_prompt_tokens(usage))
+
+
+class CircuitBreaker:
+    """Fail fast after consecutive failures, letting one trial call through after a cool-down"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_started = None  # when the half-open trial call began
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Raise LLMUnavailableError if calls should not be attempted right now"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN:
+                remaining = self.opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    raise LLMUnavailableError(f"OpenAI API circuit open; retrying in {remaining:.0f}s")
+                self.state = self.HALF_OPEN
+                self._trial_started = None
+            # Half-open: one trial call at a time (a trial that never reported back expires)
+            now = time.monotonic()
+            if self._trial_started is not None and now - self._trial_started < self.reset_timeout:
+                raise LLMUnavailableError("OpenAI API circuit half-open; waiting for trial call")
+            self._trial_started = now
+
+    def release(self):
+        """Give back a call allowed by allow() that was never sent, so another can be the trial"""
+        with self._lock:
+            self._trial_started = None
+
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info("OpenAI API circuit closed")
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_started = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_started = None
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"OpenAI API circuit opened after {self.failures} failure(s)")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def stats(self):
+        with self._lock:
+            return {"state": self.state, "failures": self.failures}
+
+
+class LLMClient:
+    """Process-wide OpenAI client wrapper with pooled connections, retries and a circuit breaker"""
+
+    def __init__(self, api_key, timeout=120.0, max_retries=3, backoff_base=1.0, backoff_max=20.0,
+                 max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0,
+                 circuit_failures=5, circuit_reset=30.0, rate_limiter=None, base_url=None):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.breaker = CircuitBreaker(circuit_failures, circuit_reset)
+        self.rate_limiter = rate_limiter
+        self.retries = 0
+        self._client = None
+        self._lock = threading.Lock()
+
+    def _get_client(self):
+        """Build the underlying OpenAI client on first use"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    import httpx
+                    import openai
+
+                    http_client = httpx.Client(
+                        timeout=self.timeout,
+                        limits=httpx.Limits(
+                            max_connections=self.max_connections,
+                            max_keepalive_connections=self.max_keepalive_connections,
+                            keepalive_expiry=self.keepalive_expiry
+                        )
+                    )
+                    # Retries are handled here so they share the circuit breaker
+                    self._client = openai.OpenAI(
+                        api_key=self.api_key,
+                        base_url=self.base_url,
+                        timeout=self.timeout,
+                        max_retries=0,
+                        http_client=http_client
+                    )
+        return self._client
+
+    def backoff_delay(self, attempt, error=None):
+        """Exponential backoff with full jitter, never shorter than the server's Retry-After"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        retry_after = retry_after_seconds(error) if error is not None else None
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_max))
+        return delay
+
+    def create_chat_completion(self, **kwargs):
+        """Call chat.completions.create, retrying transient failures
+
+        Every attempt first waits for rate limiter capacity for its estimated
+        token cost. With stream=True only opening the stream is retried. Raises
+        LLMUnavailableError when the circuit is open, rate limit capacity doesn't
+        free up in time or retries are exhausted; other API errors (bad request,
+        authentication) are raised unchanged.
+        """
+        client = self._get_client()
+        cost = estimate_tokens(kwargs.get("messages"), kwargs.get("max_tokens"))
+        for attempt in range(self.max_retries + 1):
+            self.breaker.allow()
+            if self.rate_limiter is not None:
+                try:
+                    self.rate_limiter.acquire(cost)
+                except RateLimitTimeout as e:
+                    # Nothing was sent, so this says nothing about the upstream's health
+                    self.breaker.release()
+                    raise LLMUnavailableError(str(e)) from e
+            try:
+                response = client.chat.completions.create(**kwargs)
+            except Exception as e:
+                if not is_retryable(e):
+                    # The upstream answered; a bad request doesn't mean it's unhealthy
+                    self.breaker.record_success()
+                    raise
+                if getattr(e, "status_code", None) == 429:
+                    # Rate limited: the upstream is healthy, just busy
+                    self.breaker.record_success()
+                else:
+                    self.breaker.record_failure()
+                if attempt >= self.max_retries or self.breaker.state == CircuitBreaker.OPEN:
+                    raise LLMUnavailableError(f"OpenAI API request failed after {attempt + 1} attempt(s): {e}") from e
+                delay = self.backoff_delay(attempt, e)
+                self.retries += 1
+                logger.warning(f"OpenAI API request failed ({e}); retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            self.breaker.record_success()
+            return response
+
+    def stats(self):
+        stats = self.breaker.stats()
+        stats["retries"] = self.retries
+        return stats
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_llm_client(api_key, **options):
+    """Return the shared client for an API key, creating it on first use
+
+    Clients are per process: a forked worker builds its own instead of reusing
+    the parent's connections.
+    """
+    key = (os.getpid(), api_key)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = LLMClient(api_key, **options)
+            _clients[key] = client
+        return client
+
+
+def client_stats():
+    """Circuit state and retry counts of the clients created in this process"""
+    with _clients_lock:
+        clients = [client for (pid, _), client in _clients.items() if pid == os.getpid()]
+    return [client.stats() for client in clients]
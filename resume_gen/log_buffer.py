@@ -0,0 +1,70 @@
+"""
+Fixed-capacity in-memory log capture for the web UI.
+
+Records are kept in a ring buffer with monotonically increasing sequence
+numbers, so pollers can ask for only the entries they haven't seen yet.
+"""
+
+import logging
+import threading
+from collections import deque
+from itertools import islice
+
+
+class RingBufferHandler(logging.Handler):
+    """Logging handler that keeps the most recent records as structured entries"""
+
+    def __init__(self, capacity=1000, max_message_length=2000):
+        super().__init__()
+        self.capacity = capacity
+        self.max_message_length = max_message_length
+        self._entries = deque(maxlen=capacity)
+        self._seq = 0
+        self._entries_lock = threading.Lock()
+
+    def emit(self, record):
+        try:
+            message = record.getMessage()
+            if self.max_message_length and len(message) > self.max_message_length:
+                message = message[:self.max_message_length] + "..."
+            # Format a copy so other handlers still see the full message
+            display_record = logging.makeLogRecord(record.__dict__)
+            display_record.msg = message
+            display_record.args = None
+            text = self.format(display_record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self._entries_lock:
+            self._seq += 1
+            self._entries.append({
+                "seq": self._seq,
+                "time": record.created,
+                "level": record.levelname,
+                "logger": record.name,
+                "message": message,
+                "text": text
+            })
+
+    @property
+    def last_seq(self):
+        """Sequence number of the newest record (0 if nothing was logged)"""
+        with self._entries_lock:
+            return self._seq
+
+    def since(self, seq=0, limit=None):
+        """Return entries newer than seq, oldest first"""
+        with self._entries_lock:
+            if not self._entries:
+                return []
+            # Sequence numbers are contiguous, so skip straight to the first new entry
+            start = max(0, seq - self._entries[0]["seq"] + 1)
+            entries = list(islice(self._entries, start, None))
+        if limit:
+            entries = entries[:limit]
+        return entries
+
+    def getvalue(self):
+        """Return the buffered log as text, one record per line"""
+        return "".join(entry["text"] + "\n" for entry in self.since(0))
@@ -0,0 +1,159 @@
+"""
+Incremental index over the AI interaction log.
+
+Each log record (which may span many lines when full prompts are logged) is
+indexed by its byte offset and a classification. The index is extended as the
+file grows, and pages of records are read straight from the file through mmap,
+so viewing the log doesn't depend on its total size.
+"""
+
+import os
+import re
+import mmap
+import html
+import threading
+from array import array
+
+# Every record written by the logging formatter starts with its timestamp
+RECORD_START = re.compile(rb'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3} - ')
+
+CATEGORIES = ["other", "error", "warning", "outgoing", "incoming", "html"]
+_CATEGORY_IDS = {name: i for i, name in enumerate(CATEGORIES)}
+
+# CSS classes used by templates/ai_logs.html
+CATEGORY_CSS_CLASSES = {
+    "error": "error-message",
+    "warning": "warning-message",
+    "outgoing": "outgoing-message",
+    "incoming": "incoming-message",
+    "html": "html-content",
+    "other": ""
+}
+
+
+def classify_record(header, has_html):
+    """Classify a record from its first line"""
+    if b" - ERROR - " in header or b"FAILED" in header:
+        return "error"
+    if b" - WARNING - " in header:
+        return "warning"
+    if b"SENDING TO AI" in header or b"EXTRACTING" in header:
+        return "outgoing"
+    if b"RECEIVED FROM AI" in header or b"RESPONSE" in header or b"EXTRACTED" in header:
+        return "incoming"
+    if has_html:
+        return "html"
+    return "other"
+
+
+class LogIndex:
+    """Byte-offset index of the records in a log file"""
+
+    def __init__(self, log_path):
+        self.log_path = log_path
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._starts = array('Q')     # byte offset of each record
+        self._categories = bytearray()  # category ID of each record
+        self._by_category = {name: array('L') for name in CATEGORIES}
+        self._scanned = 0               # offset just past the last complete line read
+        self._current_header = b""
+        self._current_has_html = False
+
+    def _classify_current(self):
+        """(Re)classify the most recent record"""
+        if not self._starts:
+            return
+        category = classify_record(self._current_header, self._current_has_html)
+        index = len(self._starts) - 1
+        if len(self._categories) > index:
+            old = CATEGORIES[self._categories[index]]
+            if old == category:
+                return
+            # The record grew an html line after it was first classified
+            self._by_category[old].pop()
+        else:
+            self._categories.append(0)
+        self._categories[index] = _CATEGORY_IDS[category]
+        self._by_category[category].append(index)
+
+    def refresh(self):
+        """Index any records appended since the last refresh"""
+        with self._lock:
+            try:
+                size = os.path.getsize(self.log_path)
+            except OSError:
+                self._reset()
+                return
+            if size < self._scanned:
+                # The log was truncated or rotated
+                self._reset()
+            if size == self._scanned:
+                return
+
+            with open(self.log_path, 'rb') as f:
+                f.seek(self._scanned)
+                offset = self._scanned
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # partially written line; pick it up next time
+                    if RECORD_START.match(line):
+                        self._starts.append(offset)
+                        self._current_header = line
+                        self._current_has_html = False
+                        self._classify_current()
+                    elif not self._current_has_html and (b"<html" in line.lower() or b"</html>" in line.lower()):
+                        self._current_has_html = True
+                        self._classify_current()
+                    offset += len(line)
+                self._scanned = offset
+
+    def count(self, category=None):
+        """Number of indexed records, optionally of one category"""
+        with self._lock:
+            if category:
+                return len(self._by_category.get(category, ()))
+            return len(self._starts)
+
+    def page(self, page=1, per_page=100, category=None, newest_first=True):
+        """Return one page of records as dicts with their category and text"""
+        self.refresh()
+        with self._lock:
+            if category:
+                ordinals = self._by_category.get(category, array('L'))
+            else:
+                ordinals = range(len(self._starts))
+            total = len(ordinals)
+
+            start = (page - 1) * per_page
+            if newest_first:
+                window = [ordinals[i] for i in range(total - 1 - start, max(total - 1 - start - per_page, -1), -1)]
+            else:
+                window = [ordinals[i] for i in range(start, min(start + per_page, total))]
+
+            bounds = []
+            for ordinal in window:
+                record_start = self._starts[ordinal]
+                record_end = self._starts[ordinal + 1] if ordinal + 1 < len(self._starts) else self._scanned
+                bounds.append((ordinal, record_start, record_end, CATEGORIES[self._categories[ordinal]]))
+
+        records = []
+        if bounds:
+            with open(self.log_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    for ordinal, record_start, record_end, record_category in bounds:
+                        text = mapped[record_start:record_end].decode('utf-8', errors='replace')
+                        records.append({
+                            "number": ordinal + 1,
+                            "category": record_category,
+                            "text": text
+                        })
+        return records, total
+
+    def render(self, record):
+        """Render a record as the HTML snippet used by the AI logs page"""
+        css_class = CATEGORY_CSS_CLASSES.get(record["category"], "")
+        class_attr = f" class='{css_class}'" if css_class else ""
+        return f"<div{class_attr}>{html.escape(record['text'], quote=False)}</div>"
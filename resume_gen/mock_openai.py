@@ -0,0 +1,348 @@
+"""
+Local stand-in for the OpenAI chat completions API, for benchmarks and offline runs.
+
+Serves POST /v1/chat/completions (plain and streamed) with canned responses
+chosen from the request's messages: a company name, a skills JSON object, a
+resume / cover letter HTML document, or both documents as one JSON object.
+Latency, token rate and error injection are configurable, and GET /stats
+reports what was served. Repeated prompt prefixes are reported as cached
+prompt tokens, following OpenAI's prompt caching rules.
+
+    python -m resume_gen.mock_openai --port 8011 --latency 0.2 --error-rate 0.05
+    OPENAI_BASE_URL=http://127.0.0.1:8011/v1 OPENAI_API_KEY=mock python app.py
+"""
+
+import json
+import time
+import uuid
+import random
+import logging
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .rate_limit import estimate_tokens, CHARS_PER_TOKEN
+
+logger = logging.getLogger(__name__)
+
+# OpenAI caches prompt prefixes of at least 1024 tokens, in 128-token steps
+PROMPT_CACHE_MIN_TOKENS = 1024
+PROMPT_CACHE_STEP_TOKENS = 128
+
+CANNED_COMPANY = "Example Corp"
+
+CANNED_SKILLS = json.dumps({"skills": [
+    "Python", "Flask", "SQL", "REST APIs", "Docker", "Unit testing",
+    "Technical writing", "Stakeholder communication", "Mentoring", "Agile delivery"
+]})
+
+CANNED_RESUME = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Resume</title>
+    <style>
+        body { font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; }
+        h1 { margin-bottom: 0; }
+        h2 { border-bottom: 1px solid #ccc; }
+    </style>
+</head>
+<body>
+    <h1>Jane Doe</h1>
+    <p>jane.doe@example.com | (555) 010-0000</p>
+    <h2>Summary</h2>
+    <p>Software engineer with eight years of experience building web services and data pipelines.</p>
+    <h2>Experience</h2>
+    <h3>Senior Software Engineer, Previous Company</h3>
+    <ul>
+        <li>Led the migration of a monolith to services, cutting deploy time by 70%.</li>
+        <li>Built the reporting pipeline processing 2M events a day.</li>
+        <li>Mentored four engineers through their first production launches.</li>
+    </ul>
+    <h2>Skills</h2>
+    <p>Python, Flask, SQL, REST APIs, Docker, Unit testing</p>
+</body>
+</html>"""
+
+CANNED_COVER_LETTER = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Cover Letter</title>
+    <style>
+        body { font-family: Georgia, serif; max-width: 700px; margin: 0 auto; padding: 20px; line-height: 1.5; }
+    </style>
+</head>
+<body>
+    <p>Dear Hiring Manager,</p>
+    <p>I am excited to apply for this role. My experience building reliable web services
+    and mentoring engineers matches what your team is looking for.</p>
+    <p>At my previous company I led a migration that cut deploy time by 70% and built a
+    reporting pipeline used across the business.</p>
+    <p>I would welcome the chance to discuss how I can contribute.</p>
+    <p>Sincerely,<br>Jane Doe</p>
+</body>
+</html>"""
+
+
+CANNED_DOCUMENTS = json.dumps({"resume": CANNED_RESUME, "cover_letter": CANNED_COVER_LETTER})
+
+
+def canned_response(messages):
+    """Return (kind, content) for a chat request, based on its system message and task"""
+    system_message = " ".join(m.get("content") or "" for m in messages if m.get("role") == "system").lower()
+    task = (messages[-1].get("content") or "").lower() if messages else ""
+    if "company name" in system_message:
+        return "company", CANNED_COMPANY
+    if '"cover_letter"' in task:
+        return "documents", CANNED_DOCUMENTS
+    if "cover letter" in system_message and "resume" in system_message:
+        # Shared document prompt: the last message says which document to write
+        return ("cover_letter", CANNED_COVER_LETTER) if "cover letter" in task else ("resume", CANNED_RESUME)
+    if "cover letter" in system_message:
+        return "cover_letter", CANNED_COVER_LETTER
+    if "resume" in system_message:
+        return "resume", CANNED_RESUME
+    if "skills" in system_message:
+        return "skills", CANNED_SKILLS
+    return "resume", CANNED_RESUME
+
+
+class MockOpenAIServer:
+    """Threaded HTTP server imitating the chat completions endpoint
+
+    latency is added before every response; tokens_per_second (0 = instant)
+    paces the generated tokens, as a real model would. A fraction error_rate of
+    requests fail with error_status (429 responses carry a Retry-After header).
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, tokens_per_second=0.0,
+                 error_rate=0.0, error_status=500, seed=None):
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self._prefixes = set()
+        self._lock = threading.Lock()
+        self._thread = None
+        self.reset_stats()
+        self.httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self.httpd.daemon_threads = True
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def reset_stats(self):
+        with self._lock:
+            self.requests = 0
+            self.errors = 0
+            self.streams = 0
+            self.prompt_tokens = 0
+            self.cached_prompt_tokens = 0
+            self.completion_tokens = 0
+            self.by_kind = {}
+
+    def stats(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "streams": self.streams,
+                "prompt_tokens": self.prompt_tokens,
+                "cached_prompt_tokens": self.cached_prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "by_kind": dict(self.by_kind)
+            }
+
+    def start(self):
+        """Serve in a background thread; returns the server"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="mock-openai", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def should_fail(self):
+        with self._lock:
+            self.requests += 1
+            if self.error_rate > 0 and self._random.random() < self.error_rate:
+                self.errors += 1
+                return True
+            return False
+
+    def cached_tokens(self, model, messages):
+        """Prompt tokens served from the prompt cache for a request
+
+        Every message but the last is the cacheable prefix. It is cached from its
+        second use, if it is long enough.
+        """
+        prefix = messages[:-1]
+        tokens = estimate_tokens(prefix)
+        if tokens < PROMPT_CACHE_MIN_TOKENS:
+            return 0
+        key = json.dumps([model, prefix], sort_keys=True)
+        with self._lock:
+            if key not in self._prefixes:
+                self._prefixes.add(key)
+                return 0
+        return tokens - tokens % PROMPT_CACHE_STEP_TOKENS
+
+    def record(self, kind, prompt_tokens, cached_tokens, completion_tokens, stream):
+        with self._lock:
+            self.by_kind[kind] = self.by_kind.get(kind, 0) + 1
+            self.prompt_tokens += prompt_tokens
+            self.cached_prompt_tokens += cached_tokens
+            self.completion_tokens += completion_tokens
+            if stream:
+                self.streams += 1
+
+    def generation_time(self, completion_tokens):
+        if self.tokens_per_second <= 0:
+            return 0.0
+        return completion_tokens / self.tokens_per_second
+
+
+def _make_handler(server):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+
+        def log_message(self, format, *args):
+            logger.debug(f"{self.address_string()} - {format % args}")
+
+        def send_json(self, status, data, headers=None):
+            body = json.dumps(data).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path.rstrip("/") == "/stats":
+                self.send_json(200, server.stats())
+            else:
+                self.send_json(404, {"error": {"message": f"Unknown path: {self.path}", "type": "invalid_request_error"}})
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                body = json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                self.send_json(400, {"error": {"message": "Invalid JSON body", "type": "invalid_request_error"}})
+                return
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                self.send_json(404, {"error": {"message": f"Unknown path: {self.path}", "type": "invalid_request_error"}})
+                return
+
+            if server.latency > 0:
+                time.sleep(server.latency)
+            if server.should_fail():
+                headers = {"Retry-After": "1"} if server.error_status == 429 else None
+                self.send_json(server.error_status, {"error": {
+                    "message": f"Injected error ({server.error_status})", "type": "server_error"
+                }}, headers)
+                return
+
+            messages = body.get("messages") or []
+            kind, content = canned_response(messages)
+            prompt_tokens = estimate_tokens(messages)
+            cached_tokens = server.cached_tokens(body.get("model"), messages)
+            completion_tokens = max(1, len(content) // CHARS_PER_TOKEN)
+            if body.get("max_tokens") and completion_tokens > body["max_tokens"]:
+                # Cut off at max_tokens, like a real model hitting the limit
+                completion_tokens = body["max_tokens"]
+                content = content[:completion_tokens * CHARS_PER_TOKEN]
+            stream = bool(body.get("stream"))
+            server.record(kind, prompt_tokens, cached_tokens, completion_tokens, stream)
+
+            completion_id = f"chatcmpl-mock{uuid.uuid4().hex[:12]}"
+            base = {"id": completion_id, "created": int(time.time()), "model": body.get("model", "mock")}
+            usage = {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "prompt_tokens_details": {"cached_tokens": cached_tokens}
+            }
+            if stream:
+                include_usage = (body.get("stream_options") or {}).get("include_usage")
+                self.stream_content(base, content, completion_tokens, usage if include_usage else None)
+                return
+
+            time.sleep(server.generation_time(completion_tokens))
+            self.send_json(200, dict(base, object="chat.completion", choices=[{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }], usage=usage))
+
+        def stream_content(self, base, content, completion_tokens, usage=None):
+            """Send content as server-sent events, about 16 tokens per chunk
+
+            With usage (stream_options include_usage), a last chunk with no choices reports it.
+            """
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+
+            chunk_chars = 16 * CHARS_PER_TOKEN
+            pieces = [content[i:i + chunk_chars] for i in range(0, len(content), chunk_chars)]
+            delay = server.generation_time(completion_tokens) / max(1, len(pieces))
+            for i, piece in enumerate(pieces):
+                delta = {"role": "assistant", "content": piece} if i == 0 else {"content": piece}
+                self.send_event(dict(base, object="chat.completion.chunk", choices=[
+                    {"index": 0, "delta": delta, "finish_reason": None}
+                ]))
+                if delay:
+                    time.sleep(delay)
+            self.send_event(dict(base, object="chat.completion.chunk", choices=[
+                {"index": 0, "delta": {}, "finish_reason": "stop"}
+            ]))
+            if usage:
+                self.send_event(dict(base, object="chat.completion.chunk", choices=[], usage=usage))
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+
+        def send_event(self, data):
+            self.wfile.write(f"data: {json.dumps(data)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+    return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m resume_gen.mock_openai",
+                                     description="Local mock of the OpenAI chat completions API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8011)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0, help="completion token rate (0 = instant)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests that fail")
+    parser.add_argument("--error-status", type=int, default=500, help="HTTP status of injected errors")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for error injection")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    server = MockOpenAIServer(args.host, args.port, latency=args.latency, tokens_per_second=args.tokens_per_second,
+                              error_rate=args.error_rate, error_status=args.error_status, seed=args.seed)
+    logger.info(f"Mock OpenAI API listening on {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
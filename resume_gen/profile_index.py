@@ -0,0 +1,160 @@
+"""
+Compact manifest of user profile summaries.
+
+Listing profiles only needs names, dates and a few skills, so those are kept in
+a single index.json next to the profile folders instead of opening every
+profile.json (with its full resume, portfolio and LinkedIn text).
+
+Several processes (web workers, the CLI, batch runs) may update the index at
+once, so every read-modify-write holds an exclusive lock on index.json.lock.
+File locking needs fcntl; where it's unavailable (Windows) only threads of one
+process are serialized.
+"""
+
+import os
+import json
+import logging
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.json"
+TOP_SKILLS = 5
+
+
+class ProfileSummary:
+    """Lightweight, read-only view of a profile for listings"""
+
+    def __init__(self, data):
+        self.folder_name = data.get("folder_name", "")
+        self.first_name = data.get("first_name", "")
+        self.last_name = data.get("last_name", "")
+        self.created_at = data.get("created_at", "")
+        self.updated_at = data.get("updated_at", self.created_at)
+        self.skill_count = data.get("skill_count", 0)
+        self.top_skills = data.get("top_skills", [])
+
+    @property
+    def full_name(self):
+        return f"{self.first_name} {self.last_name}".strip()
+
+
+def summarize(folder_name, data):
+    """Build the index entry for a profile from its profile.json data"""
+    skills = data.get("skills", [])
+    return {
+        "folder_name": folder_name,
+        "first_name": data.get("first_name", ""),
+        "last_name": data.get("last_name", ""),
+        "created_at": data.get("created_at", ""),
+        "updated_at": data.get("updated_at", data.get("created_at", "")),
+        "skill_count": len(skills),
+        "top_skills": skills[:TOP_SKILLS]
+    }
+
+
+class ProfileIndex:
+    """index.json manifest of profile summaries, kept in sync on save and delete"""
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.path = os.path.join(folder, INDEX_FILENAME)
+        self.lock_path = f"{self.path}.lock"
+        self._lock = threading.Lock()
+        self._entries = None
+        self._mtime_ns = None
+
+    @contextmanager
+    def _locked(self):
+        """Hold the thread lock and, where supported, the cross-process file lock"""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            os.makedirs(self.folder, exist_ok=True)
+            with open(self.lock_path, 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load(self, force=False):
+        """Load the manifest, rebuilding it from the profile folders if it's missing"""
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except OSError:
+            self._entries = self._scan()
+            self._write()
+            return
+
+        if not force and self._entries is not None and mtime_ns == self._mtime_ns:
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+            self._mtime_ns = mtime_ns
+        except (OSError, ValueError) as e:
+            logger.warning(f"Rebuilding unreadable profile index: {e}")
+            self._entries = self._scan()
+            self._write()
+
+    def _scan(self):
+        """One-time full scan of the profile folders"""
+        entries = {}
+        if not os.path.exists(self.folder):
+            return entries
+        for folder_name in os.listdir(self.folder):
+            profile_path = os.path.join(self.folder, folder_name, "profile.json")
+            if not os.path.isfile(profile_path):
+                continue
+            try:
+                with open(profile_path, 'r', encoding='utf-8') as f:
+                    entries[folder_name] = summarize(folder_name, json.load(f))
+            except Exception as e:
+                logger.error(f"Error loading profile {folder_name}: {str(e)}")
+        logger.info(f"Rebuilt profile index with {len(entries)} profile(s)")
+        return entries
+
+    def _write(self):
+        os.makedirs(self.folder, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f, indent=2)
+        os.replace(tmp_path, self.path)
+        self._mtime_ns = os.stat(self.path).st_mtime_ns
+
+    def upsert(self, folder_name, data):
+        """Add or update the summary for a saved profile"""
+        with self._locked():
+            # Re-read under the lock, another process may have written since
+            self._load(force=True)
+            self._entries[folder_name] = summarize(folder_name, data)
+            self._write()
+
+    def remove(self, folder_name):
+        """Drop a deleted profile from the index"""
+        with self._locked():
+            self._load(force=True)
+            if self._entries.pop(folder_name, None) is not None:
+                self._write()
+
+    def all(self):
+        """Return all profile summaries, newest first"""
+        with self._locked():
+            self._load()
+            summaries = [ProfileSummary(entry) for entry in self._entries.values()]
+        summaries.sort(key=lambda p: p.updated_at, reverse=True)
+        return summaries
+
+    def rebuild(self):
+        """Rescan the profile folders and rewrite the index"""
+        with self._locked():
+            self._entries = self._scan()
+            self._write()
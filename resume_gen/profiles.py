@@ -0,0 +1,172 @@
+"""
+User profiles: the resume, portfolio and LinkedIn text a generation is based on.
+
+Profiles are stored as user_profiles/<First_Last>/profile.json, with a summary
+index used for listings. Loaded profile.json data is kept in memory until the
+file changes, since the web app loads the selected profile on every request.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from .profile_index import ProfileIndex
+from .config import USER_PROFILES_FOLDER
+
+logger = logging.getLogger(__name__)
+
+# Manifest of profile summaries used to list profiles without loading them
+profile_index = ProfileIndex(USER_PROFILES_FOLDER)
+
+# Parsed profile.json data kept in memory, keyed by folder name
+LOADED_PROFILES_CACHE_SIZE = 32
+_loaded = OrderedDict()  # folder name -> ((mtime_ns, size), data)
+_loaded_lock = threading.Lock()
+
+
+def _read_profile_data(file_path, folder_name):
+    """Return (data, cached) for a profile.json, reading the file only if it changed since last time"""
+    stat = os.stat(file_path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _loaded_lock:
+        cached = _loaded.get(folder_name)
+        if cached is not None and cached[0] == version:
+            _loaded.move_to_end(folder_name)
+            return cached[1], True
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    with _loaded_lock:
+        _loaded[folder_name] = (version, data)
+        _loaded.move_to_end(folder_name)
+        while len(_loaded) > LOADED_PROFILES_CACHE_SIZE:
+            _loaded.popitem(last=False)
+    return data, False
+
+
+class UserProfile:
+    def __init__(self, first_name="", last_name=""):
+        self.first_name = first_name
+        self.last_name = last_name
+        self.resume_text = ""
+        self.portfolio_text = ""
+        self.linkedin_text = ""
+        self.skills = []
+        self.skills_hash = ""  # content_hash() the skills were extracted from
+        self.resume_file = ""  # uploaded resume file name, used as the style reference
+        self.created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.updated_at = self.created_at
+    
+    @property
+    def full_name(self):
+        return f"{self.first_name} {self.last_name}".strip()
+    
+    @property
+    def folder_name(self):
+        if not self.full_name:
+            return None
+        return f"{self.first_name}_{self.last_name}".replace(" ", "_")
+    
+    def content_hash(self):
+        """Hash of the source text that skills are derived from"""
+        source = "\x00".join([self.resume_text or "", self.portfolio_text or "", self.linkedin_text or ""])
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+    
+    def to_dict(self):
+        return {
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "resume_text": self.resume_text,
+            "portfolio_text": self.portfolio_text,
+            "linkedin_text": self.linkedin_text,
+            "skills": self.skills,
+            "skills_hash": self.skills_hash,
+            "resume_file": self.resume_file,
+            "created_at": self.created_at,
+            "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        profile = cls()
+        profile.first_name = data.get("first_name", "")
+        profile.last_name = data.get("last_name", "")
+        profile.resume_text = data.get("resume_text", "")
+        profile.portfolio_text = data.get("portfolio_text", "")
+        profile.linkedin_text = data.get("linkedin_text", "")
+        profile.skills = list(data.get("skills", []))
+        profile.resume_file = data.get("resume_file", "")
+        # Profiles saved before skills were versioned are trusted as-is
+        profile.skills_hash = data.get("skills_hash") or (profile.content_hash() if profile.skills else "")
+        profile.created_at = data.get("created_at", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        profile.updated_at = data.get("updated_at", profile.created_at)
+        return profile
+    
+    def save(self):
+        if not self.folder_name:
+            raise ValueError("User profile must have a name before saving")
+        
+        folder_path = os.path.join(USER_PROFILES_FOLDER, self.folder_name)
+        os.makedirs(folder_path, exist_ok=True)
+        
+        data = self.to_dict()
+        self.updated_at = data["updated_at"]
+        
+        file_path = os.path.join(folder_path, "profile.json")
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        
+        profile_index.upsert(self.folder_name, data)
+        logger.info(f"Saved user profile for {self.full_name}")
+        return folder_path
+    
+    @classmethod
+    def delete(cls, folder_name):
+        """Delete a saved profile and its folder"""
+        folder_path = os.path.join(USER_PROFILES_FOLDER, folder_name)
+        if not os.path.isdir(folder_path):
+            return False
+        
+        # Delete all files in the folder
+        for file in os.listdir(folder_path):
+            file_path = os.path.join(folder_path, file)
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+        
+        # Delete the folder
+        os.rmdir(folder_path)
+        
+        profile_index.remove(folder_name)
+        with _loaded_lock:
+            _loaded.pop(folder_name, None)
+        logger.info(f"Deleted user profile: {folder_name}")
+        return True
+    
+    @classmethod
+    def load(cls, folder_name):
+        file_path = os.path.join(USER_PROFILES_FOLDER, folder_name, "profile.json")
+        if not os.path.exists(file_path):
+            logger.error(f"User profile not found: {folder_name}")
+            return None
+        
+        try:
+            data, cached = _read_profile_data(file_path, folder_name)
+            profile = cls.from_dict(data)
+            if not cached:
+                logger.info(f"Loaded user profile for {profile.full_name}")
+            return profile
+        except Exception as e:
+            logger.error(f"Error loading user profile: {str(e)}")
+            return None
+    
+    @classmethod
+    def get_all_profiles(cls):
+        """Return lightweight summaries of all profiles, newest first
+        
+        Full profiles (with resume text) are only loaded by load() when one is selected.
+        """
+        return profile_index.all()
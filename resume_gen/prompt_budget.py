@@ -0,0 +1,215 @@
+"""
+Token-aware prompt budgeting.
+
+Counts tokens locally (with tiktoken when it is installed, otherwise a
+characters-per-token estimate) and fits the variable sections of a prompt into
+the model's context window. Sections are trimmed lowest priority first, each
+from its end, so the beginning of a job description or resume survives longest.
+"""
+
+import re
+import logging
+import threading
+
+from .rate_limit import CHARS_PER_TOKEN
+
+logger = logging.getLogger(__name__)
+
+# Context window sizes by model name prefix (longest match wins)
+MODEL_CONTEXT_TOKENS = {
+    "gpt-3.5-turbo": 16385,
+    "gpt-4": 8192,
+    "gpt-4-32k": 32768,
+    "gpt-4-turbo": 128000,
+    "gpt-4-1106": 128000,
+    "gpt-4-0125": 128000,
+    "gpt-4o": 128000,
+    "gpt-4.1": 1047576,
+    "o1": 200000,
+    "o3": 200000,
+    "o4": 200000,
+}
+DEFAULT_CONTEXT_TOKENS = 8192
+
+# Tokens kept free for the chat format's per-message overhead and estimate error
+SAFETY_MARGIN_TOKENS = 64
+
+_encodings = {}
+_encodings_lock = threading.Lock()
+
+
+def context_window(model):
+    """Return the context window of a model, in tokens"""
+    matches = [prefix for prefix in MODEL_CONTEXT_TOKENS if (model or "").startswith(prefix)]
+    if not matches:
+        return DEFAULT_CONTEXT_TOKENS
+    return MODEL_CONTEXT_TOKENS[max(matches, key=len)]
+
+
+def _get_encoding(model):
+    """Return the tiktoken encoding for a model, or None if tiktoken isn't installed"""
+    with _encodings_lock:
+        if model not in _encodings:
+            try:
+                import tiktoken
+                try:
+                    _encodings[model] = tiktoken.encoding_for_model(model)
+                except KeyError:
+                    _encodings[model] = tiktoken.get_encoding("cl100k_base")
+            except Exception as e:
+                # Missing package, or the encoding couldn't be downloaded
+                logger.info(f"tiktoken unavailable ({e}); estimating tokens from characters")
+                _encodings[model] = None
+        return _encodings[model]
+
+
+def count_tokens(text, model=None):
+    """Count the tokens in text, exactly with tiktoken or estimated without it"""
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def truncate_to_tokens(text, limit, model=None):
+    """Cut text from the end to at most limit tokens, preferring line boundaries"""
+    if limit <= 0 or not text:
+        return ""
+    if count_tokens(text, model) <= limit:
+        return text
+
+    kept = []
+    used = 0
+    for line in text.splitlines(keepends=True):
+        tokens = count_tokens(line, model)
+        if used + tokens > limit:
+            remaining = limit - used
+            # Keep part of the line if a useful amount of the budget is left
+            if remaining >= 16 or not kept:
+                kept.append(_truncate_line(line, remaining, model))
+            break
+        kept.append(line)
+        used += tokens
+    return "".join(kept).rstrip()
+
+
+def _truncate_line(line, limit, model):
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return encoding.decode(encoding.encode(line, disallowed_special=())[:limit])
+    cut = line[:limit * CHARS_PER_TOKEN]
+    # Don't end mid-word
+    match = re.match(r"(?s)(.*\S)\s+\S*$", cut)
+    return match.group(1) if match and len(match.group(1)) > len(cut) // 2 else cut
+
+
+class Section:
+    """A variable part of a prompt
+
+    Lower priority numbers are kept longest. A section is first trimmed only
+    down to min_tokens, and below that only if the prompt still doesn't fit.
+    max_tokens (0 = none) caps the section even when there is room. trim(text,
+    limit) cuts the text to a token limit; by default its end is cut off.
+    """
+
+    def __init__(self, name, text, priority, min_tokens=0, max_tokens=0, trim=None):
+        self.name = name
+        self.text = text or ""
+        self.priority = priority
+        self.min_tokens = min_tokens
+        self.max_tokens = max_tokens
+        self.trim = trim
+
+
+class PromptPlan:
+    """The fitted section texts of one prompt and the token split it was given"""
+
+    def __init__(self, texts, sections, prompt_tokens, max_tokens, context_tokens):
+        self.texts = texts
+        self.sections = sections  # name -> {"tokens", "original_tokens"}
+        self.prompt_tokens = prompt_tokens
+        self.max_tokens = max_tokens
+        self.context_tokens = context_tokens
+
+    @property
+    def trimmed(self):
+        return [name for name, section in self.sections.items() if section["tokens"] < section["original_tokens"]]
+
+    def report(self):
+        """Token split of the prompt, as span attributes or log fields"""
+        return {
+            "prompt_tokens_estimate": self.prompt_tokens,
+            "max_tokens": self.max_tokens,
+            "context_tokens": self.context_tokens,
+            "section_tokens": {name: section["tokens"] for name, section in self.sections.items()},
+            "trimmed": self.trimmed
+        }
+
+    def summary(self):
+        sections = ", ".join(
+            f"{name} {section['tokens']}" + (f"/{section['original_tokens']}" if section["tokens"] < section["original_tokens"] else "")
+            for name, section in self.sections.items()
+        )
+        return (f"prompt ~{self.prompt_tokens} + completion {self.max_tokens} of {self.context_tokens} tokens "
+                f"({sections})")
+
+
+class PromptBudget:
+    """Fit prompt sections into a model's context, leaving room for the completion
+
+    completion_tokens is the completion length wanted; max_input_tokens caps
+    the prompt (0 = whatever the context leaves after the completion).
+    """
+
+    def __init__(self, model, completion_tokens, context_tokens=0, max_input_tokens=0):
+        self.model = model
+        self.context_tokens = context_tokens or context_window(model)
+        self.completion_tokens = min(completion_tokens, self.context_tokens // 2)
+        available = self.context_tokens - self.completion_tokens - SAFETY_MARGIN_TOKENS
+        self.input_tokens = min(available, max_input_tokens) if max_input_tokens > 0 else available
+
+    def fit(self, system_message, render, sections):
+        """Trim sections until the prompt fits; returns a PromptPlan
+
+        render(texts) builds the user prompt from a dict of section texts; it is
+        called with empty sections to measure the fixed part of the prompt.
+        """
+        fixed = count_tokens(system_message, self.model) + count_tokens(render({s.name: "" for s in sections}), self.model)
+        original = {s.name: count_tokens(s.text, self.model) for s in sections}
+        tokens = {s.name: min(original[s.name], s.max_tokens) if s.max_tokens > 0 else original[s.name]
+                  for s in sections}
+        over = fixed + sum(tokens.values()) - self.input_tokens
+
+        # Trim the least important sections first: to their floor, then below it
+        by_priority = sorted(sections, key=lambda s: s.priority, reverse=True)
+        for use_floor in (True, False):
+            for section in by_priority:
+                if over <= 0:
+                    break
+                floor = section.min_tokens if use_floor else 0
+                cut = min(over, max(0, tokens[section.name] - floor))
+                if cut:
+                    tokens[section.name] -= cut
+                    over -= cut
+
+        texts = {}
+        for section in sections:
+            if tokens[section.name] < original[section.name]:
+                if section.trim is not None:
+                    texts[section.name] = section.trim(section.text, tokens[section.name])
+                else:
+                    texts[section.name] = truncate_to_tokens(section.text, tokens[section.name], self.model)
+                tokens[section.name] = count_tokens(texts[section.name], self.model)
+            else:
+                texts[section.name] = section.text
+
+        prompt_tokens = fixed + sum(tokens.values())
+        # Never ask for more completion tokens than the context has left
+        max_tokens = max(1, min(self.completion_tokens, self.context_tokens - prompt_tokens - SAFETY_MARGIN_TOKENS))
+        return PromptPlan(
+            texts,
+            {s.name: {"tokens": tokens[s.name], "original_tokens": original[s.name]} for s in sections},
+            prompt_tokens, max_tokens, self.context_tokens
+        )
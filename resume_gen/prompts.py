@@ -0,0 +1,150 @@
+"""
+Prompt text for resume and cover letter generation.
+
+Every document prompt is three messages: the shared system message, a context
+message with the job description and candidate profile, and a short task
+message. The first two are byte-identical for the resume and the cover letter
+of a resume variant, so providers that cache prompt prefixes (OpenAI does for
+prompts of 1024 tokens and more) bill that part at the full rate only once.
+Anything that differs per document, such as today's date, belongs in the task.
+
+The documents task asks for both documents in one completion, as a JSON object
+with "resume" and "cover_letter" keys.
+"""
+
+import json
+import re
+from datetime import datetime
+
+SYSTEM_MESSAGE = """
+You are an expert resume writer and career coach. You create tailored ATS-friendly resumes
+and personalized cover letters that match a candidate's real experience to a job's requirements.
+Highlight relevant skills and experiences, use industry keywords from the job description,
+and quantify achievements where possible. Keep the content professional and concise.
+Never fabricate experience or qualifications that are not in the candidate's profile.
+
+Documents are complete HTML documents with embedded CSS styling that print cleanly.
+"""
+
+RESUME_TASK = """
+Create a targeted resume that reorganizes and enhances the original resume content to match the job requirements.
+The resume should include:
+
+1. A brief professional summary emphasizing relevant experience
+2. Skills section with relevant technical and soft skills
+3. Work experience section (keep the original companies and dates, but tailor descriptions)
+4. Education section
+5. Any other relevant sections from the original resume
+
+Format the resume as a complete HTML document with embedded CSS for a professional appearance.
+
+CSS styling should include:
+- Clean, professional font (Arial, Helvetica, or similar sans-serif)
+- Appropriate section headings (using h2 or h3 tags)
+- Good spacing and margins
+- Consistent formatting
+- Print-friendly design (no background colors that waste ink)
+- Maximum width of 800px with centered content
+
+The HTML should be complete with <!DOCTYPE html>, <html>, <head>, and <body> tags.
+Include media queries for print to ensure the resume prints correctly.
+
+Keep education and work history in reverse chronological order as in the original resume.
+"""
+
+COVER_LETTER_TASK = """
+Write a complete cover letter that is ready to be sent. Focus on matching specific experiences and skills
+from the candidate's profile to the job requirements. Be specific and provide concrete examples from the
+candidate's background that demonstrate their suitability for the role. Keep the tone professional but personable.
+
+The cover letter should be properly formatted with:
+1. The candidate's contact information at the top (name, address, phone, email)
+2. Today's date ({date})
+3. Recipient's company name and "Hiring Manager" as placeholder
+4. Appropriate greeting
+5. 3-4 paragraphs of content
+6. Professional closing
+7. Candidate's name
+
+Format the letter as a complete HTML document with embedded CSS for a professional appearance.
+
+CSS styling should include:
+- Clean, professional font (Arial, Helvetica, or similar sans-serif)
+- Appropriate spacing and margins
+- Consistent formatting for date, greeting, body, and signature
+- Print-friendly design (no background colors that waste ink)
+- Maximum width of 800px with centered content
+
+The HTML should be complete with <!DOCTYPE html>, <html>, <head>, and <body> tags.
+Include media queries for print to ensure the letter prints correctly.
+"""
+
+DOCUMENTS_TASK = """
+Write both a tailored resume and a cover letter for this job.
+
+Resume: a targeted resume that reorganizes and enhances the original resume content to match the job
+requirements, with a brief professional summary, a skills section, work experience (keep the original
+companies and dates, but tailor descriptions) and education, in reverse chronological order.
+
+Cover letter: a complete letter ready to be sent, with the candidate's contact information, today's date
+({date}), the company name and "Hiring Manager", a greeting, 3-4 paragraphs with concrete examples from the
+candidate's background, a professional closing and the candidate's name.
+
+Each document is a complete HTML document (<!DOCTYPE html>, <html>, <head> and <body> tags) with embedded CSS:
+a clean sans-serif font, good spacing, a maximum width of 800px, no background colors and print media queries.
+
+Respond with only a JSON object with two string keys, "resume" and "cover_letter", each holding one HTML document.
+"""
+
+
+def today():
+    return datetime.now().strftime("%B %d, %Y")
+
+
+def render_context(texts, profile):
+    """The job description and candidate profile, shared by every document prompt"""
+    return f"""
+JOB DESCRIPTION:
+{texts["job_description"]}
+
+CANDIDATE PROFILE:
+Name: {profile.full_name}
+Email: {profile.email if hasattr(profile, 'email') else 'example@email.com'}
+Phone: {profile.phone if hasattr(profile, 'phone') else '(123) 456-7890'}
+Address: {profile.address if hasattr(profile, 'address') else '123 Main St, City, State 12345'}
+Resume: {texts["resume"] or "Not provided"}
+Portfolio: {texts["portfolio"] or "Not provided"}
+LinkedIn: {texts["linkedin"] or "Not provided"}
+Key Skills: {texts["skills"] or "Not available"}
+"""
+
+
+def task_prompt(document):
+    """The task message for "resume", "cover_letter" or "documents" (both, as JSON)"""
+    if document == "resume":
+        return RESUME_TASK
+    if document == "cover_letter":
+        return COVER_LETTER_TASK.format(date=today())
+    if document == "documents":
+        return DOCUMENTS_TASK.format(date=today())
+    raise ValueError(f"Unknown document: {document}")
+
+
+def parse_documents(content):
+    """Return (resume_html, cover_letter_html) from a documents response, or None if unusable"""
+    # Tolerate a markdown code fence or text around the JSON object
+    match = re.search(r"\{.*\}", content or "", re.DOTALL)
+    if not match:
+        return None
+    try:
+        data = json.loads(match.group(0))
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    resume_html, cover_letter_html = data.get("resume"), data.get("cover_letter")
+    if not isinstance(resume_html, str) or not isinstance(cover_letter_html, str):
+        return None
+    if not resume_html.strip() or not cover_letter_html.strip():
+        return None
+    return resume_html, cover_letter_html
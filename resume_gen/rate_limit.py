@@ -0,0 +1,166 @@
+"""
+Client-side rate limiting and request coalescing for LLM calls.
+
+RateLimiter keeps this process under the organisation's requests-per-minute and
+tokens-per-minute limits with two token buckets, charging each request its
+estimated token cost before it is sent. SingleFlight lets concurrent identical
+requests share one upstream call.
+"""
+
+import time
+import threading
+
+# Rough characters per token for English text, used when no tokenizer is available
+CHARS_PER_TOKEN = 4
+# Per-message overhead of the chat format, in tokens
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(messages, max_tokens=0):
+    """Estimate the tokens a chat request counts against the TPM limit
+
+    Rate limits count the prompt plus the requested max_tokens, so both are included.
+    """
+    prompt_tokens = 0
+    for message in messages or []:
+        prompt_tokens += len(message.get("content") or "") // CHARS_PER_TOKEN + MESSAGE_OVERHEAD_TOKENS
+    return prompt_tokens + (max_tokens or 0)
+
+
+class RateLimitTimeout(Exception):
+    """Waiting for rate limit capacity would take longer than allowed"""
+
+
+class TokenBucket:
+    """Continuously refilling bucket holding up to one minute of capacity"""
+
+    def __init__(self, per_minute):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.available = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now):
+        self.available = min(self.capacity, self.available + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_time(self, amount, now):
+        """Seconds until amount is available (0 if it is now)"""
+        self._refill(now)
+        amount = min(amount, self.capacity)  # oversized requests wait for a full bucket
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) / self.rate
+
+    def take(self, amount):
+        self.available -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limits shared by all threads
+
+    A limit of 0 disables that bucket. Limits apply per process.
+    """
+
+    def __init__(self, requests_per_minute=0, tokens_per_minute=0, max_wait=60.0):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self.max_wait = max_wait
+        self.waits = 0
+        self.waited_seconds = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.requests is not None or self.tokens is not None
+
+    def acquire(self, tokens=0):
+        """Block until one request costing tokens fits within both limits
+
+        Raises RateLimitTimeout if that would take longer than max_wait seconds.
+        """
+        if not self.enabled:
+            return 0.0
+        start = time.monotonic()
+        slept = False
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = 0.0
+                if self.requests is not None:
+                    wait = max(wait, self.requests.wait_time(1, now))
+                if self.tokens is not None:
+                    wait = max(wait, self.tokens.wait_time(tokens, now))
+                if wait == 0.0:
+                    if self.requests is not None:
+                        self.requests.take(1)
+                    if self.tokens is not None:
+                        self.tokens.take(tokens)
+                    waited = now - start if slept else 0.0
+                    if slept:
+                        self.waits += 1
+                        self.waited_seconds += waited
+                    return waited
+            if now + wait - start > self.max_wait:
+                raise RateLimitTimeout(f"Rate limit capacity not available within {self.max_wait:g}s")
+            time.sleep(min(wait, 1.0))
+            slept = True
+
+    def stats(self):
+        with self._lock:
+            now = time.monotonic()
+            stats = {"waits": self.waits, "waited_seconds": round(self.waited_seconds, 3)}
+            if self.requests is not None:
+                self.requests._refill(now)
+                stats["requests_available"] = int(self.requests.available)
+            if self.tokens is not None:
+                self.tokens._refill(now)
+                stats["tokens_available"] = int(self.tokens.available)
+            return stats
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Run a function once per key at a time; concurrent callers share its result"""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key, fn):
+        """Return (result, shared) where shared is True if another caller made the call
+
+        Exceptions raised by fn are re-raised in every waiting caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result, False
@@ -0,0 +1,199 @@
+"""
+Relevance ranking of profile text against a job description.
+
+Resume, portfolio and LinkedIn text is split into chunks (sections, job entries,
+paragraphs) and scored against the job description with BM25. When a section
+has to be cut to fit the prompt budget, the highest-scoring chunks are kept
+instead of only the beginning, so later but relevant experience still reaches
+the model. Chunks are returned in their original order.
+
+Scoring is vectorized with NumPy when it is installed and falls back to plain
+Python otherwise. Chunk indexes are cached in memory by content hash, so each
+profile's text is indexed once per process.
+"""
+
+import re
+import math
+import hashlib
+import logging
+import threading
+from collections import Counter, OrderedDict
+
+from .prompt_budget import count_tokens, truncate_to_tokens
+
+logger = logging.getLogger(__name__)
+
+# Target chunk size; a chunk is also closed at blank lines and headings
+CHUNK_TOKENS = 120
+# BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+# Chunk indexes kept in memory
+INDEX_CACHE_SIZE = 64
+
+STOPWORDS = frozenset("""
+a about above after all also an and any are as at be been being but by can could did do does
+doing during each few for from further had has have having he her here hers him his how i if in
+into is it its itself just me more most my no nor not now of off on once only or other our ours
+out over own same she should so some such than that the their theirs them then there these they
+this those through to too under until up very was we were what when where which while who whom
+why will with would you your yours able ability across etc experience including must new one
+plus preferred required requirements responsibilities role strong team work working years
+""".split())
+
+HEADING_PATTERN = re.compile(r"^[A-Z][A-Za-z &/]{1,40}:?$")
+TERM_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+
+def tokenize(text):
+    """Lowercase terms of text without stopwords (keeps terms like c++, c# and node.js)"""
+    return [term for term in TERM_PATTERN.findall((text or "").lower()) if term not in STOPWORDS]
+
+
+def is_heading(line):
+    stripped = line.strip()
+    return bool(stripped) and (stripped.isupper() and len(stripped) <= 40 or bool(HEADING_PATTERN.match(stripped)))
+
+
+def _split_long_lines(lines, model, chunk_tokens):
+    """Break lines longer than a chunk (e.g. paragraphs extracted from a PDF) into sentences"""
+    for line in lines:
+        if count_tokens(line, model) <= chunk_tokens:
+            yield line
+        else:
+            yield from re.split(r"(?<=[.!?;])\s+", line)
+
+
+def split_chunks(text, model=None, chunk_tokens=CHUNK_TOKENS):
+    """Split text into chunks at blank lines, headings and roughly every chunk_tokens tokens"""
+    chunks = []
+    lines = []
+    size = 0
+    for line in _split_long_lines((text or "").splitlines(), model, chunk_tokens):
+        tokens = count_tokens(line, model)
+        starts_section = not line.strip() or is_heading(line)
+        if lines and (starts_section or size + tokens > chunk_tokens):
+            chunks.append("\n".join(lines).strip())
+            lines, size = [], 0
+        if line.strip():
+            lines.append(line)
+            size += tokens
+    if lines:
+        chunks.append("\n".join(lines).strip())
+    return [chunk for chunk in chunks if chunk]
+
+
+class ChunkIndex:
+    """BM25 index over the chunks of one text"""
+
+    def __init__(self, chunks, model=None):
+        self.chunks = chunks
+        self.tokens = [count_tokens(chunk, model) for chunk in chunks]
+        self.term_counts = [Counter(tokenize(chunk)) for chunk in chunks]
+        lengths = [sum(counts.values()) for counts in self.term_counts]
+        self.average_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+        document_frequency = Counter(term for counts in self.term_counts for term in counts)
+        total = len(chunks)
+        self.idf = {term: math.log(1 + (total - df + 0.5) / (df + 0.5)) for term, df in document_frequency.items()}
+        self.vocabulary = {term: i for i, term in enumerate(sorted(self.idf))}
+        self._weights = self._build_weights(lengths)
+
+    def _term_weight(self, term, count, length):
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / (self.average_length or 1))
+        return self.idf[term] * count * (BM25_K1 + 1) / (count + norm)
+
+    def _build_weights(self, lengths):
+        """Precompute the chunk x term BM25 weight matrix (a NumPy array, or dicts without NumPy)"""
+        try:
+            import numpy as np
+        except ImportError:
+            return [{term: self._term_weight(term, count, length) for term, count in counts.items()}
+                    for counts, length in zip(self.term_counts, lengths)]
+
+        counts = np.zeros((len(self.chunks), len(self.vocabulary)), dtype=np.float32)
+        for row, chunk_counts in enumerate(self.term_counts):
+            for term, count in chunk_counts.items():
+                counts[row, self.vocabulary[term]] = count
+        idf = np.array([self.idf[term] for term in sorted(self.idf)], dtype=np.float32)
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * np.array(lengths, dtype=np.float32) / (self.average_length or 1))
+        return idf * counts * (BM25_K1 + 1) / (counts + norm[:, None])
+
+    def scores(self, query):
+        """BM25 score of every chunk for a query text (repeated query terms count log-scaled)"""
+        query_counts = Counter(term for term in tokenize(query) if term in self.vocabulary)
+        query_weights = {term: 1 + math.log(count) for term, count in query_counts.items()}
+        if isinstance(self._weights, list):
+            return [sum(chunk_weights.get(term, 0.0) * weight for term, weight in query_weights.items())
+                    for chunk_weights in self._weights]
+
+        import numpy as np
+        if not query_weights:
+            return [0.0] * len(self.chunks)
+        columns = [self.vocabulary[term] for term in query_weights]
+        vector = np.array(list(query_weights.values()), dtype=np.float32)
+        return (self._weights[:, columns] @ vector).tolist()
+
+    def select(self, query, limit, pinned=(), model=None):
+        """Return the best-scoring chunks fitting in limit tokens, in their original order
+
+        Chunks in pinned (by position) are kept first; ties keep the earlier chunk.
+        """
+        scores = self.scores(query)
+        order = sorted(range(len(self.chunks)), key=lambda i: (i not in pinned, -scores[i], i))
+        selected = []
+        used = 0
+        separator = count_tokens("\n\n", model)
+        for i in order:
+            cost = self.tokens[i] + (separator if selected else 0)
+            if used + cost <= limit:
+                selected.append(i)
+                used += cost
+        selected.sort()
+        return selected
+
+
+_indexes = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_index(text, model=None):
+    """Return the chunk index for text, building it on first use"""
+    key = (hashlib.sha256((text or "").encode("utf-8")).hexdigest(), model)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is not None:
+            _indexes.move_to_end(key)
+            return index
+    index = ChunkIndex(split_chunks(text, model), model)
+    with _indexes_lock:
+        _indexes[key] = index
+        while len(_indexes) > INDEX_CACHE_SIZE:
+            _indexes.popitem(last=False)
+    return index
+
+
+def relevant_text(text, query, limit, model=None, keep_first=False, label="text"):
+    """Cut text to limit tokens by keeping the chunks most relevant to query
+
+    With keep_first, the first chunk (usually the name and contact details) is
+    always kept. Falls back to plain truncation if the text has no usable chunks.
+    """
+    if limit <= 0 or not text:
+        return ""
+    if count_tokens(text, model) <= limit:
+        return text
+    index = get_index(text, model)
+    if not index.chunks:
+        return truncate_to_tokens(text, limit, model)
+    selected = index.select(query, limit, pinned={0} if keep_first else (), model=model)
+    if not selected:
+        return truncate_to_tokens(text, limit, model)
+    logger.info(f"Kept {len(selected)} of {len(index.chunks)} {label} chunks most relevant to the job description")
+    return "\n\n".join(index.chunks[i] for i in selected)
+
+
+def relevance_trimmer(query, model=None, keep_first=False, label="text"):
+    """Return a Section trim function that keeps the chunks most relevant to query"""
+    def trim(text, limit):
+        return relevant_text(text, query, limit, model=model, keep_first=keep_first, label=label)
+    return trim
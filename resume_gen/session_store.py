@@ -0,0 +1,106 @@
+"""
+Server-side store for per-session generator state.
+
+State is kept in an in-memory LRU in front of one JSON file per session on disk,
+so several worker processes can serve the same browser session. A memory entry
+is only trusted while its file hasn't been rewritten by another process.
+"""
+
+import os
+import re
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+_SESSION_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+
+class SessionStore:
+    """In-memory LRU backed by an on-disk JSON file per session"""
+
+    def __init__(self, folder, max_entries=256, max_age_seconds=30 * 24 * 3600):
+        self.folder = folder
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self._memory = OrderedDict()  # session_id -> (mtime_ns, state)
+        self._lock = threading.Lock()
+
+        os.makedirs(self.folder, exist_ok=True)
+        self.purge_expired()
+
+    def _path(self, session_id):
+        if not _SESSION_ID_PATTERN.match(session_id):
+            raise ValueError(f"Invalid session ID: {session_id!r}")
+        return os.path.join(self.folder, f"{session_id}.json")
+
+    def _remember(self, session_id, mtime_ns, state):
+        self._memory[session_id] = (mtime_ns, state)
+        self._memory.move_to_end(session_id)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, session_id):
+        """Return a copy of the stored state for a session, or an empty dict"""
+        file_path = self._path(session_id)
+        with self._lock:
+            try:
+                mtime_ns = os.stat(file_path).st_mtime_ns
+            except OSError:
+                self._memory.pop(session_id, None)
+                return {}
+
+            cached = self._memory.get(session_id)
+            if cached and cached[0] == mtime_ns:
+                self._memory.move_to_end(session_id)
+                return json.loads(json.dumps(cached[1]))
+
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not load session state {session_id}: {e}")
+                return {}
+
+            self._remember(session_id, mtime_ns, state)
+            return json.loads(json.dumps(state))
+
+    def save(self, session_id, state):
+        """Persist the state for a session"""
+        file_path = self._path(session_id)
+        tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with self._lock:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, file_path)
+            self._remember(session_id, os.stat(file_path).st_mtime_ns, json.loads(json.dumps(state)))
+
+    def delete(self, session_id):
+        """Forget a session"""
+        file_path = self._path(session_id)
+        with self._lock:
+            self._memory.pop(session_id, None)
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+
+    def purge_expired(self):
+        """Remove session files that haven't been written for max_age_seconds"""
+        if not self.max_age_seconds:
+            return
+        cutoff = time.time() - self.max_age_seconds
+        removed = 0
+        for filename in os.listdir(self.folder):
+            file_path = os.path.join(self.folder, filename)
+            try:
+                if os.path.getmtime(file_path) < cutoff:
+                    os.remove(file_path)
+                    removed += 1
+            except OSError:
+                continue
+        if removed:
+            logger.info(f"Removed {removed} expired session(s)")
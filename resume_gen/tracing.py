@@ -0,0 +1,247 @@
+"""
+Per-stage timing of generation runs, and process-wide metrics in Prometheus format.
+
+Each generator records a Trace: a list of spans (stage name, start offset,
+duration, attributes such as token counts and cache hits, error) that is
+attached to its job result. Every finished span is also added to the shared
+metrics registry, which the web app serves at /metrics. Metrics are per process.
+"""
+
+import time
+import uuid
+import logging
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Histogram buckets for stage durations, in seconds
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+
+class Span:
+    """One timed stage of a trace"""
+
+    def __init__(self, span_id, name, parent_id, start, attributes):
+        self.id = span_id
+        self.name = name
+        self.parent_id = parent_id
+        self.start = start
+        self.duration = None
+        self.attributes = dict(attributes)
+        self.error = None
+
+    def set(self, **attributes):
+        """Add attributes (token counts, cache hits, ...) to the span"""
+        self.attributes.update(attributes)
+
+    def to_dict(self, trace_start):
+        data = {
+            "id": self.id,
+            "parent": self.parent_id,
+            "name": self.name,
+            "start_ms": round((self.start - trace_start) * 1000, 1),
+            "duration_ms": round((self.duration or 0) * 1000, 1)
+        }
+        if self.attributes:
+            data["attributes"] = self.attributes
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+class Trace:
+    """Spans recorded for one generator, safe to add to from worker threads
+
+    A span's parent is the innermost open span on the same thread; use wrap()
+    to carry the current span over to a function run on another thread.
+    """
+
+    def __init__(self, trace_id=None):
+        self.trace_id = trace_id or uuid.uuid4().hex[:16]
+        self.start = time.perf_counter()
+        self.spans = []
+        self._next_id = 1
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name, **attributes):
+        """Time a block of code as a span, recording it in metrics when it ends"""
+        stack = self._stack()
+        with self._lock:
+            span_id = self._next_id
+            self._next_id += 1
+        parent_id = stack[-1].id if stack else None
+        span = Span(span_id, name, parent_id, time.perf_counter(), attributes)
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = str(e) or type(e).__name__
+            raise
+        finally:
+            span.duration = time.perf_counter() - span.start
+            stack.pop()
+            with self._lock:
+                self.spans.append(span)
+            metrics.record_span(span)
+
+    def wrap(self, fn):
+        """Return fn bound to the calling thread's current span, for running on a worker thread"""
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+
+        def run(*args, **kwargs):
+            worker_stack = self._stack()
+            if parent is not None:
+                worker_stack.append(parent)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                if parent is not None:
+                    worker_stack.pop()
+        return run
+
+    def stages(self):
+        """Total seconds and count per stage name"""
+        totals = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            stage = totals.setdefault(span.name, {"count": 0, "seconds": 0.0})
+            stage["count"] += 1
+            stage["seconds"] += span.duration or 0
+        for stage in totals.values():
+            stage["seconds"] = round(stage["seconds"], 3)
+        return totals
+
+    def to_dict(self):
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start)
+        return {
+            "trace_id": self.trace_id,
+            "spans": [span.to_dict(self.start) for span in spans],
+            "stages": self.stages()
+        }
+
+    def summary(self):
+        """One-line summary of stage timings for the log"""
+        return ", ".join(f"{name} {stage['seconds']:.2f}s" + (f" x{stage['count']}" if stage["count"] > 1 else "")
+                         for name, stage in self.stages().items())
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels) + "}"
+
+
+def _format_value(value):
+    """Whole numbers as integers (not 1.23457e+06), other values at full float precision"""
+    if isinstance(value, bool):
+        value = int(value)
+    if isinstance(value, int) or (isinstance(value, float) and value.is_integer()):
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metrics:
+    """Counters and stage-duration histograms rendered in the Prometheus text format"""
+
+    def __init__(self, prefix="resume_gen"):
+        self.prefix = prefix
+        self._counters = {}    # name -> {labels: value}
+        self._histograms = {}  # labels -> [bucket counts, sum, count]
+        self._help = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name, value=1, help_text="", **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+            if help_text:
+                self._help.setdefault(name, help_text)
+
+    def observe(self, stage, seconds, error=False):
+        """Record one stage duration"""
+        key = (("stage", stage),)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [[0] * len(DURATION_BUCKETS), 0.0, 0]
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if seconds <= bound:
+                    histogram[0][i] += 1
+            histogram[1] += seconds
+            histogram[2] += 1
+        if error:
+            self.inc("stage_errors_total", help_text="Stages that raised an exception", stage=stage)
+
+    def record_span(self, span):
+        """Add a finished span's duration, LLM usage and cache outcome to the metrics"""
+        self.observe(span.name, span.duration or 0, error=span.error is not None)
+        attributes = span.attributes
+        if "cache_hit" in attributes:
+            if attributes.get("cache_hit"):
+                outcome = "cache_hit"
+            elif attributes.get("coalesced"):
+                outcome = "coalesced"
+            else:
+                outcome = "api"
+            self.inc("llm_requests_total", help_text="LLM requests by how they were served", outcome=outcome)
+        for token_type in ("prompt_tokens", "completion_tokens", "cached_tokens"):
+            if attributes.get(token_type):
+                self.inc("llm_tokens_total", attributes[token_type], help_text="Tokens reported by the API (cached: prompt tokens served from the provider's prompt cache)",
+                         type=token_type.split("_")[0])
+
+    def render(self, extra=None):
+        """Return all metrics in the Prometheus text exposition format
+
+        extra is an optional list of (name, help, type, value, labels dict)
+        samples computed at scrape time, such as queue depth; samples of one
+        metric must be adjacent.
+        """
+        lines = []
+        with self._lock:
+            name = f"{self.prefix}_stage_duration_seconds"
+            if self._histograms:
+                lines.append(f"# HELP {name} Duration of generation stages")
+                lines.append(f"# TYPE {name} histogram")
+            for key, (buckets, total, count) in sorted(self._histograms.items()):
+                for bound, bucket_count in zip(DURATION_BUCKETS, buckets):
+                    lines.append(f"{name}_bucket{_format_labels(key + (('le', f'{bound:g}'),))} {bucket_count}")
+                lines.append(f"{name}_bucket{_format_labels(key + (('le', '+Inf'),))} {count}")
+                lines.append(f"{name}_sum{_format_labels(key)} {total:.6f}")
+                lines.append(f"{name}_count{_format_labels(key)} {count}")
+
+            for counter, series in sorted(self._counters.items()):
+                name = f"{self.prefix}_{counter}"
+                lines.append(f"# HELP {name} {self._help.get(counter, counter)}")
+                lines.append(f"# TYPE {name} counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+
+        described = set()
+        for sample_name, help_text, sample_type, value, labels in extra or []:
+            name = f"{self.prefix}_{sample_name}"
+            if name not in described:
+                described.add(name)
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {sample_type}")
+            lines.append(f"{name}{_format_labels(sorted((labels or {}).items()))} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
@@ -0,0 +1,811 @@
+"""
+Flask web interface: profiles, uploads, background generation and logs.
+
+Run it with python app.py from the project folder.
+"""
+
+import os
+import json
+import uuid
+import logging
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, send_file, session, g, Response, stream_with_context
+from werkzeug.utils import secure_filename
+
+from .job_queue import JobQueue, STATUS_QUEUED, STATUS_RUNNING, STATUS_DONE, STATUS_FAILED
+from .session_store import SessionStore
+from .log_buffer import RingBufferHandler
+from .log_index import LogIndex, CATEGORIES as AI_LOG_CATEGORIES
+from .tracing import metrics
+from .llm_client import client_stats
+from .ingestion import extract_texts
+from .batch import parse_job_lines, run_batch
+from .config import (
+    LOG_LEVEL, AI_LOG_LEVEL, AI_LOG_FULL_TEXT, AI_LOG_FILE, APP_LOG_LEVEL, configure_logging,
+    UPLOAD_FOLDER, OUTPUT_FOLDER, TEMP_FOLDER, USER_PROFILES_FOLDER, LLM_CACHE_ENABLED,
+    INGEST_MAX_WORKERS, INGEST_TIMEOUT, BATCH_MAX_WORKERS, BATCH_MANIFEST_FOLDER
+)
+from .profiles import UserProfile
+from .job_description import safe_company_name
+from .generator import (
+    ResumeAndCoverLetterGenerator, llm_cache, pdf_text_cache, application_history, get_application_manifest,
+    rate_limiter
+)
+
+# Size of the in-memory log shown in the web UI
+LOG_BUFFER_CAPACITY = int(os.environ.get("LOG_BUFFER_CAPACITY", "1000"))
+LOG_BUFFER_MAX_MESSAGE = int(os.environ.get("LOG_BUFFER_MAX_MESSAGE", "2000"))
+
+# Configure logging (app.log, console and the AI interactions log file)
+ai_logger = configure_logging("app.log")
+logger = logging.getLogger(__name__)
+
+# Create a bounded ring buffer for capturing logs to display in the web UI
+log_handler = RingBufferHandler(capacity=LOG_BUFFER_CAPACITY, max_message_length=LOG_BUFFER_MAX_MESSAGE)
+log_handler.setLevel(APP_LOG_LEVEL)
+log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+# Attached to the package logger, so web.py and the generation core share it
+# (records from resume_gen.web propagate there; adding it to both logs them twice)
+logging.getLogger("resume_gen").addHandler(log_handler)
+# Show AI interactions in the web UI too
+ai_logger.addHandler(log_handler)
+# Byte-offset index used to page through the AI log without reading it whole
+ai_log_index = LogIndex(AI_LOG_FILE)
+
+logger.info(f"Application logging level: {LOG_LEVEL}")
+logger.info(f"AI interactions logging level: {AI_LOG_LEVEL}")
+logger.info(f"Full text logging enabled: {AI_LOG_FULL_TEXT}")
+logger.info(f"LLM response cache enabled: {LLM_CACHE_ENABLED}")
+
+# Templates and static files live in the project folder, next to app.py
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Initialize Flask app
+app = Flask(__name__,
+            template_folder=os.path.join(PROJECT_ROOT, 'templates'),
+            static_folder=os.path.join(PROJECT_ROOT, 'static'))
+app.secret_key = os.environ.get("SECRET_KEY", "dev-secret-key")
+app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max upload size
+app.config['ALLOWED_EXTENSIONS'] = {'pdf', 'txt', 'docx'}
+
+# Add context processor for templates
+@app.context_processor
+def utility_processor():
+    return {
+        'now': datetime.now
+    }
+
+# Create the folders the web app reads from and writes to
+for folder in (UPLOAD_FOLDER, OUTPUT_FOLDER, TEMP_FOLDER, USER_PROFILES_FOLDER):
+    os.makedirs(folder, exist_ok=True)
+
+# Manifest of generated application folders, appended to as documents are written
+application_manifest = get_application_manifest(OUTPUT_FOLDER)
+APPLICATIONS_PER_PAGE = int(os.environ.get("APPLICATIONS_PER_PAGE", "10"))
+
+if not os.environ.get("OPENAI_API_KEY"):
+    logger.warning("OpenAI API key not found in environment variables.")
+    logger.warning("Please set your OPENAI_API_KEY environment variable or create a .env file.")
+
+# Server-side store for each browser session's generator state
+SESSION_FOLDER = os.environ.get("SESSION_FOLDER", os.path.join('cache', 'sessions'))
+SESSION_CACHE_SIZE = int(os.environ.get("SESSION_CACHE_SIZE", "256"))
+
+session_store = SessionStore(SESSION_FOLDER, max_entries=SESSION_CACHE_SIZE)
+
+def get_generator():
+    """Return the generator for the current browser session
+    
+    Each request gets its own generator built from the session's stored state,
+    which is written back after the request if it changed.
+    """
+    if 'generator' not in g:
+        if 'sid' not in session:
+            session['sid'] = uuid.uuid4().hex
+        state = session_store.get(session['sid'])
+        g.generator = ResumeAndCoverLetterGenerator.from_state(state)
+        g.generator_state = g.generator.to_state()
+    return g.generator
+
+@app.after_request
+def save_generator_state(response):
+    """Persist the session's generator state if the request changed it"""
+    if 'generator' in g:
+        state = g.generator.to_state()
+        if state != g.generator_state:
+            session_store.save(session['sid'], state)
+    return response
+
+def run_generation_job(payload):
+    """Run the document generation pipeline for a queued job"""
+    job_generator = ResumeAndCoverLetterGenerator()
+    job_generator.job_description = payload["job_description"]
+    job_generator.resume_texts = payload["resume_texts"]
+    if payload.get("company_name"):
+        job_generator.job.company_name = safe_company_name(payload["company_name"])
+    if payload.get("profile_folder"):
+        job_generator.current_user_profile = UserProfile.load(payload["profile_folder"])
+    
+    # Extract company name (once per job description; process_job_application reuses it)
+    job_generator.company_name = job_generator.extract_company_name()
+    
+    # Extract style attributes from the first resume PDF if available
+    job_generator.style_attributes = job_generator.extract_style_attributes()
+    
+    # Process the job application
+    result = job_generator.process_job_application()
+    if 'error' in result:
+        raise RuntimeError(result['error'])
+    return result
+
+# Background queue for document generation
+JOBS_DB = os.environ.get("JOBS_DB", os.path.join('cache', 'jobs.sqlite3'))
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "2"))
+
+job_queue = JobQueue(JOBS_DB, num_workers=JOB_WORKERS)
+job_queue.register("generate_documents", run_generation_job)
+
+def run_batch_job(payload):
+    """Run a queued batch of job descriptions against one profile"""
+    profile = UserProfile.load(payload["profile_folder"])
+    if not profile:
+        raise RuntimeError(f"Profile not found: {payload['profile_folder']}")
+    return run_batch(payload["jobs"], profile, ResumeAndCoverLetterGenerator, BATCH_MANIFEST_FOLDER,
+                     max_workers=BATCH_MAX_WORKERS, resume_texts=payload.get("resume_texts"))
+
+job_queue.register("generate_batch", run_batch_job)
+
+# Start the workers now rather than on the first submit, so jobs left queued before
+# a restart (and stale running jobs) are picked up straight away
+job_queue.start()
+
+_ingest_executor = None
+
+def get_ingest_executor():
+    """Return the shared process pool used to parse uploaded PDFs (None if disabled)"""
+    global _ingest_executor
+    if INGEST_MAX_WORKERS <= 1:
+        return None
+    if _ingest_executor is None:
+        _ingest_executor = ProcessPoolExecutor(max_workers=INGEST_MAX_WORKERS)
+    return _ingest_executor
+
+def allowed_file(filename):
+    """Check if the file extension is allowed"""
+    return '.' in filename and \
+           filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
+
+def load_job_description(generator):
+    """Update the generator's job description from an uploaded file or form text
+    
+    Returns True if a new job description was provided with the request.
+    """
+    # First, handle the job description upload
+    job_description_updated = False
+    
+    # Check if a file was uploaded
+    if 'job_file' in request.files and request.files['job_file'].filename != '':
+        file = request.files['job_file']
+        if allowed_file(file.filename):
+            filename = secure_filename(file.filename)
+            file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+            file.save(file_path)
+            
+            # Extract text from the file
+            if filename.endswith('.pdf'):
+                text = generator.extract_text_from_pdf(file_path)
+            else:
+                # For other file types, just read the content
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+            
+            generator.job_description = text
+            job_description_updated = True
+            logger.info(f'Job description loaded from file: {filename}')
+    # Check if text was provided
+    elif request.form.get('job_description', '').strip():
+        generator.job_description = request.form.get('job_description').strip()
+        job_description_updated = True
+        logger.info('Job description updated from text input')
+    
+    return job_description_updated
+
+@app.route('/')
+def index():
+    """Render the main page"""
+    generator = get_generator()
+    # Get user profiles
+    user_profiles = UserProfile.get_all_profiles()
+    
+    # Check if a user profile is selected
+    current_profile = None
+    if generator.current_user_profile:
+        current_profile = generator.current_user_profile
+    
+    # If there are profiles but none selected, show profile selection page
+    if user_profiles and not current_profile:
+        return render_template('select_profile.html', 
+                              profiles=user_profiles)
+    
+    # If no profiles exist, show create profile page
+    if not user_profiles and not current_profile:
+        return render_template('create_profile.html')
+    
+    # Get the number of resumes currently loaded
+    num_resumes = len(generator.resume_texts)
+    
+    # Get the logs to display
+    logs = log_handler.getvalue()
+    
+    # Get list of uploaded files
+    uploaded_files = []
+    if os.path.exists(app.config['UPLOAD_FOLDER']):
+        uploaded_files = [f for f in os.listdir(app.config['UPLOAD_FOLDER']) 
+                         if os.path.isfile(os.path.join(app.config['UPLOAD_FOLDER'], f))]
+    
+    # Get one page of generated folders (newest first) from the manifest
+    page = max(request.args.get('page', 1, type=int), 1)
+    entries, total_applications = application_manifest.page(page, APPLICATIONS_PER_PAGE)
+    total_pages = max((total_applications + APPLICATIONS_PER_PAGE - 1) // APPLICATIONS_PER_PAGE, 1)
+    if page > total_pages:
+        page = total_pages
+        entries, total_applications = application_manifest.page(page, APPLICATIONS_PER_PAGE)
+    
+    generated_folders = [entry['folder'] for entry in entries]
+    generated_files = {}
+    for entry in entries:
+        generated_files[entry['folder']] = {
+            'path': os.path.join(OUTPUT_FOLDER, entry['folder']),
+            'files': entry.get('files', []),
+            'company': entry.get('company'),
+            'time': entry.get('time', '')
+        }
+    
+    return render_template('index.html', 
+                          num_resumes=num_resumes,
+                          job_description=generator.job_description,
+                          logs=logs,
+                          last_log_seq=log_handler.last_seq,
+                          uploaded_files=uploaded_files,
+                          generated_folders=generated_folders,
+                          generated_files=generated_files,
+                          applications_page=page,
+                          applications_pages=total_pages,
+                          total_applications=total_applications,
+                          current_profile=current_profile,
+                          current_job=session.get('current_job'))
+
+@app.route('/create_profile', methods=['GET', 'POST'])
+def create_profile():
+    """Create a new user profile"""
+    generator = get_generator()
+    if request.method == 'POST':
+        # Get first name and last name from form
+        first_name = request.form.get('first_name', '').strip()
+        last_name = request.form.get('last_name', '').strip()
+        
+        if not first_name or not last_name:
+            flash('First name and last name are required', 'error')
+            return redirect(request.url)
+        
+        # Check if resume file was uploaded
+        if 'resume_file' not in request.files:
+            flash('Resume file is required', 'error')
+            return redirect(request.url)
+        
+        resume_file = request.files['resume_file']
+        if resume_file.filename == '':
+            flash('No resume file selected', 'error')
+            return redirect(request.url)
+        
+        if not allowed_file(resume_file.filename):
+            flash('Invalid file type for resume', 'error')
+            return redirect(request.url)
+        
+        # Save and extract resume text
+        resume_filename = secure_filename(resume_file.filename)
+        resume_path = os.path.join(app.config['UPLOAD_FOLDER'], resume_filename)
+        resume_file.save(resume_path)
+        
+        if resume_filename.endswith('.pdf'):
+            resume_text = generator.extract_text_from_pdf(resume_path)
+        else:
+            with open(resume_path, 'r', encoding='utf-8') as f:
+                resume_text = f.read()
+        
+        # Get portfolio and LinkedIn text if provided
+        portfolio_text = request.form.get('portfolio_text', '')
+        linkedin_text = request.form.get('linkedin_text', '')
+        
+        # Create profile with manually entered name
+        profile = generator.extract_user_info(
+            resume_text, 
+            first_name=first_name,
+            last_name=last_name,
+            portfolio_text=portfolio_text, 
+            linkedin_text=linkedin_text
+        )
+        
+        profile.resume_file = resume_filename
+        
+        # Save the profile
+        try:
+            profile.save()
+            generator.set_user_profile(profile)
+            flash(f'Profile created for {profile.full_name}', 'success')
+            return redirect(url_for('index'))
+        except Exception as e:
+            flash(f'Error creating profile: {str(e)}', 'error')
+            return redirect(request.url)
+    
+    return render_template('create_profile.html')
+
+@app.route('/select_profile/<folder_name>')
+def select_profile(folder_name):
+    """Select a user profile"""
+    profile = UserProfile.load(folder_name)
+    if profile:
+        get_generator().set_user_profile(profile)
+        flash(f'Selected profile: {profile.full_name}', 'success')
+    else:
+        flash('Profile not found', 'error')
+    
+    return redirect(url_for('index'))
+
+@app.route('/manage_profiles')
+def manage_profiles():
+    """Manage user profiles"""
+    profiles = UserProfile.get_all_profiles()
+    return render_template('manage_profiles.html', profiles=profiles)
+
+@app.route('/delete_profile/<folder_name>')
+def delete_profile(folder_name):
+    """Delete a user profile"""
+    generator = get_generator()
+    folder_path = os.path.join(USER_PROFILES_FOLDER, folder_name)
+    if os.path.exists(folder_path):
+        try:
+            UserProfile.delete(folder_name)
+            
+            # If this was the current profile, clear it
+            if generator.current_user_profile and generator.current_user_profile.folder_name == folder_name:
+                generator.current_user_profile = None
+                generator.resume_texts = []
+            
+            flash('Profile deleted successfully', 'success')
+        except Exception as e:
+            flash(f'Error deleting profile: {str(e)}', 'error')
+    else:
+        flash('Profile not found', 'error')
+    
+    return redirect(url_for('manage_profiles'))
+
+@app.route('/clear_profile')
+def clear_profile():
+    """Clear the current user profile"""
+    generator = get_generator()
+    generator.current_user_profile = None
+    generator.resume_texts = []
+    flash('Current profile cleared', 'success')
+    return redirect(url_for('index'))
+
+@app.route('/upload_resume', methods=['POST'])
+def upload_resume():
+    """Handle resume file uploads"""
+    generator = get_generator()
+    if 'resume_files' not in request.files:
+        flash('No file part', 'error')
+        return redirect(request.url)
+    
+    files = request.files.getlist('resume_files')
+    
+    if not files or files[0].filename == '':
+        flash('No selected file', 'error')
+        return redirect(request.url)
+    
+    # Clear existing resumes if requested
+    if request.form.get('clear_existing') == 'yes':
+        generator.clear_resumes()
+    
+    # Save every file first, then parse the batch in parallel
+    file_paths = []
+    for file in files:
+        if file and allowed_file(file.filename):
+            filename = secure_filename(file.filename)
+            file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+            file.save(file_path)
+            file_paths.append(file_path)
+    
+    extracted = extract_texts(file_paths, cache=pdf_text_cache, executor=get_ingest_executor(), timeout=INGEST_TIMEOUT)
+    
+    uploaded_files = []
+    failed_files = []
+    
+    # Add the resume texts in upload order
+    for item in extracted:
+        logger.info(f"Extracted text from {item['filename']} in {item['seconds']:.2f}s"
+                    f"{' (cached)' if item['cached'] else ''}")
+        if not item['cached']:
+            metrics.observe("parse_pdf", item['seconds'], error=bool(item['error']))
+        if item['error']:
+            failed_files.append(item['filename'])
+            logger.error(f"Error extracting text from {item['filename']}: {item['error']}")
+        elif generator.add_resume(item['text']):
+            uploaded_files.append(item['filename'])
+    
+    if request.accept_mimetypes.best == 'application/json':
+        return jsonify({
+            "uploaded": uploaded_files,
+            "files": [{key: value for key, value in item.items() if key != 'text'} for item in extracted]
+        })
+    
+    if uploaded_files:
+        flash(f'Uploaded {len(uploaded_files)} resume(s): {", ".join(uploaded_files)}', 'success')
+    if failed_files:
+        flash(f'Could not read {len(failed_files)} file(s): {", ".join(failed_files)}', 'error')
+    if not uploaded_files and not failed_files:
+        flash('No valid files were uploaded', 'error')
+    
+    return redirect(url_for('index'))
+
+@app.route('/generate_documents', methods=['POST'])
+def generate_documents():
+    """Generate resume and cover letter documents"""
+    generator = get_generator()
+    # Clear previous result from session
+    if 'last_result' in session:
+        session.pop('last_result')
+    
+    load_job_description(generator)
+    
+    # Check if we have what we need to generate documents
+    if not generator.resume_texts and not generator.current_user_profile:
+        flash('No resume loaded. Please select a profile or upload a resume.', 'error')
+        return redirect(url_for('index'))
+    
+    if not generator.job_description:
+        flash('No job description provided. Please upload or enter a job description.', 'error')
+        return redirect(url_for('index'))
+    
+    # Hand the work to a background worker so the request returns immediately
+    job_id = job_queue.submit("generate_documents", {
+        "job_description": generator.job_description,
+        "resume_texts": list(generator.resume_texts),
+        "company_name": generator.job.company_name,
+        "profile_folder": generator.current_user_profile.folder_name if generator.current_user_profile else None
+    })
+    session['current_job'] = job_id
+    
+    if request.accept_mimetypes.best == 'application/json':
+        return jsonify({
+            "job_id": job_id,
+            "status_url": url_for('job_status', job_id=job_id)
+        }), 202
+    
+    flash('Document generation started. This page will update when it finishes.', 'info')
+    return redirect(url_for('index'))
+
+@app.route('/generate_batch', methods=['POST'])
+def generate_batch():
+    """Queue documents for many job descriptions against the current profile
+    
+    Accepts a JSON body {"jobs": [{"id", "job_description", "company"}, ...]} or
+    uploaded job_files (.txt, .md or .jsonl). Returns the background job to poll.
+    """
+    generator = get_generator()
+    profile = generator.current_user_profile
+    if not profile:
+        return jsonify({"error": "Select a profile before running a batch."}), 400
+    
+    jobs = []
+    if request.is_json:
+        data = request.get_json(silent=True) or {}
+        jobs = parse_job_lines((json.dumps(job) for job in data.get("jobs", [])), "request")
+    for job_file in request.files.getlist('job_files'):
+        filename = secure_filename(job_file.filename or "")
+        content = job_file.read().decode('utf-8', errors='replace')
+        if filename.lower().endswith('.jsonl'):
+            jobs.extend(parse_job_lines(content.splitlines(), filename))
+        elif filename.lower().endswith(('.txt', '.md')) and content.strip():
+            jobs.append({"id": os.path.splitext(filename)[0], "text": content.strip(), "company": None})
+    
+    if not jobs:
+        return jsonify({"error": "No job descriptions provided."}), 400
+    
+    job_id = job_queue.submit("generate_batch", {
+        "jobs": jobs,
+        "profile_folder": profile.folder_name,
+        "resume_texts": list(generator.resume_texts)
+    })
+    logger.info(f"Queued batch of {len(jobs)} job description(s)")
+    return jsonify({
+        "job_id": job_id,
+        "count": len(jobs),
+        "status_url": url_for('job_status', job_id=job_id)
+    }), 202
+
+@app.route('/stream_documents', methods=['GET', 'POST'])
+def stream_documents():
+    """Stream a generated resume and cover letter to the browser as server-sent events"""
+    generator = get_generator()
+    if request.method == 'POST':
+        load_job_description(generator)
+    
+    if not generator.resume_texts:
+        return jsonify({"error": "No resume loaded. Please select a profile or upload a resume."}), 400
+    
+    if not generator.job_description:
+        return jsonify({"error": "No job description provided. Please upload or enter a job description."}), 400
+    
+    resume_index = request.args.get('variant', 1, type=int) - 1
+    
+    def events():
+        try:
+            for event, data in generator.stream_application(resume_index):
+                if event == "saved":
+                    data["url"] = url_for('download_file', folder=data["folder"], filename=data["filename"], view='true')
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+        except Exception as e:
+            logger.error(f"Error streaming documents: {e}")
+            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+    
+    return Response(
+        stream_with_context(events()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/jobs/<job_id>')
+def job_status(job_id):
+    """Get the status and result of a background job"""
+    job = job_queue.get(job_id)
+    if not job:
+        if session.get('current_job') == job_id:
+            session.pop('current_job')
+        return jsonify({"error": "Job not found"}), 404
+    
+    # Surface the outcome of this browser's own job on the next page load
+    if session.get('current_job') == job_id and job['status'] in (STATUS_DONE, STATUS_FAILED):
+        session.pop('current_job')
+        if job['status'] == STATUS_DONE:
+            result = job['result']
+            flash(f'Documents generated successfully for {result["company"]}!', 'success')
+            flash('You can view the HTML versions and print them as PDF directly from your browser.', 'info')
+            session['last_result'] = {
+                'folder_path': result['folder'],
+                'company_name': result['company'],
+                'results': result['results']
+            }
+        else:
+            flash(f'Error generating documents: {job["error"]}', 'error')
+    
+    job.pop('payload', None)
+    return jsonify(job)
+
+@app.route('/view_html/<path:filename>')
+def view_html(filename):
+    """View an HTML file"""
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            content = f.read()
+        return content
+    except Exception as e:
+        logger.error(f"Error viewing HTML file: {str(e)}")
+        flash(f'Error viewing HTML file: {str(e)}', 'error')
+        return redirect(url_for('index'))
+
+@app.route('/clear_resumes', methods=['POST'])
+def clear_resumes():
+    """Clear all loaded resumes"""
+    generator = get_generator()
+    generator.clear_resumes()
+    flash('All resumes cleared', 'success')
+    return redirect(url_for('index'))
+
+@app.route('/clear_job_description', methods=['POST'])
+def clear_job_description():
+    """Clear the job description"""
+    generator = get_generator()
+    generator.job_description = ""
+    flash('Job description cleared', 'success')
+    return redirect(url_for('index'))
+
+@app.route('/get_logs')
+def get_logs():
+    """Get the current logs
+    
+    With ?since=<seq>, returns only the entries logged after that sequence number
+    as JSON, along with the cursor to pass on the next poll.
+    """
+    since = request.args.get('since', type=int)
+    if since is None:
+        return log_handler.getvalue()
+    
+    # A cursor from before a restart is ahead of the buffer; start over
+    reset = since > log_handler.last_seq
+    if reset:
+        since = 0
+    
+    entries = log_handler.since(since)
+    return jsonify({
+        "entries": entries,
+        "last_seq": entries[-1]["seq"] if entries else max(since, 0),
+        "reset": reset
+    })
+
+@app.route('/cache_stats')
+def cache_stats():
+    """Get LLM response cache hit/miss counters"""
+    return jsonify(llm_cache.stats())
+
+@app.route('/metrics')
+def prometheus_metrics():
+    """Stage timings, LLM usage, cache, queue and API client metrics in Prometheus text format"""
+    cache = llm_cache.stats()
+    jobs = job_queue.counts()
+    clients = client_stats()
+    limiter = rate_limiter.stats()
+    extra = [
+        ("llm_cache_hits_total", "LLM response cache hits", "counter", cache["hits"], None),
+        ("llm_cache_misses_total", "LLM response cache misses", "counter", cache["misses"], None),
+        ("llm_cache_bytes", "Size of the LLM response cache", "gauge", cache["bytes"], None),
+        ("llm_retries_total", "Retried OpenAI API requests", "counter", sum(c["retries"] for c in clients), None),
+        ("llm_circuit_open", "1 while the OpenAI API circuit breaker is not closed", "gauge",
+         int(any(c["state"] != "closed" for c in clients)), None),
+        ("rate_limit_waits_total", "Requests that waited for rate limit capacity", "counter", limiter["waits"], None),
+        ("rate_limit_wait_seconds_total", "Time spent waiting for rate limit capacity", "counter",
+         limiter["waited_seconds"], None)
+    ]
+    for status in (STATUS_QUEUED, STATUS_RUNNING, STATUS_DONE, STATUS_FAILED):
+        extra.append(("jobs", "Background jobs by status", "gauge", jobs.get(status, 0), {"status": status}))
+    return Response(metrics.render(extra), mimetype='text/plain; version=0.0.4')
+
+@app.route('/edit_profile/<folder_name>', methods=['GET', 'POST'])
+def edit_profile(folder_name):
+    """Edit an existing user profile"""
+    generator = get_generator()
+    profile = UserProfile.load(folder_name)
+    
+    if not profile:
+        flash('Profile not found', 'error')
+        return redirect(url_for('manage_profiles'))
+    
+    if request.method == 'POST':
+        # Update profile information
+        profile.first_name = request.form.get('first_name', '').strip()
+        profile.last_name = request.form.get('last_name', '').strip()
+        
+        # Check if new resume file was uploaded
+        if 'resume_file' in request.files and request.files['resume_file'].filename:
+            resume_file = request.files['resume_file']
+            if allowed_file(resume_file.filename):
+                # Save and extract resume text
+                resume_filename = secure_filename(resume_file.filename)
+                resume_path = os.path.join(app.config['UPLOAD_FOLDER'], resume_filename)
+                resume_file.save(resume_path)
+                
+                if resume_filename.endswith('.pdf'):
+                    resume_text = generator.extract_text_from_pdf(resume_path)
+                else:
+                    with open(resume_path, 'r', encoding='utf-8') as f:
+                        resume_text = f.read()
+                
+                profile.resume_text = resume_text
+                profile.resume_file = resume_filename
+        
+        # Update portfolio and LinkedIn text
+        profile.portfolio_text = request.form.get('portfolio_text', '')
+        profile.linkedin_text = request.form.get('linkedin_text', '')
+        
+        # Re-extract skills only if resume or other text changed; if the API is down the
+        # profile is still saved and skills are extracted on the next generation
+        try:
+            generator.get_profile_skills(profile, save=False)
+        except Exception as e:
+            logger.error(f"Error extracting skills for {profile.full_name}: {e}")
+            flash('Skills could not be extracted right now; they will be extracted when documents are generated.', 'warning')
+        
+        # Save the updated profile
+        try:
+            profile.save()
+            if generator.current_user_profile and generator.current_user_profile.folder_name == folder_name:
+                generator.set_user_profile(profile)
+            flash(f'Profile updated for {profile.full_name}', 'success')
+            return redirect(url_for('manage_profiles'))
+        except Exception as e:
+            flash(f'Error updating profile: {str(e)}', 'error')
+    
+    return render_template('edit_profile.html', profile=profile)
+
+@app.route('/download_file/<folder>/<filename>')
+def download_file(folder, filename):
+    """Download or view a generated file"""
+    file_path = os.path.join(OUTPUT_FOLDER, folder, filename)
+    if os.path.exists(file_path):
+        # Check if we should view the file in browser (for HTML files)
+        view = request.args.get('view', 'false').lower() == 'true'
+        
+        if view and filename.endswith('.html'):
+            # Return HTML content to be displayed in browser
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                return content
+            except Exception as e:
+                logger.error(f"Error viewing HTML file: {str(e)}")
+                flash(f'Error viewing HTML file: {str(e)}', 'error')
+                return redirect(url_for('index'))
+        else:
+            # Download the file as attachment
+            return send_file(file_path, as_attachment=True)
+    else:
+        flash('File not found', 'error')
+        return redirect(url_for('index'))
+
+@app.route('/ai_logs')
+def ai_logs():
+    """View AI interaction logs, one page of records at a time"""
+    try:
+        page = max(1, request.args.get('page', 1, type=int))
+        per_page = min(max(1, request.args.get('per_page', 100, type=int)), 1000)
+        category = request.args.get('category', '')
+        if category not in AI_LOG_CATEGORIES:
+            category = ''
+        oldest_first = request.args.get('order') == 'oldest'
+        
+        records, total = ai_log_index.page(page, per_page, category=category or None, newest_first=not oldest_first)
+        
+        # Format logs for display
+        formatted_logs = [ai_log_index.render(record) for record in records]
+        
+        return render_template('ai_logs.html',
+                              logs=formatted_logs,
+                              page=page,
+                              per_page=per_page,
+                              total=total,
+                              num_pages=max(1, (total + per_page - 1) // per_page),
+                              category=category,
+                              categories=AI_LOG_CATEGORIES,
+                              order='oldest' if oldest_first else 'newest')
+    except Exception as e:
+        error_msg = f"Error loading AI logs: {str(e)}"
+        logger.error(error_msg)
+        flash(error_msg, 'error')
+        return redirect(url_for('index'))
+
+@app.route('/history')
+def history():
+    """Search past applications, or list the most recent ones"""
+    query = request.args.get('q', '').strip()
+    page = max(1, request.args.get('page', 1, type=int))
+    per_page = 25
+    
+    try:
+        if query:
+            applications = application_history.search(query, limit=per_page)
+            total = len(applications)
+        else:
+            applications = application_history.recent(limit=per_page, offset=(page - 1) * per_page)
+            total = application_history.count()
+    except Exception as e:
+        logger.error(f"Error searching application history: {e}")
+        flash(f'Error searching application history: {str(e)}', 'error')
+        applications, total = [], 0
+    
+    for application in applications:
+        application['created'] = datetime.fromtimestamp(application['created_at']).strftime('%Y-%m-%d %H:%M:%S')
+        application['folder_name'] = os.path.basename(application['folder'] or '')
+        application['files'] = [os.path.basename(path) for path in application['output_paths']]
+    
+    if request.accept_mimetypes.best == 'application/json':
+        return jsonify({"query": query, "total": total, "applications": applications})
+    
+    return render_template('history.html',
+                          applications=applications,
+                          query=query,
+                          page=page,
+                          total=total,
+                          num_pages=1 if query else max(1, (total + per_page - 1) // per_page))